@@ -0,0 +1,136 @@
+import argparse
+import getpass
+import os
+import sys
+
+from sqlalchemy.exc import DBAPIError
+
+from . import migrate
+from .core.config import settings
+from .core.security import SCHEME, hash_password
+from .db import SessionLocal, engine
+from .crud import dashboard, reconcile, reports, users
+
+
+def run_migrations(args):
+    migrate.upgrade(revision=args.revision)
+
+
+def per_worker_state() -> list[str]:
+    """Settings whose state lives in one worker process, so several workers disagree."""
+    problems = []
+    if settings.CACHE_BACKEND == "memory":
+        problems.append("CACHE_BACKEND=memory: a write invalidates only its own worker's cache, "
+                        "the others serve stale reads for up to CACHE_TTL")
+    if settings.IDEMPOTENCY_BACKEND == "memory":
+        problems.append("IDEMPOTENCY_BACKEND=memory: a retry that reaches another worker runs again")
+    return problems
+
+
+def serve(args):
+    import uvicorn
+
+    if args.workers > 1:
+        problems = per_worker_state()
+        if problems and not args.allow_per_worker_state:
+            sys.exit(f"refusing to start {args.workers} workers:\n  " + "\n  ".join(problems) +
+                     "\nset these to redis (or none), or pass --allow-per-worker-state")
+        for problem in problems:
+            print(f"WARNING: {problem}")
+        print("WARNING: GET /events is per worker: a stream only sees changes written through its own worker")
+    if args.migrate:
+        # Once, here, instead of in every worker (concurrent upgrades would race on the DDL)
+        try:
+            migrate.upgrade()
+        except DBAPIError as exc:
+            print(f"migrations not applied, database unavailable: {exc.orig}; /health/ready reports it until fixed")
+        engine.dispose()
+    # Workers only compare the revision (lazily, see app.startup); the env var reaches spawned workers
+    settings.MIGRATE_ON_STARTUP = False
+    os.environ["MIGRATE_ON_STARTUP"] = "false"
+    uvicorn.run("app.main:app", host=args.host, port=args.port, workers=args.workers,
+                timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SECONDS, proxy_headers=True,
+                forwarded_allow_ips=args.forwarded_allow_ips, log_level=args.log_level)
+
+
+def rebuild_dashboard(args):
+    with SessionLocal() as db:
+        totals = dashboard.rebuild_totals(db)
+        db.commit()
+        print(f"invoices={totals.invoice_count} total_amount={totals.total_amount} total_paid={totals.total_paid}")
+
+
+def rebuild_aging(args):
+    with SessionLocal() as db:
+        state = reports.rebuild_aging(db)
+        print(f"aging snapshot rebuilt: invoices<={state.invoice_watermark} payments<={state.payment_watermark}")
+
+
+def reconcile_payments(args):
+    with SessionLocal() as db:
+        result = reconcile.auto_match(db, batch_size=args.batch_size)
+        print(f"scanned={result.scanned} matched={result.matched}")
+
+
+def create_user(args):
+    password = args.password or getpass.getpass("Password: ")
+    with SessionLocal() as db:
+        user = users.create_user(db, args.email, hash_password(password))
+        print(f"created user id={user.id} email={user.email}")
+
+
+def hash_passwords(args):
+    # Migration 0009 did this once; rerun it after inserting users by hand (login rejects plaintext)
+    with SessionLocal() as db:
+        pending = users.get_unhashed_users(db, SCHEME)
+        for user in pending:
+            users.set_password_hash(db, user.id, hash_password(user.password))
+        print(f"hashed {len(pending)} plaintext password(s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Invoicer maintenance commands")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("migrate", help="Apply database migrations")
+    p.add_argument("revision", nargs="?", default="head")
+    p.set_defaults(func=run_migrations)
+
+    p = sub.add_parser("serve", help="Run the API with several worker processes (production)")
+    p.add_argument("--host", default=settings.SERVER_HOST)
+    p.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    p.add_argument("--workers", type=int, default=settings.WEB_CONCURRENCY,
+                   help="more than 1 needs CACHE_BACKEND and IDEMPOTENCY_BACKEND set to redis (or none); "
+                        "GET /events streams still only see writes made through their own worker")
+    p.add_argument("--allow-per-worker-state", action="store_true",
+                   help="start several workers even with the memory cache/idempotency backends")
+    p.add_argument("--no-migrate", dest="migrate", action="store_false", help="don't apply migrations first")
+    p.add_argument("--forwarded-allow-ips", default="127.0.0.1",
+                   help="proxies trusted for X-Forwarded-For/-Proto (comma-separated, or *)")
+    p.add_argument("--log-level", default="info")
+    p.set_defaults(func=serve)
+
+    p = sub.add_parser("rebuild-dashboard", help="Recompute dashboard totals from invoices and payments")
+    p.set_defaults(func=rebuild_dashboard)
+
+    p = sub.add_parser("rebuild-aging", help="Rebuild the invoice aging snapshot from scratch")
+    p.set_defaults(func=rebuild_aging)
+
+    p = sub.add_parser("reconcile", help="Link unlinked payments to open invoices and update balances")
+    p.add_argument("--batch-size", type=int, default=reconcile.BATCH_SIZE)
+    p.set_defaults(func=reconcile_payments)
+
+    p = sub.add_parser("create-user", help="Create a login with a hashed password")
+    p.add_argument("email")
+    p.add_argument("--password", help="prompted for when omitted")
+    p.set_defaults(func=create_user)
+
+    p = sub.add_parser("hash-passwords", help="Hash every password still stored in plaintext")
+    p.set_defaults(func=hash_passwords)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from .config import settings
+from .replicas import wants_primary
+
+# Namespaces hold the cached GET responses of one resource. Writes bump a namespace's version,
+# which orphans every key built under the old version (they then age out of the LRU / TTL).
+COMPANIES, CLIENTS, PROJECTS, DASHBOARD, REPORTS = "companies", "clients", "projects", "dashboard", "reports"
+
+
+class MemoryBackend:
+    """Per-process LRU with TTL. Invalidations only reach this worker; use Redis with several workers."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._items: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> bytes | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item[0] < time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return item[1]
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    async def add(self, key: str, value: bytes, ttl: int) -> bool:
+        """Store only if the key is absent (or expired); False if it is taken."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and item[0] >= time.monotonic():
+                return False
+            self._items[key] = (time.monotonic() + ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+            return True
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    async def version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    async def bump(self, namespace: str) -> None:
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    def size(self) -> int:
+        return len(self._items)
+
+
+class RedisBackend:
+    """Shared cache for every worker (Redis or anything speaking its protocol); needs the `redis` package."""
+
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package (pip install redis)") from e
+        self._redis = aioredis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._redis.get("cache:" + key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self._redis.set("cache:" + key, value, ex=ttl)
+
+    async def add(self, key: str, value: bytes, ttl: int) -> bool:
+        return bool(await self._redis.set("cache:" + key, value, ex=ttl, nx=True))
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete("cache:" + key)
+
+    async def version(self, namespace: str) -> int:
+        return int(await self._redis.get("cache-version:" + namespace) or 0)
+
+    async def bump(self, namespace: str) -> None:
+        await self._redis.incr("cache-version:" + namespace)
+
+    def size(self) -> int | None:
+        return None
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = self.misses = self.not_modified = self.invalidations = 0
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        return {"backend": settings.CACHE_BACKEND, "hits": self.hits, "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "not_modified": self.not_modified, "invalidations": self.invalidations,
+                "entries": backend.size() if backend else 0}
+
+
+def _make_backend():
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryBackend(settings.CACHE_MAX_ENTRIES)
+    if settings.CACHE_BACKEND == "redis":
+        return RedisBackend(settings.CACHE_REDIS_URL)
+    if settings.CACHE_BACKEND == "none":
+        return None
+    raise ValueError(f"CACHE_BACKEND must be 'memory', 'redis' or 'none', not {settings.CACHE_BACKEND!r}")
+
+
+backend = _make_backend()
+stats = CacheStats()
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, BaseModel):
+        return value.model_dump_json().encode()
+    return json.dumps(jsonable_encoder(value), separators=(",", ":")).encode()
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _response(request: Request, body: bytes, cache_status: str) -> Response:
+    etag = _etag(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "X-Cache": cache_status}
+    if etag in request.headers.get("if-none-match", ""):
+        stats.not_modified += 1
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+async def cached(request: Request, namespace: str, produce: Callable[[], Awaitable[Any]],
+                 vary: str = "") -> Response:
+    """Serve a GET from the cache (keyed by path + query + `vary`) or call `produce()` and store its JSON.
+
+    Responses carry an ETag, so a matching If-None-Match gets a 304 whether or not the entry was cached.
+    A client pinned to the primary after a write never gets an entry, which may have been filled from a
+    lagging replica after its write; its fresh primary result replaces that entry.
+    """
+    if backend is None:
+        return _response(request, _encode(await produce()), "BYPASS")
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    key = f"{namespace}:v{await backend.version(namespace)}:{request.url.path}?{query}#{vary}"
+    body = None if wants_primary(request) else await backend.get(key)
+    if body is not None:
+        stats.hits += 1
+        return _response(request, body, "HIT")
+    stats.misses += 1
+    body = _encode(await produce())
+    await backend.set(key, body, settings.CACHE_TTL)
+    return _response(request, body, "MISS")
+
+
+async def invalidate(*namespaces: str) -> None:
+    if backend is None:
+        return
+    for namespace in namespaces:
+        await backend.bump(namespace)
+        stats.invalidations += 1
@@ -15,8 +15,101 @@ class Settings(BaseModel):
     DB_HOST: str = os.getenv("DB_HOST", "localhost")
     DB_PORT: int = int(os.getenv("DB_PORT", "3306"))
     DB_DATABASE: str = os.getenv("DB_DATABASE", "invoicer")
+    # Full SQLAlchemy URL; overrides the DB_* parts above (e.g. sqlite:///./invoicer.db for local runs)
+    DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+
+    # Async database layer: routers run CRUD on an AsyncSession through this driver
+    DB_ASYNC: bool = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+    DB_ASYNC_DRIVERNAME: str = os.getenv("DB_ASYNC_DRIVERNAME", "mysql+aiomysql")
+
+    # Connection pool (per engine, per uvicorn worker)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Seconds before a pooled connection is replaced; keep below MySQL's wait_timeout (-1 disables)
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # "pessimistic" pings on every checkout; "optimistic" skips the round trip and relies on
+    # DB_POOL_RECYCLE plus invalidating the pool when a disconnect error is seen (the request
+    # that hits a dropped connection fails instead of reconnecting)
+    DB_POOL_PRE_PING: str = os.getenv("DB_POOL_PRE_PING", "pessimistic")
+
+    # Read replicas: comma-separated SQLAlchemy URLs that GET endpoints read from (empty = primary only).
+    # A replica that fails a read is skipped for DB_REPLICA_RETRY_SECONDS; after a write, the client's
+    # reads stay on the primary for DB_READ_YOUR_WRITES_SECONDS (cookie, 0 disables)
+    DB_REPLICA_URLS: str = os.getenv("DB_REPLICA_URLS", "")
+    DB_REPLICA_RETRY_SECONDS: float = float(os.getenv("DB_REPLICA_RETRY_SECONDS", "30"))
+    DB_READ_YOUR_WRITES_SECONDS: int = int(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
     
+    # Auth: HMAC key for login tokens (set the same value on every worker), lifetime in seconds,
+    # and how many verified tokens to keep in the in-process LRU
+    AUTH_SECRET_KEY: str = os.getenv("AUTH_SECRET_KEY", "")
+    AUTH_TOKEN_TTL: int = int(os.getenv("AUTH_TOKEN_TTL", "43200"))
+    AUTH_TOKEN_CACHE_SIZE: int = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "1024"))
+
     BACKEND_CORS_ORIGINS: str = os.getenv("BACKEND_CORS_ORIGINS", "*")
 
+    # Production server (python -m app.cli serve): bind address, worker processes (more than one needs the
+    # redis or none cache/idempotency backends), and how long shutdown waits for open requests and streams
+    SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8000"))
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    SERVER_GRACEFUL_SECONDS: int = int(os.getenv("SERVER_GRACEFUL_SECONDS", "10"))
+    # Apply migrations when a worker starts (dev default). `serve` migrates once before forking and
+    # turns this off; workers then only compare the schema revision, lazily and with retries
+    MIGRATE_ON_STARTUP: bool = os.getenv("MIGRATE_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+    STARTUP_RETRY_SECONDS: float = float(os.getenv("STARTUP_RETRY_SECONDS", "2"))
+
+    # List endpoints (keyset pagination)
+    PAGE_SIZE_DEFAULT: int = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+    PAGE_SIZE_MAX: int = int(os.getenv("PAGE_SIZE_MAX", "500"))
+
+    # Search: most ids a list endpoint's `q` filter takes from the index; more matches fall back to ILIKE
+    SEARCH_MAX_MATCHES: int = int(os.getenv("SEARCH_MAX_MATCHES", "1000"))
+    # Build the in-process search indexes in a background thread at startup
+    SEARCH_WARM_ON_STARTUP: bool = os.getenv("SEARCH_WARM_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+
+    # Response cache for read-heavy GETs: "memory" (per-worker LRU), "redis" (shared) or "none"
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "2048"))
+    CACHE_REDIS_URL: str = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+    # Idempotency-Key on create endpoints: "memory" (per-worker LRU), "redis" (shared, CACHE_REDIS_URL,
+    # needed for retries to be recognised by any worker) or "none"; responses are replayed for IDEMPOTENCY_TTL s
+    IDEMPOTENCY_BACKEND: str = os.getenv("IDEMPOTENCY_BACKEND", "memory")
+    IDEMPOTENCY_TTL: int = int(os.getenv("IDEMPOTENCY_TTL", "86400"))
+    IDEMPOTENCY_MAX_ENTRIES: int = int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "10000"))
+
+    # Incremental sync (GET /sync): changes per page, and how long a change stays "unsettled" (sent again
+    # on the next call) in case a transaction with a lower change id has not committed yet
+    SYNC_PAGE_SIZE: int = int(os.getenv("SYNC_PAGE_SIZE", "1000"))
+    SYNC_PAGE_MAX: int = int(os.getenv("SYNC_PAGE_MAX", "10000"))
+    SYNC_SETTLE_SECONDS: int = int(os.getenv("SYNC_SETTLE_SECONDS", "5"))
+
+    # Change feed (GET /events, server-sent events): events buffered per client before it is sent a
+    # `resync` instead, keep-alive comment interval, reconnect delay suggested to clients, stream limit
+    EVENTS_QUEUE_SIZE: int = int(os.getenv("EVENTS_QUEUE_SIZE", "256"))
+    EVENTS_HEARTBEAT_SECONDS: float = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+    EVENTS_RETRY_MS: int = int(os.getenv("EVENTS_RETRY_MS", "3000"))
+    EVENTS_MAX_SUBSCRIBERS: int = int(os.getenv("EVENTS_MAX_SUBSCRIBERS", "1000"))
+
+    # Request metrics (GET /metrics, Prometheus text format): statements at or above METRICS_SLOW_QUERY_MS
+    # are logged; METRICS_TIMING_HEADER adds a Server-Timing header with the request's db/pool/app split
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+    METRICS_SLOW_QUERY_MS: float = float(os.getenv("METRICS_SLOW_QUERY_MS", "200"))
+    METRICS_TIMING_HEADER: bool = os.getenv("METRICS_TIMING_HEADER", "false").lower() in ("1", "true", "yes")
+
+    # Server-side invoice/payment numbers (<prefix>-<company id>-<year>-<n>) when a create omits them;
+    # each worker reserves NUMBER_BLOCK_SIZE numbers per sequence at a time
+    INVOICE_NUMBER_PREFIX: str = os.getenv("INVOICE_NUMBER_PREFIX", "INV")
+    PAYMENT_NUMBER_PREFIX: str = os.getenv("PAYMENT_NUMBER_PREFIX", "PAY")
+    NUMBER_BLOCK_SIZE: int = int(os.getenv("NUMBER_BLOCK_SIZE", "20"))
+
+    # /dashboard/rollup aggregation: "sql" (GROUP BY in the database) or "numpy" (integer-cent sums in-process)
+    ROLLUP_ENGINE: str = os.getenv("ROLLUP_ENGINE", "sql")
+
+    # Bulk import: rows per INSERT batch / commit
+    BULK_CHUNK_SIZE: int = int(os.getenv("BULK_CHUNK_SIZE", "1000"))
+
 
 settings = Settings()
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+from . import fastjson
+from .config import settings
+
+# Topics a client can subscribe to (GET /events?topics=invoices,dashboard)
+COMPANIES, CLIENTS, PROJECTS, INVOICES, PAYMENTS, DASHBOARD = (
+    "companies", "clients", "projects", "invoices", "payments", "dashboard")
+TOPICS = (COMPANIES, CLIENTS, PROJECTS, INVOICES, PAYMENTS, DASHBOARD)
+
+# Sent in place of the backlog when a client falls EVENTS_QUEUE_SIZE events behind: refetch, then carry on
+RESYNC = b"event: resync\ndata: {}\n\n"
+
+
+class TooManySubscribers(Exception):
+    pass
+
+
+class Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, topics: set[str], company_id: int | None):
+        self.loop, self.topics, self.company_id = loop, topics, company_id
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(settings.EVENTS_QUEUE_SIZE)
+        self.overflows = 0
+
+    def wants(self, topic: str, company_id: int | None) -> bool:
+        # Events without a company (dashboard totals, bulk imports) reach every subscriber of the topic
+        return topic in self.topics and (self.company_id is None or company_id in (None, self.company_id))
+
+    def offer(self, frame: bytes) -> None:
+        # Runs on the subscriber's event loop; never blocks the publisher
+        if self.queue.full():
+            self.overflows += 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            frame = RESYNC
+        self.queue.put_nowait(frame)
+
+
+class Broker:
+    """In-process fan-out of change events to the SSE streams of this worker.
+
+    Publishers may run on any thread (CRUD in the threadpool or on the event loop); frames are
+    encoded once and handed to each subscriber's loop. A slow client never slows the writer:
+    its bounded queue is replaced by a single `resync` event when it overflows.
+    """
+
+    def __init__(self):
+        self._subscribers: set[Subscriber] = set()
+        self._lock = threading.Lock()
+        self.published = self.delivered = 0
+
+    def __bool__(self):
+        return bool(self._subscribers)
+
+    def subscribe(self, topics: set[str], company_id: int | None) -> Subscriber:
+        subscriber = Subscriber(asyncio.get_running_loop(), topics, company_id)
+        with self._lock:
+            if len(self._subscribers) >= settings.EVENTS_MAX_SUBSCRIBERS:
+                raise TooManySubscribers(f"More than {settings.EVENTS_MAX_SUBSCRIBERS} open event streams")
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, topic: str, kind: str, company_id: int | None, data) -> None:
+        with self._lock:
+            targets = [s for s in self._subscribers if s.wants(topic, company_id)]
+            self.published += 1
+            self.delivered += len(targets)
+        if not targets:
+            return
+        frame = b"event: " + kind.encode() + b"\ndata: " + fastjson.dumps(data) + b"\n\n"
+        for subscriber in targets:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.offer, frame)
+            except RuntimeError:
+                # The stream's loop has shut down; its finally block unsubscribes it
+                pass
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            subscribers = list(self._subscribers)
+            published, delivered = self.published, self.delivered
+        return {"subscribers": len(subscribers), "published": published, "delivered": delivered,
+                "queued": sum(s.queue.qsize() for s in subscribers),
+                "overflows": sum(s.overflows for s in subscribers)}
+
+
+broker = Broker()
+
+
+def publish(topic: str, kind: str, company_id: int | None, data) -> None:
+    broker.publish(topic, kind, company_id, data)
+
+
+async def stream(subscriber: Subscriber):
+    """SSE frames for one subscriber, with a comment line every EVENTS_HEARTBEAT_SECONDS to keep proxies open."""
+    try:
+        yield f"retry: {settings.EVENTS_RETRY_MS}\n\n".encode()
+        while True:
+            try:
+                yield await asyncio.wait_for(subscriber.queue.get(), settings.EVENTS_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": keep-alive\n\n"
+    finally:
+        broker.unsubscribe(subscriber)
@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+from typing import AsyncIterator, Iterable, Iterator
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .config import settings
+from ..db import fail_over, read_session
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+BATCH_SIZE = 1000
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _encode(rows: Iterable, columns: list[str], fmt: str) -> bytes:
+    if fmt == "ndjson":
+        return "".join(json.dumps(dict(zip(columns, row)), default=_json_default) + "\n" for row in rows).encode()
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+# The request's get_read_db session is closed before the body is sent, so each stream owns its own
+# session, picked the same way (replica unless the client is pinned to the primary). Nothing has been
+# sent when the query starts, so an unreachable replica can still fail over to the primary there.
+def _stream(db: Session, stmt: Select, fmt: str) -> Iterator[bytes]:
+    stmt = stmt.execution_options(yield_per=BATCH_SIZE)
+    with db:
+        try:
+            result = db.execute(stmt)
+        except DBAPIError as exc:
+            if not fail_over(db, exc):
+                raise
+            db.close()
+            result = db.execute(stmt)
+        columns = list(result.keys())
+        if fmt == "csv":
+            yield _encode([columns], columns, fmt)
+        for partition in result.partitions():
+            yield _encode(partition, columns, fmt)
+
+
+async def _stream_async(db: AsyncSession, stmt: Select, fmt: str) -> AsyncIterator[bytes]:
+    stmt = stmt.execution_options(yield_per=BATCH_SIZE)
+    async with db:
+        try:
+            result = await db.stream(stmt)
+        except DBAPIError as exc:
+            if not fail_over(db, exc):
+                raise
+            await db.close()
+            result = await db.stream(stmt)
+        columns = list(result.keys())
+        if fmt == "csv":
+            yield _encode([columns], columns, fmt)
+        async for partition in result.partitions():
+            yield _encode(partition, columns, fmt)
+
+
+def export_response(request: Request, stmt: Select, fmt: str, name: str) -> StreamingResponse:
+    """Stream `stmt` as NDJSON or CSV through a server-side cursor; memory stays bounded by one batch."""
+    db = read_session(request)
+    body = _stream_async(db, stmt, fmt) if settings.DB_ASYNC else _stream(db, stmt, fmt)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+import orjson
+from fastapi import Response
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def columns(model, schema) -> list:
+    """The table columns behind `schema`'s fields, in field order (select these instead of whole entities)."""
+    table = model.__table__
+    return [table.c[name] for name in schema.model_fields]
+
+
+def dumps(value) -> bytes:
+    # orjson writes dates/datetimes as ISO 8601, like Pydantic; Numeric columns become floats.
+    return orjson.dumps(value, default=_default)
+
+
+def rows(result) -> list[dict]:
+    items = [row._asdict() for row in result]
+    if items and any("__" in key for key in items[0]):
+        items = [_nest(item) for item in items]
+    return items
+
+
+def _nest(item: dict) -> dict:
+    # `client__name` -> {"client": {"name": ..}}; a relation whose columns are all NULL (no row) -> null
+    out, nested = {}, {}
+    for key, value in item.items():
+        if "__" in key:
+            relation, field = key.split("__", 1)
+            nested.setdefault(relation, {})[field] = value
+        else:
+            out[key] = value
+    for relation, fields in nested.items():
+        out[relation] = fields if any(v is not None for v in fields.values()) else None
+    return out
+
+
+def page(result, next_cursor: str | None) -> bytes:
+    """Encode a keyset page of column rows with the same shape as `schemas.Page`."""
+    return dumps({"items": rows(result), "next_cursor": next_cursor})
+
+
+def response(body: bytes) -> Response:
+    return Response(body, media_type="application/json")
@@ -0,0 +1,137 @@
+import asyncio
+import base64
+import hashlib
+import json
+
+from starlette.responses import JSONResponse, Response
+
+from .cache import MemoryBackend, RedisBackend
+from .config import settings
+
+HEADER = b"idempotency-key"
+# Create endpoints that honour Idempotency-Key (streamed uploads are left out: their bodies aren't buffered)
+PATHS = {"/companies/", "/clients/", "/projects/", "/invoices/", "/payments/", "/invoices/bulk", "/payments/bulk"}
+MAX_KEY_LENGTH = 255
+# A claimed key whose request never finished (crashed worker) is released after this many seconds;
+# while the request runs the claim is renewed, so long bulk imports keep it
+PENDING_TTL = 60
+PENDING = b"pending"
+
+
+class IdempotencyStats:
+    def __init__(self):
+        self.stored = self.replays = self.conflicts = self.mismatches = 0
+
+    def snapshot(self) -> dict:
+        return {"backend": settings.IDEMPOTENCY_BACKEND, "stored": self.stored, "replays": self.replays,
+                "conflicts": self.conflicts, "mismatches": self.mismatches,
+                "entries": backend.size() if backend else 0}
+
+
+def _make_backend():
+    if settings.IDEMPOTENCY_BACKEND == "memory":
+        return MemoryBackend(settings.IDEMPOTENCY_MAX_ENTRIES)
+    if settings.IDEMPOTENCY_BACKEND == "redis":
+        return RedisBackend(settings.CACHE_REDIS_URL)
+    if settings.IDEMPOTENCY_BACKEND == "none":
+        return None
+    raise ValueError(f"IDEMPOTENCY_BACKEND must be 'memory', 'redis' or 'none', not {settings.IDEMPOTENCY_BACKEND!r}")
+
+
+backend = _make_backend()
+stats = IdempotencyStats()
+
+
+def _error(status: int, detail: str) -> JSONResponse:
+    return JSONResponse(status_code=status, content={"detail": detail})
+
+
+async def _hold_claim(key: str) -> None:
+    while True:
+        await asyncio.sleep(PENDING_TTL / 3)
+        await backend.set(key, PENDING, PENDING_TTL)
+
+
+class IdempotencyMiddleware:
+    """Replay the stored response when a create is retried with the same Idempotency-Key.
+
+    The first request claims the key, runs normally and stores its status and body for
+    IDEMPOTENCY_TTL seconds; a retry with the same key and body gets that response back (marked
+    `Idempotent-Replayed: true`) without touching the database. A retry while the first is still
+    running gets 409, the same key with a different body 422. 5xx responses aren't stored, so those
+    requests can be retried for real. Keys are scoped by caller (Authorization header) and path.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (backend is None or scope["type"] != "http" or scope["method"] != "POST"
+                or scope["path"] not in PATHS):
+            return await self.app(scope, receive, send)
+        headers = dict(scope["headers"])
+        raw_key = headers.get(HEADER)
+        if raw_key is None:
+            return await self.app(scope, receive, send)
+        idempotency_key = raw_key.decode("latin-1")
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            return await _error(400, f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")(scope, receive, send)
+
+        body, more = b"", True
+        while more:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+        fingerprint = hashlib.blake2b(body, digest_size=16).hexdigest()
+        caller = hashlib.blake2b(headers.get(b"authorization", b""), digest_size=8).hexdigest()
+        key = f"idempotency:{caller}:{scope['path']}:{idempotency_key}"
+
+        if not await backend.add(key, PENDING, PENDING_TTL):
+            return await self._replay(await backend.get(key), fingerprint)(scope, receive, send)
+
+        status, content_type, chunks, body_sent = 500, None, [], False
+
+        async def replay_body():
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def capture(message):
+            nonlocal status, content_type
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                content_type = next((v.decode("latin-1") for k, v in message["headers"] if k == b"content-type"),
+                                    None)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        renew = asyncio.create_task(_hold_claim(key))
+        try:
+            await self.app(scope, replay_body, capture)
+        finally:
+            renew.cancel()
+            if status >= 500:
+                await backend.delete(key)
+            else:
+                record = {"fingerprint": fingerprint, "status": status, "content_type": content_type,
+                          "body": base64.b64encode(b"".join(chunks)).decode()}
+                await backend.set(key, json.dumps(record).encode(), settings.IDEMPOTENCY_TTL)
+                stats.stored += 1
+
+    def _replay(self, stored: bytes | None, fingerprint: str):
+        if stored is None or stored == PENDING:
+            # Still running (or finished and evicted between the two lookups)
+            stats.conflicts += 1
+            return _error(409, "A request with this Idempotency-Key is still being processed")
+        record = json.loads(stored)
+        if record["fingerprint"] != fingerprint:
+            stats.mismatches += 1
+            return _error(422, "Idempotency-Key was already used with a different request body")
+        stats.replays += 1
+        return Response(base64.b64decode(record["body"]), status_code=record["status"],
+                        headers={"Idempotent-Replayed": "true"}, media_type=record["content_type"])
@@ -0,0 +1,188 @@
+import bisect
+import logging
+import threading
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class RequestStats:
+    """What one request spent in the database; filled in by the engine and pool hooks below."""
+    __slots__ = ("queries", "sql_seconds", "pool_wait_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_seconds = self.pool_wait_seconds = 0.0
+
+    def server_timing(self, elapsed: float) -> str:
+        app = max(elapsed - self.sql_seconds - self.pool_wait_seconds, 0.0)
+        return (f'db;dur={self.sql_seconds * 1000:.1f};desc="{self.queries} queries", '
+                f"pool;dur={self.pool_wait_seconds * 1000:.1f}, app;dur={app * 1000:.1f}")
+
+
+# The request being served in this context. Threadpool calls and AsyncSession.run_sync both run in a
+# copy of the caller's context, so CRUD code on either path reports into the same RequestStats.
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RouteMetrics:
+    def __init__(self):
+        self.statuses: dict[int, int] = {}
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.sql_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+
+
+class Registry:
+    def __init__(self):
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+        self.slow_queries = 0
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, elapsed: float, stats: RequestStats):
+        with self._lock:
+            m = self.routes.get((method, route))
+            if m is None:
+                m = self.routes[(method, route)] = RouteMetrics()
+            m.statuses[status] = m.statuses.get(status, 0) + 1
+            m.latency.observe(elapsed)
+            m.queries.observe(stats.queries)
+            m.sql_seconds += stats.sql_seconds
+            m.pool_wait_seconds += stats.pool_wait_seconds
+
+    def slow_query(self):
+        with self._lock:
+            self.slow_queries += 1
+
+    def render(self) -> str:
+        with self._lock:
+            routes = sorted(self.routes.items())
+            lines = family("http_requests_total", "counter", "Requests by route and status", [
+                ({"method": method, "route": route, "status": status}, count)
+                for (method, route), m in routes for status, count in sorted(m.statuses.items())])
+            lines += histogram("http_request_duration_seconds", "Request latency by route",
+                               [({"method": method, "route": route}, m.latency) for (method, route), m in routes])
+            lines += histogram("http_request_sql_queries", "SQL statements per request by route",
+                               [({"method": method, "route": route}, m.queries) for (method, route), m in routes])
+            lines += family("http_request_sql_seconds_total", "counter", "Time spent in SQL by route", [
+                ({"method": method, "route": route}, m.sql_seconds) for (method, route), m in routes])
+            lines += family("http_request_pool_wait_seconds_total", "counter",
+                            "Time spent waiting for a pooled connection by route",
+                            [({"method": method, "route": route}, m.pool_wait_seconds) for (method, route), m in routes])
+            lines += family("sql_slow_queries_total", "counter",
+                            f"Statements slower than {settings.METRICS_SLOW_QUERY_MS} ms", [({}, self.slow_queries)])
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def family(name: str, kind: str, help_text: str, samples: list[tuple[dict, float]]) -> list[str]:
+    """Prometheus text-format lines for one metric family."""
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}",
+            *(f"{name}{_labels(labels)} {value}" for labels, value in samples)]
+
+
+def histogram(name: str, help_text: str, samples: list[tuple[dict, Histogram]]) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, h in samples:
+        cumulative = 0
+        for bound, count in zip((*h.buckets, "+Inf"), h.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': bound})} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {h.sum}")
+        lines.append(f"{name}_count{_labels(labels)} {h.count}")
+    return lines
+
+
+def record_pool_wait(seconds: float) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.pool_wait_seconds += seconds
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.sql_seconds += elapsed
+    if elapsed * 1000 >= settings.METRICS_SLOW_QUERY_MS:
+        registry.slow_query()
+        logger.warning("slow query (%.1f ms): %s", elapsed * 1000, " ".join(statement.split())[:1000])
+
+
+class MetricsMiddleware:
+    """Per-route latency, SQL count/time and pool wait for every HTTP request (pure ASGI, no body buffering).
+
+    Requests are labelled by route template ("/projects/{project_id}"); unmatched paths share one label.
+    With METRICS_TIMING_HEADER the response carries the breakdown as a Server-Timing header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if settings.METRICS_TIMING_HEADER:
+                    MutableHeaders(scope=message).append("Server-Timing",
+                                                         stats.server_timing(time.perf_counter() - started))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            registry.observe(scope["method"], getattr(route, "path", "unmatched"), status,
+                             time.perf_counter() - started, stats)
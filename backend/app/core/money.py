@@ -0,0 +1,43 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Annotated
+
+import numpy as np
+from pydantic import AfterValidator, PlainSerializer
+
+CENT = Decimal("0.01")
+ZERO = Decimal("0.00")
+
+
+def quantize(value) -> Decimal:
+    """Round to cents, half up. Floats go through their shortest repr (0.1 -> 0.10, not 0.1000000000000000055)."""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+# Exact in Python and in the database; still a JSON number on the wire, as before
+Money = Annotated[Decimal, AfterValidator(quantize), PlainSerializer(float, return_type=float, when_used="json")]
+
+
+def gst(subtotal: Decimal, percent: int | None) -> Decimal:
+    """Tax on `subtotal` at `percent` (None = no GST), rounded half up to the cent."""
+    if not percent:
+        return ZERO
+    return quantize(subtotal * percent / 100)
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def group_sum(keys: np.ndarray, cents: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-key totals of integer cents: (sorted unique keys, int64 sums), vectorised and exact.
+
+    Sorts once and adds each run with np.add.reduceat in int64, so there is no float rounding at any size.
+    """
+    if len(keys) == 0:
+        return keys[:0], cents[:0]
+    order = np.argsort(keys, kind="stable")
+    keys, cents = keys[order], cents[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return keys[starts], np.add.reduceat(cents, starts)
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from .metrics import record_pool_wait
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """Counters for one engine's pool, updated from pool events and timed checkouts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_ms_total = 0.0
+            self.wait_ms_max = 0.0
+            self.connects = 0
+            self.closes = 0
+            self.invalidations = 0
+            self.checked_out_peak = 0
+            self.overflow_peak = 0
+            self.since = time.time()
+
+    def record_wait(self, pool: QueuePool, wait_ms: float, timed_out: bool):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.checked_out_peak = max(self.checked_out_peak, pool.checkedout())
+                self.overflow_peak = max(self.overflow_peak, max(pool.overflow(), 0))
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def count(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def snapshot(self, pool: Pool) -> dict:
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_ms_total / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_ms_max, 3),
+                "connects": self.connects,
+                "closes": self.closes,
+                "invalidations": self.invalidations,
+                "checked_out_peak": self.checked_out_peak,
+                "overflow_peak": self.overflow_peak,
+                "since": self.since,
+            }
+        if isinstance(pool, QueuePool):
+            data.update(size=pool.size(), checked_in=pool.checkedin(), checked_out=pool.checkedout(),
+                        overflow=max(pool.overflow(), 0), max_overflow=pool._max_overflow, timeout=pool.timeout())
+        return data
+
+
+class _TimedCheckout:
+    stats: PoolStats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_wait(self, (time.perf_counter() - started) * 1000, timed_out=True)
+            logger.warning("connection pool exhausted: %s", self.status())
+            raise
+        waited = time.perf_counter() - started
+        self.stats.record_wait(self, waited * 1000, timed_out=False)
+        record_pool_wait(waited)
+        return entry
+
+    def recreate(self):
+        new = super().recreate()
+        new.stats = self.stats
+        return new
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument(pool: Pool) -> PoolStats:
+    """Attach a PoolStats to `pool`; checkout waits are only timed for the Instrumented* pool classes."""
+    stats = pool.stats = getattr(pool, "stats", None) or PoolStats()
+    event.listen(pool, "connect", lambda *a: stats.count("connects"))
+    event.listen(pool, "close", lambda *a: stats.count("closes"))
+    event.listen(pool, "invalidate", lambda *a: stats.count("invalidations"))
+    return stats
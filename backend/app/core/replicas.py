@@ -0,0 +1,89 @@
+import itertools
+import threading
+import time
+
+from fastapi import Request
+
+from .config import settings
+
+# Set on responses to writes; while a client sends either one back, its reads go to the primary.
+# The header (a unix timestamp) is for API clients without a cookie jar, such as the Flutter app
+READ_PRIMARY_COOKIE = "read_primary"
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class Replica:
+    def __init__(self, name: str, url: str, engine, async_engine=None):
+        self.name, self.url = name, url
+        self.engine, self.async_engine = engine, async_engine
+        self.down_until = 0.0
+        self.reads = self.failures = 0
+
+
+class ReplicaSet:
+    """Round-robin over the healthy replicas; one that fails a read sits out `retry_after` seconds.
+
+    After that the next read is routed to it again, so a recovered replica rejoins on its own and a
+    still-broken one costs a single failed-over read per period.
+    """
+
+    def __init__(self, replicas: list[Replica], retry_after: float):
+        self.replicas = replicas
+        self.retry_after = retry_after
+        self.primary_reads = self.failovers = 0
+        self._cycle = itertools.cycle(replicas)
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return bool(self.replicas)
+
+    def pick(self) -> Replica | None:
+        """The next healthy replica, or None to read from the primary."""
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                replica = next(self._cycle)
+                if replica.down_until <= now:
+                    replica.reads += 1
+                    return replica
+            self.primary_reads += 1
+            return None
+
+    def mark_down(self, replica: Replica) -> None:
+        with self._lock:
+            replica.failures += 1
+            replica.down_until = time.monotonic() + self.retry_after
+            self.failovers += 1
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        return {
+            "primary_reads": self.primary_reads,
+            "failovers": self.failovers,
+            "replicas": [{"name": r.name, "url": r.url, "healthy": r.down_until <= now, "reads": r.reads,
+                          "failures": r.failures, "retry_in": round(max(0.0, r.down_until - now), 1)}
+                         for r in self.replicas],
+        }
+
+
+def wants_primary(request: Request) -> bool:
+    if READ_PRIMARY_COOKIE in request.cookies:
+        return True
+    try:
+        until = float(request.headers.get(READ_PRIMARY_HEADER, 0))
+    except ValueError:
+        return False
+    # Capped, so a client can't pin itself to the primary for longer than a server would have
+    now = time.time()
+    return now < until <= now + settings.DB_READ_YOUR_WRITES_SECONDS
+
+
+async def read_your_writes(request: Request, call_next):
+    """Pin a client's reads to the primary for DB_READ_YOUR_WRITES_SECONDS after each successful write."""
+    response = await call_next(request)
+    if request.method in WRITE_METHODS and response.status_code < 400:
+        response.set_cookie(READ_PRIMARY_COOKIE, "1", max_age=settings.DB_READ_YOUR_WRITES_SECONDS,
+                            httponly=True, samesite="lax")
+        response.headers[READ_PRIMARY_HEADER] = f"{time.time() + settings.DB_READ_YOUR_WRITES_SECONDS:.3f}"
+    return response
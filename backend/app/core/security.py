@@ -0,0 +1,155 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.concurrency import run_in_threadpool
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# scrypt cost: n=2**14, r=8 needs 128 * n * r = 16 MiB per hash
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 14, 8, 1
+SCRYPT_MAXMEM = 64 * 1024 * 1024
+SCHEME = "scrypt"
+
+
+class InvalidToken(ValueError):
+    pass
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+# ---------- PASSWORDS ----------
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=SCRYPT_MAXMEM, dklen=32)
+
+
+def hash_password(password: str) -> str:
+    """Return `scrypt$n$r$p$salt$hash`; CPU and memory heavy, call through hash_password_async in handlers."""
+    salt = secrets.token_bytes(16)
+    digest = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    return f"{SCHEME}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def is_hashed(stored: str) -> bool:
+    return stored.startswith(SCHEME + "$")
+
+
+def verify_password(password: str, stored: str) -> bool:
+    if not is_hashed(stored):
+        # Plaintext rows were hashed by migration 0009 (later ones: `python -m app.cli hash-passwords`)
+        return False
+    _, n, r, p, salt, digest = stored.split("$")
+    return hmac.compare_digest(_scrypt(password, _b64decode(salt), int(n), int(r), int(p)), _b64decode(digest))
+
+
+def needs_rehash(stored: str) -> bool:
+    return stored.split("$")[:4] != [SCHEME, str(SCRYPT_N), str(SCRYPT_R), str(SCRYPT_P)]
+
+
+async def hash_password_async(password: str) -> str:
+    return await run_in_threadpool(hash_password, password)
+
+
+async def verify_password_async(password: str, stored: str) -> bool:
+    return await run_in_threadpool(verify_password, password, stored)
+
+
+# ---------- TOKENS ----------
+if settings.AUTH_SECRET_KEY:
+    _SECRET = settings.AUTH_SECRET_KEY.encode()
+else:
+    _SECRET = secrets.token_bytes(32)
+    logger.warning("AUTH_SECRET_KEY is not set; tokens are signed with a per-process key "
+                   "and will not survive restarts or validate across workers")
+
+
+def _sign(body: str) -> str:
+    return _b64encode(hmac.new(_SECRET, body.encode(), hashlib.sha256).digest())
+
+
+def create_token(user_id: int, email: str) -> str:
+    now = int(time.time())
+    claims = {"sub": user_id, "email": email, "iat": now, "exp": now + settings.AUTH_TOKEN_TTL}
+    body = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    return f"{body}.{_sign(body)}"
+
+
+def decode_token(token: str) -> dict:
+    """Check the signature and expiry; no database access."""
+    body, _, signature = token.partition(".")
+    if not signature or not hmac.compare_digest(signature, _sign(body)):
+        raise InvalidToken("Invalid token")
+    try:
+        claims = json.loads(_b64decode(body))
+    except ValueError:
+        raise InvalidToken("Invalid token")
+    if claims.get("exp", 0) < time.time():
+        raise InvalidToken("Token expired")
+    return claims
+
+
+class TokenCache:
+    """Small LRU of already-verified tokens -> claims; entries still expire with the token."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._items: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> dict | None:
+        with self._lock:
+            claims = self._items.get(token)
+            if claims is None:
+                return None
+            if claims["exp"] < time.time():
+                del self._items[token]
+                return None
+            self._items.move_to_end(token)
+            return claims
+
+    def put(self, token: str, claims: dict) -> None:
+        with self._lock:
+            self._items[token] = claims
+            self._items.move_to_end(token)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+
+token_cache = TokenCache(settings.AUTH_TOKEN_CACHE_SIZE)
+
+
+def verify_token(token: str) -> dict:
+    claims = token_cache.get(token)
+    if claims is None:
+        claims = decode_token(token)
+        token_cache.put(token, claims)
+    return claims
+
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials | None = Depends(_bearer)) -> dict:
+    """Dependency: the token's claims (`sub`, `email`, `exp`); 401 when missing or invalid."""
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    try:
+        return verify_token(credentials.credentials)
+    except InvalidToken as e:
+        raise HTTPException(status_code=401, detail=str(e), headers={"WWW-Authenticate": "Bearer"})
@@ -0,0 +1,73 @@
+import csv
+import json
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import HTTPException, Request
+
+from ..schemas import BulkResult, BulkRowError
+
+NDJSON_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+CSV_TYPES = {"text/csv", "application/csv"}
+
+
+async def _lines(request: Request) -> AsyncIterator[str]:
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace").rstrip("\r")
+
+
+async def iter_records(request: Request, result: BulkResult) -> AsyncIterator[tuple[int, dict]]:
+    """Yield (row_no, record) from an NDJSON or CSV request body without buffering it.
+
+    CSV needs a header row and one record per line (no embedded newlines); empty cells become None.
+    Unparseable lines are reported in `result.errors` and skipped.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type not in NDJSON_TYPES | CSV_TYPES:
+        raise HTTPException(status_code=415, detail="Upload must be application/x-ndjson or text/csv")
+
+    header = None
+    row_no = 0
+    async for line in _lines(request):
+        if not line.strip():
+            continue
+        if content_type in CSV_TYPES:
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [h.strip() for h in values]
+                continue
+            row_no += 1
+            if len(values) != len(header):
+                result.errors.append(BulkRowError(row=row_no, detail=f"expected {len(header)} columns, got {len(values)}"))
+                continue
+            yield row_no, {k: (v if v != "" else None) for k, v in zip(header, values)}
+        else:
+            row_no += 1
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                result.errors.append(BulkRowError(row=row_no, detail=f"invalid JSON: {exc}"))
+                continue
+            if not isinstance(record, dict):
+                result.errors.append(BulkRowError(row=row_no, detail="expected a JSON object"))
+                continue
+            yield row_no, record
+
+
+async def stream_import(request: Request, handle_chunk: Callable[[list[tuple[int, dict]]], Awaitable],
+                        result: BulkResult, chunk_size: int) -> BulkResult:
+    chunk = []
+    async for record in iter_records(request, result):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            await handle_chunk(chunk)
+            chunk = []
+    if chunk:
+        await handle_chunk(chunk)
+    result.errors.sort(key=lambda e: e.row)
+    return result
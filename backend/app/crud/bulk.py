@@ -0,0 +1,103 @@
+import logging
+from typing import Callable, Iterable
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..schemas import BulkResult, BulkRowError
+from . import changes
+
+logger = logging.getLogger(__name__)
+
+
+def validate_rows(schema: type[BaseModel], rows: Iterable[tuple[int, dict]], result: BulkResult):
+    valid = []
+    for row_no, raw in rows:
+        try:
+            valid.append((row_no, schema.model_validate(raw).model_dump()))
+        except ValidationError as exc:
+            detail = exc.errors(include_url=False, include_context=False, include_input=False)
+            result.errors.append(BulkRowError(row=row_no, detail=detail))
+    return valid
+
+
+def _row_error(model, values: dict, exc: IntegrityError) -> str:
+    """Client-facing reason for a rejected row; the driver message names tables and constraints, so it is only logged."""
+    message = str(exc.orig).lower().replace("`", "")
+    columns = model.__table__.columns
+    if "unique" in message or "duplicate" in message:
+        for col in columns:
+            if col.unique and col.name in message:
+                return f"duplicate {col.name} {values.get(col.name)!r}"
+        return "duplicate value"
+    if "foreign key" in message:
+        refs = [col.name for col in columns if col.foreign_keys]
+        # MySQL names the column (FOREIGN KEY (client_id) ...); SQLite doesn't
+        named = [name for name in refs if f"({name})" in message]
+        return f"invalid reference: no such record for {', '.join(named or refs)}"
+    return "conflicts with existing data"
+
+
+def _insert(db: Session, model, rows: list[tuple[int, dict]], result: BulkResult):
+    try:
+        with db.begin_nested():
+            db.execute(insert(model), [values for _, values in rows])
+        return rows
+    except IntegrityError:
+        # Something the pre-checks cannot see (e.g. a dangling foreign key): isolate it row by row.
+        inserted = []
+        for row_no, values in rows:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(model), [values])
+                inserted.append((row_no, values))
+            except IntegrityError as exc:
+                logger.warning("bulk %s row %s rejected: %s", model.__tablename__, row_no, exc.orig)
+                result.errors.append(BulkRowError(row=row_no, detail=_row_error(model, values, exc)))
+        return inserted
+
+
+def insert_chunk(db: Session, model, key: str, rows: list[tuple[int, dict]], result: BulkResult,
+                 on_insert: Callable[[Session, list[dict]], None] | None = None,
+                 prepare: Callable[[Session, list[dict]], None] | None = None):
+    """Insert one chunk of validated rows with a single executemany and commit it.
+
+    `prepare` fills in server-side values (e.g. omitted numbers) first. Rows whose unique `key`
+    already exists (in the table or earlier in the chunk) are reported as errors instead of failing the chunk.
+    """
+    if prepare:
+        prepare(db, [values for _, values in rows])
+    key_col = getattr(model, key)
+    taken = set(db.scalars(select(key_col).where(key_col.in_([values[key] for _, values in rows]))))
+    pending = []
+    for row_no, values in rows:
+        if values[key] in taken:
+            result.errors.append(BulkRowError(row=row_no, detail=f"duplicate {key} {values[key]!r}"))
+            continue
+        taken.add(values[key])
+        pending.append((row_no, values))
+    if not pending:
+        return
+
+    inserted = _insert(db, model, pending, result)
+    if inserted:
+        if on_insert:
+            on_insert(db, [values for _, values in inserted])
+        keys = [values[key] for _, values in inserted]
+        ids = dict(db.execute(select(key_col, model.id).where(key_col.in_(keys))).all())
+        result.created_ids.extend(ids[k] for k in keys)
+        changes.log(db, model.__tablename__, [ids[k] for k in keys])
+    db.commit()
+
+
+def bulk_create(db: Session, schema: type[BaseModel], model, key: str, rows: list[tuple[int, dict]],
+                result: BulkResult, chunk_size: int,
+                on_insert: Callable[[Session, list[dict]], None] | None = None,
+                prepare: Callable[[Session, list[dict]], None] | None = None) -> BulkResult:
+    valid = validate_rows(schema, rows, result)
+    for start in range(0, len(valid), chunk_size):
+        insert_chunk(db, model, key, valid[start:start + chunk_size], result, on_insert, prepare)
+    result.errors.sort(key=lambda e: e.row)
+    return result
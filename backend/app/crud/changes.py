@@ -0,0 +1,60 @@
+from datetime import timedelta
+from typing import Iterable
+
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core import fastjson
+from ..core.config import settings
+from ..schemas import ClientOut, CompanyOut, InvoiceOut, PaymentOut, ProjectOut
+
+# Entities in /sync order (parents first, so a device can insert rows as they arrive)
+ENTITIES = {
+    "companies": fastjson.columns(models.Company, CompanyOut),
+    "clients": fastjson.columns(models.Client, ClientOut),
+    "projects": fastjson.columns(models.Project, ProjectOut),
+    "invoices": fastjson.columns(models.Invoice, InvoiceOut),
+    "payments": fastjson.columns(models.Payment, PaymentOut),
+}
+
+
+def log(db: Session, entity: str, ids: Iterable[int]) -> None:
+    """Record that rows were created or updated, in the caller's transaction (commits or rolls back with them)."""
+    rows = [{"entity": entity, "entity_id": i} for i in dict.fromkeys(ids) if i is not None]
+    if rows:
+        db.execute(insert(models.ChangeLog), rows)
+
+
+def backfill(db: Session) -> None:
+    """One change per existing row, so `since=0` returns everything (rows inserted without the CRUD layer)."""
+    c = models.ChangeLog
+    for entity, columns in ENTITIES.items():
+        table = columns[0].table
+        db.execute(insert(c).from_select(["entity", "entity_id"],
+                                         select(literal(entity), table.c.id).order_by(table.c.id)))
+
+
+def since(db: Session, token: int, limit: int) -> tuple[dict[str, list], int, bool]:
+    """Current state of every row changed after `token`: ({entity: rows}, next token, more).
+
+    Change ids are assigned before commit, so a transaction can commit after one with a higher id.
+    The next token therefore stops short of changes younger than SYNC_SETTLE_SECONDS; those are sent
+    now and again on the next call (clients upsert by id), and a late commit below them is not skipped.
+    """
+    c = models.ChangeLog
+    page = db.execute(select(c.id, c.entity, c.entity_id, c.created_at)
+                      .where(c.id > token).order_by(c.id).limit(limit)).all()
+    cutoff = db.scalar(select(func.current_timestamp())) - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+    settled = [change.id for change in page if change.created_at <= cutoff]
+    next_token = max(settled, default=token)
+
+    changed: dict[str, list] = {entity: [] for entity in ENTITIES}
+    for change in page:
+        changed[change.entity].append(change.entity_id)
+    result = {}
+    for entity, columns in ENTITIES.items():
+        ids = list(dict.fromkeys(changed[entity]))
+        table = columns[0].table
+        result[entity] = db.execute(select(*columns).where(table.c.id.in_(ids)).order_by(table.c.id)).all() if ids else []
+    return result, next_token, len(page) == limit and next_token > token
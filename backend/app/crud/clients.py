@@ -1,23 +1,35 @@
 from sqlalchemy.orm import Session
 from .. import models
-from ..schemas import ClientCreate
+from ..core import events, fastjson
+from ..schemas import ClientCreate, ClientOut
+from . import changes, search
+from .pagination import paginate
 
 
-def list_clients(db: Session, company_id: int | None = None, q: str | None = None):
-    query = db.query(models.Client)
+# List endpoints select just the response columns and encode the rows with core.fastjson
+OUT_COLUMNS = fastjson.columns(models.Client, ClientOut)
+
+
+def list_clients(db: Session, company_id: int | None = None, q: str | None = None,
+                 cursor: str | None = None, limit: int = 50):
+    query = db.query(*OUT_COLUMNS)
     if company_id:
         query = query.filter(models.Client.company_id == company_id)
     if q:
-        like = f"%{q}%"
-        query = query.filter(models.Client.name.ilike(like))
-    return query.order_by(models.Client.created_at.desc()).all()
+        query = query.filter(search.name_filter(db, "client", q))
+    return paginate(query, models.Client.created_at, models.Client.id, cursor, limit)
 
 
 def create_client(db: Session, payload: ClientCreate):
     obj = models.Client(**payload.dict())
     db.add(obj);
+    db.flush()
+    changes.log(db, "clients", [obj.id])
     db.commit();
     db.refresh(obj)
+    search.note_created(db, "client")
+    if events.broker:
+        events.publish(events.CLIENTS, "client.created", obj.company_id, ClientOut.model_validate(obj).model_dump())
     return obj
 
 
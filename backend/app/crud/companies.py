@@ -1,21 +1,32 @@
 from sqlalchemy.orm import Session
 from .. import models
-from ..schemas import CompanyCreate
+from ..core import events, fastjson
+from ..schemas import CompanyCreate, CompanyOut
+from . import changes, search
+from .pagination import paginate
 
 
-def list_companies(db: Session, q: str | None = None, skip: int = 0, limit: int = 100):
-    query = db.query(models.Company)
+# List endpoints select just the response columns and encode the rows with core.fastjson
+OUT_COLUMNS = fastjson.columns(models.Company, CompanyOut)
+
+
+def list_companies(db: Session, q: str | None = None, cursor: str | None = None, limit: int = 50):
+    query = db.query(*OUT_COLUMNS)
     if q:
-        like = f"%{q}%"
-        query = query.filter(models.Company.name.ilike(like))
-    return query.order_by(models.Company.created_at.desc()).offset(skip).limit(limit).all()
+        query = query.filter(search.name_filter(db, "company", q))
+    return paginate(query, models.Company.created_at, models.Company.id, cursor, limit)
 
 
 def create_company(db: Session, payload: CompanyCreate):
     company = models.Company(**payload.dict())
     db.add(company);
+    db.flush()
+    changes.log(db, "companies", [company.id])
     db.commit();
     db.refresh(company)
+    search.note_created(db, "company")
+    if events.broker:
+        events.publish(events.COMPANIES, "company.created", company.id, CompanyOut.model_validate(company).model_dump())
     return company
 
 
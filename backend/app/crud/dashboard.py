@@ -0,0 +1,180 @@
+from datetime import date
+from decimal import Decimal
+from itertools import chain
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import BigInteger, Numeric, cast, desc, extract, func, literal, select, union_all, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core import fastjson, money
+from ..schemas import InvoiceOut, PaymentOut
+
+TOTALS_ID = 1
+# recent_activity returns column rows (InvoiceOut / PaymentOut fields) for fastjson, not entities
+INVOICE_COLUMNS = fastjson.columns(models.Invoice, InvoiceOut)
+PAYMENT_COLUMNS = fastjson.columns(models.Payment, PaymentOut)
+
+
+def _bump(db: Session, invoice_count: int = 0, amount: Decimal = Decimal(0), paid: Decimal = Decimal(0)):
+    # Runs inside the caller's transaction so the totals commit (or roll back) with the row.
+    t = models.DashboardTotals
+    stmt = update(t).where(t.id == TOTALS_ID).values(
+        invoice_count=t.invoice_count + invoice_count,
+        total_amount=t.total_amount + amount,
+        total_paid=t.total_paid + paid,
+    )
+    # First write on a fresh database: seed the row from the (already flushed) tables instead.
+    if db.execute(stmt).rowcount == 0 and not _seed_totals(db):
+        db.execute(stmt)
+
+
+def _seed_totals(db: Session) -> bool:
+    """Insert the totals row; False if a concurrent transaction inserted it first."""
+    try:
+        with db.begin_nested():
+            rebuild_totals(db)
+        return True
+    except IntegrityError:
+        return False
+
+
+def record_invoice(db: Session, total) -> None:
+    _bump(db, invoice_count=1, amount=Decimal(str(total)))
+
+
+def record_payment(db: Session, amount) -> None:
+    _bump(db, paid=Decimal(str(amount)))
+
+
+def record_invoices(db: Session, totals: list) -> None:
+    _bump(db, invoice_count=len(totals), amount=sum((Decimal(str(t)) for t in totals), Decimal(0)))
+
+
+def record_payments(db: Session, amounts: list) -> None:
+    _bump(db, paid=sum((Decimal(str(a)) for a in amounts), Decimal(0)))
+
+
+def _computed_totals(db: Session) -> models.DashboardTotals:
+    # Transient (not added to the session): the caller decides whether it is written
+    invoice_count, total_amount = db.execute(
+        select(func.count(models.Invoice.id), func.coalesce(func.sum(models.Invoice.total), 0))
+    ).one()
+    total_paid = db.execute(select(func.coalesce(func.sum(models.Payment.amount), 0))).scalar_one()
+    return models.DashboardTotals(id=TOTALS_ID, invoice_count=invoice_count,
+                                  total_amount=total_amount, total_paid=total_paid)
+
+
+def rebuild_totals(db: Session) -> models.DashboardTotals:
+    return db.merge(_computed_totals(db))
+
+
+def get_totals(db: Session) -> models.DashboardTotals:
+    """Read-only (the session may be a replica's): migration 0008 seeds the row, and the first write
+    through _bump recreates it if it was deleted. Until then the totals are computed, not stored."""
+    return db.get(models.DashboardTotals, TOTALS_ID) or _computed_totals(db)
+
+
+def recent_activity(db: Session, limit: int = 3):
+    recent_invoices = db.query(*INVOICE_COLUMNS).order_by(desc(models.Invoice.issue_date)).limit(limit).all()
+    recent_payments = db.query(*PAYMENT_COLUMNS).order_by(desc(models.Payment.payment_date)).limit(limit).all()
+    return recent_invoices, recent_payments
+
+
+def _rollup_part(group_by: str, by_month: bool, model, date_col, amount_col,
+                 date_from: date | None, date_to: date | None, invoiced: bool):
+    # Every fact is attributed through its project so invoices and payments roll up identically.
+    if group_by == "project":
+        key = model.project_id
+    else:
+        key = getattr(models.Project, f"{group_by}_id")
+    zero = literal(0, Numeric(16, 2))
+    cols = [key.label("key")]
+    if by_month:
+        cols += [extract("year", date_col).label("year"), extract("month", date_col).label("month")]
+    cols += [func.sum(amount_col).label("invoiced") if invoiced else zero.label("invoiced"),
+             zero.label("paid") if invoiced else func.sum(amount_col).label("paid")]
+    stmt = select(*cols)
+    if group_by != "project":
+        stmt = stmt.join(models.Project, models.Project.id == model.project_id)
+    if date_from:
+        stmt = stmt.where(date_col >= date_from)
+    if date_to:
+        stmt = stmt.where(date_col <= date_to)
+    return stmt.group_by(*cols[:3] if by_month else cols[:1])
+
+
+def rollup(db: Session, group_by: str, by_month: bool = True,
+           date_from: date | None = None, date_to: date | None = None):
+    """Invoiced / paid totals per company, client or project (optionally per month) in one query."""
+    parts = union_all(
+        _rollup_part(group_by, by_month, models.Invoice, models.Invoice.issue_date, models.Invoice.total,
+                     date_from, date_to, invoiced=True),
+        _rollup_part(group_by, by_month, models.Payment, models.Payment.payment_date, models.Payment.amount,
+                     date_from, date_to, invoiced=False),
+    ).subquery()
+    group = [parts.c.key] + ([parts.c.year, parts.c.month] if by_month else [])
+    stmt = (
+        select(*group, func.sum(parts.c.invoiced).label("invoiced"), func.sum(parts.c.paid).label("paid"))
+        .group_by(*group)
+        .order_by(*group)
+    )
+    return db.execute(stmt).all()
+
+
+class RollupTotals(NamedTuple):
+    key: int
+    year: int | None
+    month: int | None
+    invoiced: Decimal
+    paid: Decimal
+
+
+def _rollup_facts(group_by: str, by_month: bool, model, date_col, amount_col,
+                  date_from: date | None, date_to: date | None):
+    # The rows _rollup_part groups, with amounts as whole cents (ROUND: SQLite keeps NUMERIC as REAL)
+    key = model.project_id if group_by == "project" else getattr(models.Project, f"{group_by}_id")
+    cols = [key]
+    if by_month:
+        cols += [extract("year", date_col), extract("month", date_col)]
+    stmt = select(*cols, cast(func.round(amount_col * 100), BigInteger))
+    if group_by != "project":
+        stmt = stmt.join(models.Project, models.Project.id == model.project_id)
+    if date_from:
+        stmt = stmt.where(date_col >= date_from)
+    if date_to:
+        stmt = stmt.where(date_col <= date_to)
+    return stmt
+
+
+def _grouped_cents(db: Session, stmt, by_month: bool) -> tuple[np.ndarray, np.ndarray]:
+    result = db.execute(stmt).all()
+    width = 4 if by_month else 2
+    facts = np.fromiter(chain.from_iterable(result), dtype=np.int64, count=len(result) * width).reshape(-1, width)
+    # One int64 group code per row: key, then yyyymm in the low six digits
+    codes = facts[:, 0] * 1_000_000 + facts[:, 1] * 100 + facts[:, 2] if by_month else facts[:, 0]
+    return money.group_sum(codes, facts[:, -1])
+
+
+def rollup_vectorized(db: Session, group_by: str, by_month: bool = True,
+                      date_from: date | None = None, date_to: date | None = None) -> list[RollupTotals]:
+    """Same rows as rollup(), summed in NumPy over integer cents instead of by the database.
+
+    The database only filters and joins; the grouping is a sort plus int64 reduceat, exact like the
+    Decimal sums it replaces (benchmarks/money_benchmark.py checks both against a Decimal reference).
+    """
+    invoiced = _grouped_cents(db, _rollup_facts(group_by, by_month, models.Invoice, models.Invoice.issue_date,
+                                                models.Invoice.total, date_from, date_to), by_month)
+    paid = _grouped_cents(db, _rollup_facts(group_by, by_month, models.Payment, models.Payment.payment_date,
+                                            models.Payment.amount, date_from, date_to), by_month)
+    codes = np.union1d(invoiced[0], paid[0])
+    totals = np.zeros((2, len(codes)), dtype=np.int64)
+    for row, (part_codes, sums) in enumerate((invoiced, paid)):
+        totals[row, np.searchsorted(codes, part_codes)] = sums
+    rows = []
+    for code, invoiced_cents, paid_cents in zip(codes.tolist(), *totals.tolist()):
+        key, year, month = (code // 1_000_000, code // 100 % 10_000, code % 100) if by_month else (code, None, None)
+        rows.append(RollupTotals(key, year, month, money.from_cents(invoiced_cents), money.from_cents(paid_cents)))
+    return rows
@@ -1,27 +1,92 @@
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from .. import models
-from ..schemas import InvoiceCreate
+from ..core import events, fastjson, money
+from ..schemas import InvoiceCreate, InvoiceOut, BulkResult
+from . import bulk, changes, dashboard, numbering, related
+from .pagination import paginate
 
 
-def list_invoices(db: Session, client_id: int | None = None, project_id: int | None = None, status: str | None = None):
-    q = db.query(models.Invoice)
+# List endpoints select just the response columns and encode the rows with core.fastjson
+OUT_COLUMNS = fastjson.columns(models.Invoice, InvoiceOut)
+EXPANSIONS = {
+    "client": (models.Invoice.client,),
+    "project": (models.Invoice.project,),
+    "company": (models.Invoice.project, models.Project.company),
+}
+
+
+def list_invoices(db: Session, client_id: int | None = None, project_id: int | None = None, status: str | None = None,
+                  cursor: str | None = None, limit: int = 50, expand: str | None = None):
+    q = _filter(db.query(*OUT_COLUMNS), client_id, project_id, status)
+    q = related.join(q, EXPANSIONS, related.parse(expand, EXPANSIONS))
+    return paginate(q, models.Invoice.issue_date, models.Invoice.id, cursor, limit)
+
+
+def _filter(q, client_id: int | None, project_id: int | None, status: str | None):
     if client_id: q = q.filter(models.Invoice.client_id == client_id)
     if project_id: q = q.filter(models.Invoice.project_id == project_id)
     if status: q = q.filter(models.Invoice.status == status)
-    return q.order_by(models.Invoice.issue_date.desc()).all()
+    return q
+
+
+def export_invoices_query(client_id: int | None = None, project_id: int | None = None,
+                          status: str | None = None):
+    stmt = _filter(select(*models.Invoice.__table__.c), client_id, project_id, status)
+    return stmt.order_by(models.Invoice.issue_date.desc(), models.Invoice.id.desc())
 
 
 def create_invoice(db: Session, payload: InvoiceCreate):
-    obj = models.Invoice(**payload.dict())
+    values = payload.dict()
+    _prepare(db, [values])
+    obj = models.Invoice(**values)
     db.add(obj);
+    db.flush()
+    dashboard.record_invoice(db, obj.total)
+    changes.log(db, "invoices", [obj.id])
     db.commit();
     db.refresh(obj)
+    if events.broker:
+        company_id = db.scalar(select(models.Project.company_id).where(models.Project.id == obj.project_id))
+        events.publish(events.INVOICES, "invoice.created", company_id, InvoiceOut.model_validate(obj).model_dump())
+        events.publish(events.DASHBOARD, "dashboard.changed", None,
+                       {"total_invoices": 1, "total_amount": obj.total, "total_paid": 0})
     return obj
 
 
-def totals_for_dashboard(db: Session):
-    total_amount = db.query(func.coalesce(func.sum(models.Invoice.total), 0)).scalar()
-    total_paid = db.query(func.coalesce(func.sum(models.Payment.amount), 0)).scalar()
-    outstanding = float(total_amount) - float(total_paid)
-    return float(total_amount), float(total_paid), float(outstanding)
+
+def _prepare(db: Session, rows: list[dict]):
+    # Numbers first: numbering.fill must run before the session opens its transaction
+    numbering.fill(db, numbering.INVOICE, rows)
+    apply_gst(db, rows)
+
+
+def apply_gst(db: Session, rows: list[dict]):
+    """Fill tax and total of rows sent without tax, at the client's gst_percent (else the company's)."""
+    pending = [values for values in rows if values["tax"] is None]
+    if not pending:
+        return
+    c, co = models.Client, models.Company
+    rates = dict(db.execute(select(c.id, func.coalesce(c.gst_percent, co.gst_percent))
+                            .join(co, co.id == c.company_id)
+                            .where(c.id.in_({values["client_id"] for values in pending}))).all())
+    for values in pending:
+        values["tax"] = money.gst(values["subtotal"], rates.get(values["client_id"]))
+        values["total"] = values["subtotal"] + values["tax"]
+
+
+def bulk_create_invoices(db: Session, rows: list[tuple[int, dict]], result: BulkResult, chunk_size: int):
+    already, totals = len(result.created_ids), []
+
+    def record(db: Session, values: list[dict]):
+        dashboard.record_invoices(db, [v["total"] for v in values])
+        totals.extend(v["total"] for v in values)
+
+    bulk.bulk_create(db, InvoiceCreate, models.Invoice, "invoice_number", rows, result, chunk_size,
+                     on_insert=record, prepare=_prepare)
+    if events.broker and totals:
+        # Rows of any company: every subscriber of the topic hears about the import and refetches
+        events.publish(events.INVOICES, "invoices.imported", None, {"ids": result.created_ids[already:]})
+        events.publish(events.DASHBOARD, "dashboard.changed", None,
+                       {"total_invoices": len(totals), "total_amount": sum(totals), "total_paid": 0})
+    return result
@@ -0,0 +1,104 @@
+import threading
+from collections import deque
+from itertools import groupby
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.config import settings
+
+INVOICE, PAYMENT = "invoice", "payment"
+# kind -> (number column, date column the year comes from)
+FIELDS = {INVOICE: ("invoice_number", "issue_date"), PAYMENT: ("payment_number", "payment_date")}
+
+# (database, kind, company_id, year) -> reserved [start, end) ranges this process has not handed out yet
+_blocks: dict[tuple, deque] = {}
+_lock = threading.Lock()
+
+
+def _prefix(kind: str) -> str:
+    return settings.INVOICE_NUMBER_PREFIX if kind == INVOICE else settings.PAYMENT_NUMBER_PREFIX
+
+
+def fill(db: Session, kind: str, rows: list[dict]) -> None:
+    """Give every row without a number the next one in its company/year sequence, e.g. INV-3-2025-00042.
+
+    Call it before the session starts its transaction: lookups and block reservations run on their own
+    pooled connections, so a request never holds one connection while waiting for another.
+    """
+    field, date_field = FIELDS[kind]
+    missing = [values for values in rows if not values.get(field)]
+    if not missing:
+        return
+    engine = db.get_bind()
+    companies = _companies(engine, missing)
+    key = lambda v: (v.get("company_id") or companies.get(v["project_id"]) or 0, v[date_field].year)  # noqa: E731
+    for (company_id, year), group in groupby(sorted(missing, key=key), key=key):
+        group = list(group)
+        for values, n in zip(group, take(engine, kind, company_id, year, len(group))):
+            values[field] = f"{_prefix(kind)}-{company_id}-{year}-{n:05d}"
+
+
+def _companies(engine, rows: list[dict]) -> dict[int, int]:
+    project_ids = {v["project_id"] for v in rows if not v.get("company_id")}
+    if not project_ids:
+        return {}
+    p = models.Project
+    with engine.connect() as conn:
+        return dict(conn.execute(select(p.id, p.company_id).where(p.id.in_(project_ids))).all())
+
+
+def take(engine, kind: str, company_id: int, year: int, count: int) -> list[int]:
+    """`count` numbers from this process's reserved blocks, reserving more when they run out.
+
+    Blocks never overlap, so numbers are unique across workers; within a block they are handed out
+    in order without gaps. A block's unused tail is lost when the process exits (a gap between blocks),
+    and each worker fills its own block, so numbers follow creation order only within one worker.
+    """
+    key = (engine.url.render_as_string(), kind, company_id, year)
+    numbers = []
+    while True:
+        with _lock:
+            ranges = _blocks.setdefault(key, deque())
+            while ranges and len(numbers) < count:
+                start, end = ranges[0]
+                used = min(end - start, count - len(numbers))
+                numbers.extend(range(start, start + used))
+                if start + used == end:
+                    ranges.popleft()
+                else:
+                    ranges[0] = (start + used, end)
+        if len(numbers) == count:
+            return numbers
+        # Reserved outside the lock (the async driver may switch requests while it waits); a block
+        # reserved concurrently by another thread is simply queued behind this one
+        block = _reserve(engine, kind, company_id, year, max(settings.NUMBER_BLOCK_SIZE, count - len(numbers)))
+        with _lock:
+            _blocks[key].append(block)
+
+
+def _reserve(engine, kind: str, company_id: int, year: int, size: int) -> tuple[int, int]:
+    """Advance the sequence row by `size` in a short transaction of its own; returns [start, end)."""
+    s = models.NumberSequence
+    where = (s.kind == kind, s.company_id == company_id, s.year == year)
+    bump = update(s).where(*where).values(next_value=s.next_value + size)
+    with engine.begin() as conn:
+        if conn.execute(bump).rowcount == 0:
+            try:
+                with conn.begin_nested():
+                    conn.execute(insert(s).values(kind=kind, company_id=company_id, year=year,
+                                                  next_value=1 + size))
+                return 1, 1 + size
+            except IntegrityError:
+                # Another worker created the row first
+                conn.execute(bump)
+        end = conn.scalar(select(s.next_value).where(*where))
+    return end - size, end
+
+
+def reset() -> None:
+    """Forget reserved blocks (after the database has been recreated, e.g. in benchmarks)."""
+    with _lock:
+        _blocks.clear()
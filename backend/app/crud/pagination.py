@@ -0,0 +1,41 @@
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import DateTime, String, and_, literal, or_
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(sort_value: date, row_id: int) -> str:
+    raw = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_col):
+    parse = datetime.fromisoformat if isinstance(sort_col.type, DateTime) else date.fromisoformat
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, row_id = json.loads(raw)
+        return parse(value), int(row_id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+
+def paginate(query, sort_col, id_col, cursor: str | None, limit: int):
+    """Keyset page over (sort_col, id_col) descending. Returns (rows, next_cursor)."""
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_col)
+        if isinstance(value, datetime) and query.session.get_bind().dialect.name == "sqlite":
+            # SQLite keeps CURRENT_TIMESTAMP defaults as 'YYYY-MM-DD HH:MM:SS' text and compares text;
+            # a bound datetime ('... .000000') would never equal it and the cursor would not advance
+            value = literal(value.isoformat(sep=" "), String)
+        query = query.filter(or_(sort_col < value, and_(sort_col == value, id_col < row_id)))
+    rows = query.order_by(sort_col.desc(), id_col.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_col.key), getattr(last, id_col.key))
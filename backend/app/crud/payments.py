@@ -1,20 +1,83 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from .. import models
-from ..schemas import PaymentCreate
+from ..core import events, fastjson
+from ..schemas import PaymentCreate, PaymentOut, BulkResult
+from . import bulk, changes, dashboard, numbering, reconcile, related
+from .pagination import paginate
+
+
+# List endpoints select just the response columns and encode the rows with core.fastjson
+OUT_COLUMNS = fastjson.columns(models.Payment, PaymentOut)
+EXPANSIONS = {
+    "client": (models.Payment.client,),
+    "project": (models.Payment.project,),
+    "company": (models.Payment.company,),
+}
 
 
 def list_payments(db: Session, company_id: int | None = None, client_id: int | None = None,
-                  project_id: int | None = None):
-    q = db.query(models.Payment)
+                  project_id: int | None = None, cursor: str | None = None, limit: int = 50,
+                  expand: str | None = None):
+    q = _filter(db.query(*OUT_COLUMNS), company_id, client_id, project_id)
+    q = related.join(q, EXPANSIONS, related.parse(expand, EXPANSIONS))
+    return paginate(q, models.Payment.payment_date, models.Payment.id, cursor, limit)
+
+
+def _filter(q, company_id: int | None, client_id: int | None, project_id: int | None):
     if company_id: q = q.filter(models.Payment.company_id == company_id)
     if client_id: q = q.filter(models.Payment.client_id == client_id)
     if project_id: q = q.filter(models.Payment.project_id == project_id)
-    return q.order_by(models.Payment.payment_date.desc()).all()
+    return q
+
+
+def export_payments_query(company_id: int | None = None, client_id: int | None = None,
+                          project_id: int | None = None):
+    stmt = _filter(select(*models.Payment.__table__.c), company_id, client_id, project_id)
+    return stmt.order_by(models.Payment.payment_date.desc(), models.Payment.id.desc())
 
 
 def create_payment(db: Session, payload: PaymentCreate):
-    obj = models.Payment(**payload.dict())
+    values = payload.dict()
+    numbering.fill(db, numbering.PAYMENT, [values])
+    obj = models.Payment(**values)
     db.add(obj);
+    db.flush()
+    dashboard.record_payment(db, obj.amount)
+    reconcile.apply_payments(db, [(obj.invoice_id, obj.amount)])
+    changes.log(db, "payments", [obj.id])
     db.commit();
     db.refresh(obj)
+    if events.broker:
+        _publish_created(db, obj)
     return obj
+
+
+def _publish_created(db: Session, obj: models.Payment):
+    company_id = obj.company_id or db.scalar(
+        select(models.Project.company_id).where(models.Project.id == obj.project_id))
+    events.publish(events.PAYMENTS, "payment.created", company_id, PaymentOut.model_validate(obj).model_dump())
+    if obj.invoice_id:
+        i = models.Invoice
+        invoice = db.execute(select(i.id, i.status, i.amount_paid, i.balance).where(i.id == obj.invoice_id)).one()
+        events.publish(events.INVOICES, "invoice.updated", company_id, invoice._asdict())
+    events.publish(events.DASHBOARD, "dashboard.changed", None,
+                   {"total_invoices": 0, "total_amount": 0, "total_paid": obj.amount})
+
+
+def bulk_create_payments(db: Session, rows: list[tuple[int, dict]], result: BulkResult, chunk_size: int):
+    already, amounts = len(result.created_ids), []
+
+    def record(db: Session, values: list[dict]):
+        dashboard.record_payments(db, [v["amount"] for v in values])
+        reconcile.apply_payments(db, [(v["invoice_id"], v["amount"]) for v in values])
+        amounts.extend(v["amount"] for v in values)
+
+    bulk.bulk_create(db, PaymentCreate, models.Payment, "payment_number", rows, result, chunk_size,
+                     on_insert=record, prepare=lambda db, values: numbering.fill(db, numbering.PAYMENT, values))
+    if events.broker and amounts:
+        # Linked invoices changed too; subscribers refetch what they show
+        events.publish(events.PAYMENTS, "payments.imported", None, {"ids": result.created_ids[already:]})
+        events.publish(events.DASHBOARD, "dashboard.changed", None,
+                       {"total_invoices": 0, "total_amount": 0, "total_paid": sum(amounts)})
+    return result
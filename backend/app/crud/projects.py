@@ -1,23 +1,40 @@
 from sqlalchemy.orm import Session
 from .. import models
-from ..schemas import ProjectCreate
+from ..core import events, fastjson
+from ..schemas import ProjectCreate, ProjectOut
+from . import changes, related, search
+from .pagination import paginate
 
 
-def list_projects(db: Session, company_id: int | None = None, client_id: int | None = None, q: str | None = None):
-    query = db.query(models.Project)
+# List endpoints select just the response columns and encode the rows with core.fastjson
+OUT_COLUMNS = fastjson.columns(models.Project, ProjectOut)
+EXPANSIONS = {"client": (models.Project.client,), "company": (models.Project.company,)}
+
+
+def list_projects(db: Session, company_id: int | None = None, client_id: int | None = None, q: str | None = None,
+                  cursor: str | None = None, limit: int = 50, expand: str | None = None):
+    query = related.join(db.query(*OUT_COLUMNS), EXPANSIONS, related.parse(expand, EXPANSIONS))
     if company_id:
         query = query.filter(models.Project.company_id == company_id)
     if client_id:
         query = query.filter(models.Project.client_id == client_id)
     if q:
-        like = f"%{q}%"
-        query = query.filter(models.Project.name.ilike(like))
-    return query.order_by(models.Project.created_at.desc()).all()
+        query = query.filter(search.name_filter(db, "project", q))
+    return paginate(query, models.Project.created_at, models.Project.id, cursor, limit)
 
 
 def create_project(db: Session, payload: ProjectCreate):
     obj = models.Project(**payload.dict())
     db.add(obj);
+    db.flush()
+    changes.log(db, "projects", [obj.id])
     db.commit();
     db.refresh(obj)
+    search.note_created(db, "project")
+    if events.broker:
+        events.publish(events.PROJECTS, "project.created", obj.company_id, ProjectOut.model_validate(obj).model_dump())
     return obj
+
+
+def get_project(db: Session, project_id: int):
+    return db.query(models.Project).get(project_id)
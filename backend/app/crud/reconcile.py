@@ -0,0 +1,92 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from sqlalchemy import and_, bindparam, case, func, select, update
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core import events
+from ..schemas import ReconcileResult
+from . import changes, reports
+
+PAID = "paid"
+BATCH_SIZE = 500
+
+
+def _apply_stmt():
+    inv = models.Invoice.__table__
+    amount = bindparam("amount", type_=inv.c.amount_paid.type)
+    settled = and_(inv.c.balance - amount <= 0, inv.c.status.notin_(reports.EXCLUDED_STATUSES))
+    # status goes first: MySQL evaluates SET left to right against already-updated columns,
+    # other databases against the old row, so it must not read balance after balance changed.
+    return update(inv).where(inv.c.id == bindparam("invoice_id")).ordered_values(
+        (inv.c.status, case((settled, PAID), else_=inv.c.status)),
+        (inv.c.amount_paid, inv.c.amount_paid + amount),
+        (inv.c.balance, inv.c.balance - amount),
+    )
+
+
+def apply_payments(db: Session, payments: list[tuple[int, Decimal]]) -> None:
+    """Add (invoice_id, amount) pairs to the invoices' amount_paid/balance and mark settled ones paid.
+
+    Runs in the caller's transaction, one executemany for the whole batch.
+    """
+    per_invoice = defaultdict(Decimal)
+    for invoice_id, amount in payments:
+        if invoice_id is not None:
+            per_invoice[invoice_id] += Decimal(str(amount))
+    if per_invoice:
+        db.execute(_apply_stmt(), [{"invoice_id": i, "amount": a} for i, a in per_invoice.items()])
+        changes.log(db, "invoices", per_invoice)
+
+
+def auto_match(db: Session, batch_size: int = BATCH_SIZE) -> ReconcileResult:
+    """Link payments without an invoice to an open invoice of the same project (and client, when the
+    payment has one) whose balance equals the payment amount, oldest due date first.
+
+    Works through unlinked payments in id order, one batch (two reads, two executemany writes) and one
+    commit at a time. Partial payments are left for manual linking. Run one pass at a time.
+    """
+    pay, inv = models.Payment, models.Invoice
+    result = ReconcileResult(scanned=0, matched=0)
+    last_id = 0
+    while True:
+        batch = db.execute(
+            select(pay.id, pay.project_id, pay.client_id, pay.amount)
+            .where(pay.invoice_id.is_(None), pay.id > last_id).order_by(pay.id).limit(batch_size)
+        ).all()
+        if not batch:
+            if result.matched and events.broker:
+                events.publish(events.INVOICES, "invoices.reconciled", None, result.model_dump())
+            return result
+        last_id = batch[-1].id
+        result.scanned += len(batch)
+
+        candidates = db.execute(
+            select(inv.id, inv.project_id, inv.client_id, inv.balance)
+            .where(inv.project_id.in_({p.project_id for p in batch}), inv.balance > 0,
+                   inv.status.notin_(reports.EXCLUDED_STATUSES))
+            .order_by(func.coalesce(inv.due_date, inv.issue_date), inv.id)
+        ).all()
+        open_invoices = defaultdict(list)
+        for c in candidates:
+            open_invoices[(c.project_id, c.balance)].append(c)
+
+        links = []
+        for p in batch:
+            queue = open_invoices.get((p.project_id, p.amount), [])
+            for i, c in enumerate(queue):
+                if p.client_id is None or p.client_id == c.client_id:
+                    links.append((p.id, c.id, p.amount))
+                    del queue[i]
+                    break
+        if links:
+            t = pay.__table__
+            db.execute(update(t).where(t.c.id == bindparam("payment_id"), t.c.invoice_id.is_(None))
+                       .values(invoice_id=bindparam("linked_invoice_id")),
+                       [{"payment_id": p, "linked_invoice_id": i} for p, i, _ in links])
+            apply_payments(db, [(i, amount) for _, i, amount in links])
+            changes.log(db, "payments", [p for p, _, _ in links])
+            reports.recompute_lines(db, [i for _, i, _ in links])
+            result.matched += len(links)
+        db.commit()
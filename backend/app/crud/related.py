@@ -0,0 +1,31 @@
+from sqlalchemy.orm import aliased
+
+
+class InvalidExpand(ValueError):
+    pass
+
+
+def parse(expand: str | None, paths: dict) -> list[str]:
+    """`client,project` -> ["client", "project"], checked against the list's expandable relations."""
+    names = list(dict.fromkeys(n.strip() for n in (expand or "").split(",") if n.strip()))
+    unknown = [n for n in names if n not in paths]
+    if unknown:
+        raise InvalidExpand(f"Cannot expand {', '.join(unknown)}; choose from {', '.join(paths)}")
+    return names
+
+
+def join(query, paths: dict, names: list[str]):
+    """Outer-join each expanded relation and select its id/name as `<name>__id`/`<name>__name`.
+
+    `paths` maps a name to the relationship path from the listed model, e.g. (Invoice.project, Project.company).
+    Relations are many-to-one, so the page stays one query with one row per item whatever its size;
+    core.fastjson nests the labelled columns into `{"client": {"id": .., "name": ..}}`.
+    """
+    for name in names:
+        parent = None
+        for rel in paths[name]:
+            target = aliased(rel.property.mapper.class_)
+            query = query.outerjoin((getattr(parent, rel.key) if parent else rel).of_type(target))
+            parent = target
+        query = query.add_columns(parent.id.label(f"{name}__id"), parent.name.label(f"{name}__name"))
+    return query
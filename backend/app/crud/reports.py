@@ -0,0 +1,123 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import case, delete, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import models
+
+BUCKETS = ["current", "0-30", "31-60", "61-90", "90+"]
+# Never billed or written off: not receivables
+EXCLUDED_STATUSES = ("draft", "cancelled")
+STATE_ID = 1
+# Ids re-examined below the watermarks on every refresh, for rows that committed out of id order.
+# Re-applying them is harmless: lines are only inserted once and `paid` is recomputed, not added to.
+LOOKBACK = 200
+
+
+def _bucket(due_col, as_of: date):
+    return case(
+        (due_col > as_of, "current"),
+        (due_col >= as_of - timedelta(days=30), "0-30"),
+        (due_col >= as_of - timedelta(days=60), "31-60"),
+        (due_col >= as_of - timedelta(days=90), "61-90"),
+        else_="90+",
+    )
+
+
+def _paid_by_invoice():
+    p = models.Payment
+    stmt = select(p.invoice_id, func.sum(p.amount).label("paid")).where(p.invoice_id.isnot(None))
+    return stmt.group_by(p.invoice_id).subquery()
+
+
+def _open_invoices(invoice_ids=None):
+    """client/project/due/total/paid of every invoice still owed something (optionally restricted)."""
+    inv = models.Invoice
+    paid = _paid_by_invoice()
+    paid_sum = func.coalesce(paid.c.paid, 0)
+    stmt = (
+        select(inv.id.label("invoice_id"), inv.client_id, inv.project_id,
+               func.coalesce(inv.due_date, inv.issue_date).label("due_date"), inv.total, paid_sum.label("paid"))
+        .outerjoin(paid, paid.c.invoice_id == inv.id)
+        .where(inv.status.notin_(EXCLUDED_STATUSES), inv.total > paid_sum)
+    )
+    if invoice_ids is not None:
+        stmt = stmt.where(inv.id.in_(invoice_ids))
+    return stmt
+
+
+def _grouped(lines, as_of: date, group_by: str | None):
+    """One grouped query: invoice count and outstanding per bucket (and per client/project)."""
+    key = getattr(lines.c, f"{group_by}_id") if group_by else literal(None)
+    bucketed = select(key.label("key"), _bucket(lines.c.due_date, as_of).label("bucket"),
+                      (lines.c.total - lines.c.paid).label("outstanding")).subquery()
+    return (
+        select(bucketed.c.key, bucketed.c.bucket, func.count().label("invoices"),
+               func.sum(bucketed.c.outstanding).label("outstanding"))
+        .group_by(bucketed.c.key, bucketed.c.bucket)
+        .order_by(bucketed.c.key, bucketed.c.bucket)
+    )
+
+
+def aging_live(db: Session, as_of: date, group_by: str | None = None):
+    """Aging straight from invoices and payments (full scan); the snapshot path is `aging()`."""
+    return db.execute(_grouped(_open_invoices().subquery(), as_of, group_by)).all()
+
+
+def refresh_aging(db: Session) -> models.AgingState:
+    """Bring aging_lines up to date with invoices and payments added since the last refresh.
+
+    Invoices and payments are insert-only in this API, so the id watermarks capture every change.
+    """
+    inv, pay, line = models.Invoice, models.Payment, models.AgingLine
+    state = db.get(models.AgingState, STATE_ID)
+    invoice_max = db.execute(select(func.coalesce(func.max(inv.id), 0))).scalar_one()
+    payment_max = db.execute(select(func.coalesce(func.max(pay.id), 0))).scalar_one()
+    if state is not None and (state.invoice_watermark, state.payment_watermark) == (invoice_max, payment_max):
+        return state
+    cols = ["invoice_id", "client_id", "project_id", "due_date", "total", "paid"]
+    try:
+        if state is None:
+            db.execute(insert(line).from_select(cols, _open_invoices().where(inv.id <= invoice_max)))
+            state = models.AgingState(id=STATE_ID)
+            db.add(state)
+        else:
+            new_ids = (select(inv.id).where(inv.id > state.invoice_watermark - LOOKBACK, inv.id <= invoice_max)
+                       .where(inv.id.notin_(select(line.invoice_id))))
+            db.execute(insert(line).from_select(cols, _open_invoices(new_ids)))
+            recompute_lines(db, select(pay.invoice_id).where(pay.id > state.payment_watermark - LOOKBACK,
+                                                             pay.id <= payment_max, pay.invoice_id.isnot(None)))
+        state.invoice_watermark, state.payment_watermark = invoice_max, payment_max
+        state.refreshed_at = datetime.now()
+        db.commit()
+    except IntegrityError:
+        # A concurrent refresh (another worker) inserted the same lines first; use its result.
+        db.rollback()
+        state = db.get(models.AgingState, STATE_ID)
+    return state
+
+
+def recompute_lines(db: Session, invoice_ids) -> None:
+    """Re-sum `paid` for these invoices' lines (ids or a select of ids) and drop the settled ones.
+
+    Also used by crud.reconcile when it links older payments the id watermarks have already passed.
+    """
+    pay, line = models.Payment, models.AgingLine
+    paid = select(func.coalesce(func.sum(pay.amount), 0)).where(pay.invoice_id == line.invoice_id).scalar_subquery()
+    db.execute(update(line).where(line.invoice_id.in_(invoice_ids)).values(paid=paid)
+               .execution_options(synchronize_session=False))
+    db.execute(delete(line).where(line.paid >= line.total).execution_options(synchronize_session=False))
+
+
+def rebuild_aging(db: Session) -> models.AgingState:
+    db.execute(delete(models.AgingLine))
+    db.execute(delete(models.AgingState))
+    db.commit()
+    return refresh_aging(db)
+
+
+def aging(db: Session, as_of: date, group_by: str | None = None):
+    """(rows, refreshed_at): buckets from the incrementally refreshed snapshot of open invoices."""
+    refreshed_at = refresh_aging(db).refreshed_at
+    return db.execute(_grouped(models.AgingLine.__table__, as_of, group_by)).all(), refreshed_at
@@ -0,0 +1,213 @@
+import functools
+import math
+import re
+import threading
+from array import array
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.config import settings
+
+# Rows re-read below the watermark on every catch-up, for ids that committed out of order.
+LOOKBACK = 200
+# A row matches when it contains the query (case-insensitive, like the ILIKE filter this replaced) or
+# at least this share of its trigrams (one typo in a six-letter word still leaves more than half of them).
+MIN_COVERAGE = 0.5
+# Substring matches rank above every fuzzy-only match (coverage + similarity is at most 2)
+SUBSTRING_BONUS = 2.0
+
+_WORD = re.compile(r"[^\w]+")
+
+
+def normalize(text: str) -> str:
+    return _WORD.sub(" ", text.lower()).strip()
+
+
+def trigrams(text: str) -> set[str]:
+    # pg_trgm style: every word padded with two leading and one trailing space
+    grams = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def inner_trigrams(text: str) -> set[str]:
+    # Unpadded: present in any name that contains the text mid-word too
+    grams = set()
+    for word in normalize(text).split():
+        grams.update(word[i:i + 3] for i in range(len(word) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """In-process trigram index over one table's `name` column.
+
+    Rows are read in id order; `catch_up()` appends rows committed since the last call (by this
+    worker or any other), so every uvicorn worker converges on the same index without coordination.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.watermark = 0
+        self._ids: list[int] = []
+        self._names: list[str] = []
+        self._lowered: list[str] = []  # for substring matches
+        self._recent: set[int] = set()  # indexed ids inside the lookback window
+        # Arrays are what search() reads; rows added since then wait in the pending lists.
+        self._sizes = np.zeros(0, dtype=np.float32)
+        self._pending_sizes = array("f")
+        self._postings: dict[str, np.ndarray] = {}
+        self._pending: dict[str, array] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def catch_up(self, db: Session) -> int:
+        # Read without the lock: under AsyncSession.run_sync the query yields to the event loop.
+        t = self.model.__table__
+        rows = db.execute(select(t.c.id, t.c.name).where(t.c.id > self.watermark - LOOKBACK).order_by(t.c.id)).all()
+        added = 0
+        with self._lock:
+            floor = self.watermark - LOOKBACK
+            for row_id, name in rows:
+                if row_id > floor and row_id not in self._recent:
+                    self._add(row_id, name)
+                    added += 1
+            if rows:
+                self.watermark = max(self.watermark, rows[-1][0])
+                floor = self.watermark - LOOKBACK
+                self._recent = {i for i in self._recent if i > floor}
+        return added
+
+    def _add(self, row_id: int, name: str):
+        doc = len(self._ids)
+        grams = trigrams(name)
+        self._ids.append(row_id)
+        self._names.append(name)
+        self._lowered.append(name.lower())
+        self._recent.add(row_id)
+        self._pending_sizes.append(len(grams))
+        for gram in grams:
+            postings = self._pending.get(gram)
+            if postings is None:
+                postings = self._pending[gram] = array("i")
+            postings.append(doc)
+
+    def _flush(self):
+        if self._pending_sizes:
+            self._sizes = np.concatenate([self._sizes, np.frombuffer(self._pending_sizes, dtype=np.float32)])
+            self._pending_sizes = array("f")
+        for gram, docs in self._pending.items():
+            added = np.frombuffer(docs, dtype=np.int32)
+            self._postings[gram] = np.concatenate([self._postings[gram], added]) if gram in self._postings else added
+        self._pending = {}
+
+    def search(self, q: str, limit: int) -> list[tuple[int, str, float]]:
+        """Ranked (id, name, score): substring matches first, then trigram coverage + similarity,
+        boosted for prefix matches."""
+        needle = q.strip().lower()
+        if not needle:
+            return []
+        grams = trigrams(q)
+        query = normalize(q)
+        with self._lock:
+            self._flush()
+            substring = self._substring_matches(needle, inner_trigrams(q))
+            parts = [self._postings[g] for g in grams if g in self._postings]
+            if not parts and not len(substring):
+                return []
+            shared = np.bincount(np.concatenate(parts), minlength=len(self._ids)) if parts \
+                else np.zeros(len(self._ids), dtype=np.int64)
+            matched = shared >= max(1, math.ceil(MIN_COVERAGE * len(grams)))
+            matched[substring] = True
+            hits = np.flatnonzero(matched)
+            shared, size = shared[hits], max(len(grams), 1)
+            score = shared / size + shared / (size + self._sizes[hits] - shared)
+            score[np.isin(hits, substring)] += SUBSTRING_BONUS
+            if len(hits) > limit * 10:
+                top = np.argpartition(-score, limit * 10)[:limit * 10]
+                hits, score = hits[top], score[top]
+            ranked = []
+            for doc, base in zip(hits.tolist(), score.tolist()):
+                name = normalize(self._names[doc])
+                bonus = 1.0 if name.startswith(query) else 0.5 if f" {query}" in f" {name}" else 0.0
+                ranked.append((self._ids[doc], self._names[doc], round(base + bonus, 4)))
+        ranked.sort(key=lambda r: (-r[2], -r[0]))
+        return ranked[:limit]
+
+    def containing(self, q: str, limit: int) -> list[int] | None:
+        """Ids of every name containing `q` (case-insensitive, unranked); None when more than `limit` do."""
+        needle = q.lower()
+        with self._lock:
+            self._flush()
+            docs = self._substring_matches(needle, inner_trigrams(q))
+            if len(docs) > limit:
+                return None
+            return [self._ids[doc] for doc in docs.tolist()]
+
+    def _substring_matches(self, needle: str, inner: set[str]) -> np.ndarray:
+        if inner:
+            # Only names holding every inner trigram of the query can contain it
+            if any(g not in self._postings for g in inner):
+                return np.zeros(0, dtype=np.int64)
+            postings = sorted((self._postings[g] for g in inner), key=len)
+            docs = functools.reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), postings).tolist()
+        elif not _WORD.search(needle):
+            # One or two letters: a name contains them exactly when one of its trigrams does
+            mask = np.zeros(len(self._ids), dtype=bool)
+            for gram, docs in self._postings.items():
+                if needle in gram:
+                    mask[docs] = True
+            return np.flatnonzero(mask)
+        else:
+            docs = range(len(self._ids))
+        return np.array([doc for doc in docs if needle in self._lowered[doc]], dtype=np.int64)
+
+
+INDEXES = {
+    "company": TrigramIndex(models.Company),
+    "client": TrigramIndex(models.Client),
+    "project": TrigramIndex(models.Project),
+}
+
+
+def warm(db: Session) -> None:
+    """Build every index up front (one full read per table) so the first search doesn't pay for it."""
+    for index in INDEXES.values():
+        index.catch_up(db)
+
+
+def search(db: Session, q: str, types: list[str], limit: int) -> list[tuple[str, int, str, float]]:
+    hits = []
+    for kind in types:
+        index = INDEXES[kind]
+        index.catch_up(db)
+        hits.extend((kind, *hit) for hit in index.search(q, limit))
+    hits.sort(key=lambda h: -h[3])
+    return hits[:limit]
+
+
+def name_filter(db: Session, kind: str, q: str):
+    """WHERE clause for a list endpoint's `q`: names containing it, exactly what `ILIKE '%q%'` matches.
+
+    Up to SEARCH_MAX_MATCHES ids come from the index; past that the clause is the ILIKE itself, so scope
+    filters and the keyset cursor always see every match.
+    """
+    index = INDEXES[kind]
+    index.catch_up(db)
+    ids = index.containing(q, settings.SEARCH_MAX_MATCHES)
+    if ids is None:
+        return index.model.name.icontains(q, autoescape=True)
+    return index.model.id.in_(ids)
+
+
+def note_created(db: Session, kind: str) -> None:
+    """Index a just-committed row in this worker; other workers pick it up on their next catch-up."""
+    index = INDEXES[kind]
+    if index.watermark:  # not loaded yet: the first search builds the whole index
+        index.catch_up(db)
@@ -1,10 +1,10 @@
 from sqlalchemy.orm import Session
 from .. import models
-from ..schemas import UserCreate
 
 
-def create_user(db: Session, payload: UserCreate):
-    user = models.User(email=payload.email, password=payload.password)
+def create_user(db: Session, email: str, password_hash: str):
+    # Callers hash the password (core.security) outside the session so the event loop never runs scrypt.
+    user = models.User(email=email, password=password_hash)
     db.add(user);
     db.commit();
     db.refresh(user)
@@ -13,3 +13,12 @@ def create_user(db: Session, payload: UserCreate):
 
 def get_user_by_email(db: Session, email: str):
     return db.query(models.User).filter(models.User.email == email).first()
+
+
+def set_password_hash(db: Session, user_id: int, password_hash: str) -> None:
+    db.query(models.User).filter(models.User.id == user_id).update({models.User.password: password_hash})
+    db.commit()
+
+
+def get_unhashed_users(db: Session, scheme: str):
+    return db.query(models.User).filter(models.User.password.notlike(f"{scheme}$%")).all()
@@ -1,30 +1,169 @@
+from fastapi import Request
 from sqlalchemy import create_engine
-from sqlalchemy.engine import URL
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
+from starlette.concurrency import run_in_threadpool
 
 from .core.config import settings
+from .core.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument
+from .core.replicas import Replica, ReplicaSet, wants_primary
 
 # Create database URL with proper handling of special characters in password
-DATABASE_URL = URL.create(
-    drivername=settings.DB_DRIVERNAME,
-    username=settings.DB_USERNAME,
-    password=settings.DB_PASSWORD,
-    host=settings.DB_HOST,
-    port=settings.DB_PORT,
-    database=settings.DB_DATABASE
+if settings.DATABASE_URL:
+    DATABASE_URL = make_url(settings.DATABASE_URL)
+else:
+    DATABASE_URL = URL.create(
+        drivername=settings.DB_DRIVERNAME,
+        username=settings.DB_USERNAME,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        database=settings.DB_DATABASE
+    )
+
+if settings.DB_POOL_PRE_PING not in ("pessimistic", "optimistic"):
+    raise ValueError(f"DB_POOL_PRE_PING must be 'pessimistic' or 'optimistic', not {settings.DB_POOL_PRE_PING!r}")
+
+POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING == "pessimistic",
 )
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
+instrument(engine.pool)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional async engine (DB_ASYNC=true): same database through an asyncio driver.
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_ASYNC:
+    async_engine = create_async_engine(DATABASE_URL.set(drivername=settings.DB_ASYNC_DRIVERNAME),
+                                       poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS)
+    instrument(async_engine.sync_engine.pool)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+def _replica(number: int, url: str) -> Replica:
+    url = make_url(url)
+    sync_engine = create_engine(url, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
+    instrument(sync_engine.pool)
+    replica_async_engine = None
+    if settings.DB_ASYNC:
+        replica_async_engine = create_async_engine(url.set(drivername=settings.DB_ASYNC_DRIVERNAME),
+                                                   poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS)
+        instrument(replica_async_engine.sync_engine.pool)
+    return Replica(f"replica{number}", url.render_as_string(hide_password=True), sync_engine, replica_async_engine)
+
+
+# Read replicas (DB_REPLICA_URLS): GET endpoints take get_read_db, everything else the primary.
+replicas = ReplicaSet([_replica(i, u.strip()) for i, u in enumerate(settings.DB_REPLICA_URLS.split(","), start=1)
+                       if u.strip()], settings.DB_REPLICA_RETRY_SECONDS)
+
+AnySession = Session | AsyncSession
+
+
 class Base(DeclarativeBase):
     pass
 
-# Dependency
-def get_db():
+
+def _get_sync_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+
+async def _get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _pick_replica(request: Request) -> Replica | None:
+    if not replicas or wants_primary(request):
+        return None
+    return replicas.pick()
+
+
+def read_session(request: Request) -> AnySession:
+    """A new session on a healthy replica, or on the primary when the client is pinned or none is healthy."""
+    replica = _pick_replica(request)
+    if settings.DB_ASYNC:
+        return (AsyncSessionLocal(bind=replica.async_engine, info={"replica": replica}) if replica
+                else AsyncSessionLocal())
+    return SessionLocal(bind=replica.engine, info={"replica": replica}) if replica else SessionLocal()
+
+
+def _get_sync_read_db(request: Request):
+    db = read_session(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def _get_async_read_db(request: Request):
+    async with read_session(request) as db:
+        yield db
+
+
+# Dependencies: get_db is the primary; get_read_db a replica when one is healthy (reads only!)
+get_db = _get_async_db if settings.DB_ASYNC else _get_sync_db
+get_read_db = _get_async_read_db if settings.DB_ASYNC else _get_sync_read_db
+
+
+def fail_over(db: AnySession, exc: DBAPIError) -> bool:
+    """Whether `exc` means the replica behind `db` is unreachable. If so the replica is marked down and `db`
+    rebound to the primary; close the session before using it again."""
+    replica = db.info.get("replica")
+    if replica is None or not (exc.connection_invalidated or isinstance(exc, (OperationalError, InterfaceError))):
+        return False
+    replicas.mark_down(replica)
+    db.info.pop("replica")
+    if isinstance(db, AsyncSession):
+        db.bind, db.sync_session.bind = async_engine, async_engine.sync_engine
+    else:
+        db.bind = engine
+    return True
+
+
+async def run_db(db: AnySession, fn, *args, **kwargs):
+    """Call a sync CRUD function `fn(session, *args)` without blocking the event loop.
+
+    AsyncSession runs it on its asyncio connection via run_sync(); a plain Session runs it in the threadpool.
+    If `db` is a replica session and the replica is unreachable, it is marked down and `fn` reruns on the primary.
+    """
+    try:
+        if isinstance(db, AsyncSession):
+            return await db.run_sync(fn, *args, **kwargs)
+        return await run_in_threadpool(_call_and_release, fn, db, *args, **kwargs)
+    except DBAPIError as exc:
+        if not fail_over(db, exc):
+            raise
+    # The rest of the request reads from the primary too
+    if isinstance(db, AsyncSession):
+        await db.close()
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(_call_and_release, fn, db, *args, **kwargs)
+
+
+def _call_and_release(fn, db: Session, *args, **kwargs):
+    # Hand the connection back to the pool before leaving the worker thread; a request that
+    # held it across two threadpool hops could starve the threads other requests are blocked in.
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection (primary, async, replicas); called once when a worker shuts down."""
+    for sync_engine, engine_async in [(engine, async_engine), *((r.engine, r.async_engine) for r in replicas.replicas)]:
+        sync_engine.dispose()
+        if engine_async is not None:
+            await engine_async.dispose()
@@ -1,11 +1,39 @@
-from fastapi import FastAPI
+import logging
+import threading
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
 from .core.config import settings
-from .db import engine, Base
+from .core.idempotency import IdempotencyMiddleware
+from .core.metrics import MetricsMiddleware
+from . import startup
+from .crud.pagination import InvalidCursor
+from .crud.related import InvalidExpand
+from .core.replicas import READ_PRIMARY_HEADER, read_your_writes
+from .db import dispose_engines, replicas
+
+from .routers import (auth, companies, clients, projects, invoices, payments, dashboard, events, health, monitoring,
+                      reports, search, sync)
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    stop = threading.Event()
+    await startup.start(stop)
+    yield
+    stop.set()
+    await dispose_engines()
+
 
-from .routers import auth, companies, clients, projects, invoices, payments, dashboard
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 
-app = FastAPI(title=settings.APP_NAME)
+# Inside CORS, so replayed responses get the CORS headers too
+app.add_middleware(IdempotencyMiddleware)
 
 # CORS
 origins = [o.strip() for o in settings.BACKEND_CORS_ORIGINS.split(",")] if settings.BACKEND_CORS_ORIGINS else ["*"]
@@ -15,10 +43,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Read by the Flutter web build to pin its reads to the primary after a write
+    expose_headers=[READ_PRIMARY_HEADER],
 )
 
-# Ensure metadata is in sync (does NOT create tables if they already exist in MySQL)
-Base.metadata.create_all(bind=engine)
+if replicas and settings.DB_READ_YOUR_WRITES_SECONDS > 0:
+    app.middleware("http")(read_your_writes)
+
+# Outermost, so the timings include the other middleware
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(InvalidCursor)
+@app.exception_handler(InvalidExpand)
+def invalid_query_handler(request: Request, exc: ValueError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(IntegrityError)
+def integrity_error_handler(request: Request, exc: IntegrityError):
+    # e.g. a duplicate invoice_number or a missing client/project, instead of a 500. The driver message
+    # names tables, columns and constraints: log it, don't send it
+    logger.warning("integrity error on %s %s: %s", request.method, request.url.path, exc.orig)
+    return JSONResponse(status_code=409, content={"detail": "Conflicts with existing data: a duplicate value "
+                                                            "or a reference to a missing record"})
 
 
 @app.get("/")
@@ -34,3 +83,11 @@ app.include_router(projects.router)
 app.include_router(invoices.router)
 app.include_router(payments.router)
 app.include_router(dashboard.router)
+app.include_router(reports.router)
+app.include_router(search.router)
+app.include_router(events.router)
+app.include_router(sync.router)
+app.include_router(health.router)
+app.include_router(monitoring.router)
+if settings.METRICS_ENABLED:
+    app.include_router(monitoring.metrics_router)
@@ -0,0 +1,41 @@
+from functools import cache
+from pathlib import Path
+
+from sqlalchemy.engine import Engine
+
+from .db import engine
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+
+# Alembic is imported on first use: workers that only check the revision do so after startup,
+# off the import path every worker pays for.
+
+
+def alembic_config():
+    from alembic.config import Config
+    cfg = Config()
+    cfg.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return cfg
+
+
+def upgrade(bind: Engine = engine, revision: str = "head") -> None:
+    """Apply pending migrations up to `revision` on `bind`."""
+    from alembic import command
+    cfg = alembic_config()
+    with bind.begin() as connection:
+        cfg.attributes["connection"] = connection
+        command.upgrade(cfg, revision)
+
+
+@cache
+def head() -> str:
+    """Newest revision in app/migrations."""
+    from alembic.script import ScriptDirectory
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current(bind: Engine = engine) -> str | None:
+    """Revision the database is at (None before the first migration)."""
+    from alembic.runtime.migration import MigrationContext
+    with bind.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
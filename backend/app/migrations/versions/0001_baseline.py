@@ -0,0 +1,102 @@
+"""baseline schema (tables previously created by Base.metadata.create_all)
+
+Revision ID: 0001
+Revises:
+Create Date: 2024-10-20
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+BigIntPK = sa.BigInteger().with_variant(sa.Integer(), "sqlite")
+
+
+def upgrade():
+    # Databases bootstrapped by the old startup create_all already have these tables.
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", BigIntPK, primary_key=True, autoincrement=True),
+            sa.Column("email", sa.String(255), nullable=False, unique=True),
+            sa.Column("password", sa.String(255), nullable=False),
+            sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+        )
+    if "companies" not in existing:
+        op.create_table(
+            "companies",
+            sa.Column("id", BigIntPK, primary_key=True, autoincrement=True),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("address", sa.Text),
+            sa.Column("gst_percent", sa.Integer),
+            sa.Column("created_by", sa.BigInteger, sa.ForeignKey("users.id")),
+            sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+        )
+    if "clients" not in existing:
+        op.create_table(
+            "clients",
+            sa.Column("id", BigIntPK, primary_key=True, autoincrement=True),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("address", sa.Text),
+            sa.Column("gst_percent", sa.Integer),
+            sa.Column("created_by", sa.BigInteger, sa.ForeignKey("users.id")),
+            sa.Column("company_id", sa.BigInteger, sa.ForeignKey("companies.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+        )
+    if "projects" not in existing:
+        op.create_table(
+            "projects",
+            sa.Column("id", BigIntPK, primary_key=True, autoincrement=True),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("address", sa.Text),
+            sa.Column("status", sa.String(50)),
+            sa.Column("notes", sa.Text),
+            sa.Column("created_by", sa.BigInteger, sa.ForeignKey("users.id")),
+            sa.Column("company_id", sa.BigInteger, sa.ForeignKey("companies.id"), nullable=False),
+            sa.Column("client_id", sa.BigInteger, sa.ForeignKey("clients.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+        )
+    if "invoices" not in existing:
+        op.create_table(
+            "invoices",
+            sa.Column("id", BigIntPK, primary_key=True, autoincrement=True),
+            sa.Column("invoice_number", sa.String(32), nullable=False, unique=True),
+            sa.Column("client_id", sa.BigInteger, sa.ForeignKey("clients.id"), nullable=False),
+            sa.Column("project_id", sa.BigInteger, sa.ForeignKey("projects.id"), nullable=False),
+            sa.Column("issue_date", sa.Date, nullable=False),
+            sa.Column("due_date", sa.Date),
+            sa.Column("status", sa.String(20), nullable=False),
+            sa.Column("currency", sa.String(10), nullable=False),
+            sa.Column("subtotal", sa.Numeric(12, 2), nullable=False),
+            sa.Column("tax", sa.Numeric(12, 2), nullable=False),
+            sa.Column("total", sa.Numeric(12, 2), nullable=False),
+            sa.Column("notes", sa.Text),
+            sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+        )
+    if "payments" not in existing:
+        op.create_table(
+            "payments",
+            sa.Column("id", BigIntPK, primary_key=True, autoincrement=True),
+            sa.Column("payment_number", sa.String(32), nullable=False, unique=True),
+            sa.Column("invoice_id", sa.BigInteger, sa.ForeignKey("invoices.id")),
+            sa.Column("project_id", sa.BigInteger, sa.ForeignKey("projects.id"), nullable=False),
+            sa.Column("client_id", sa.BigInteger, sa.ForeignKey("clients.id")),
+            sa.Column("company_id", sa.BigInteger, sa.ForeignKey("companies.id")),
+            sa.Column("amount", sa.Numeric(12, 2), nullable=False),
+            sa.Column("payment_date", sa.Date, nullable=False),
+            sa.Column("method", sa.String(20)),
+            sa.Column("bank", sa.String(100)),
+            sa.Column("transaction_no", sa.String(100)),
+            sa.Column("notes", sa.Text),
+            sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+        )
+
+
+def downgrade():
+    for table in ("payments", "invoices", "projects", "clients", "companies", "users"):
+        op.drop_table(table)
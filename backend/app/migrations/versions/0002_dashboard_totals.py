@@ -0,0 +1,30 @@
+"""dashboard_totals running aggregates
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-10-21
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table("dashboard_totals"):
+        return
+    op.create_table(
+        "dashboard_totals",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("invoice_count", sa.BigInteger, nullable=False),
+        sa.Column("total_amount", sa.Numeric(16, 2), nullable=False),
+        sa.Column("total_paid", sa.Numeric(16, 2), nullable=False),
+        sa.Column("updated_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+    )
+
+
+def downgrade():
+    op.drop_table("dashboard_totals")
@@ -0,0 +1,44 @@
+"""composite indexes for list filters and keyset sort orders
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-10-22
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns) -- each matches a WHERE <filter> ORDER BY <sort> DESC, id DESC in app/crud
+INDEXES = [
+    ("ix_companies_created", "companies", ["created_at", "id"]),
+    ("ix_clients_created", "clients", ["created_at", "id"]),
+    ("ix_clients_company_created", "clients", ["company_id", "created_at", "id"]),
+    ("ix_projects_created", "projects", ["created_at", "id"]),
+    ("ix_projects_company_created", "projects", ["company_id", "created_at", "id"]),
+    ("ix_projects_client_created", "projects", ["client_id", "created_at", "id"]),
+    ("ix_invoices_issue", "invoices", ["issue_date", "id"]),
+    ("ix_invoices_client_issue", "invoices", ["client_id", "issue_date", "id"]),
+    ("ix_invoices_project_issue", "invoices", ["project_id", "issue_date", "id"]),
+    ("ix_invoices_status_issue", "invoices", ["status", "issue_date", "id"]),
+    ("ix_payments_date", "payments", ["payment_date", "id"]),
+    ("ix_payments_company_date", "payments", ["company_id", "payment_date", "id"]),
+    ("ix_payments_client_date", "payments", ["client_id", "payment_date", "id"]),
+    ("ix_payments_project_date", "payments", ["project_id", "payment_date", "id"]),
+    ("ix_payments_invoice", "payments", ["invoice_id"]),
+]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if name not in {ix["name"] for ix in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,39 @@
+"""aging snapshot tables for /reports/aging
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-11-04
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "aging_lines",
+        sa.Column("invoice_id", sa.BigInteger, sa.ForeignKey("invoices.id"), primary_key=True, autoincrement=False),
+        sa.Column("client_id", sa.BigInteger, nullable=False),
+        sa.Column("project_id", sa.BigInteger, nullable=False),
+        sa.Column("due_date", sa.Date, nullable=False),
+        sa.Column("total", sa.Numeric(12, 2), nullable=False),
+        sa.Column("paid", sa.Numeric(12, 2), nullable=False),
+    )
+    op.create_index("ix_aging_lines_due", "aging_lines", ["due_date"])
+    op.create_table(
+        "aging_state",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("invoice_watermark", sa.BigInteger, nullable=False),
+        sa.Column("payment_watermark", sa.BigInteger, nullable=False),
+        sa.Column("refreshed_at", sa.DateTime, nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("aging_state")
+    op.drop_index("ix_aging_lines_due", table_name="aging_lines")
+    op.drop_table("aging_lines")
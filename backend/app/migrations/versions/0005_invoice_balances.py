@@ -0,0 +1,35 @@
+"""invoices.amount_paid / invoices.balance, backfilled from linked payments
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-11-12
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("invoices", sa.Column("amount_paid", sa.Numeric(12, 2), nullable=False, server_default="0"))
+    op.add_column("invoices", sa.Column("balance", sa.Numeric(12, 2), nullable=True))
+
+    invoices = sa.table("invoices", sa.column("id"), sa.column("total"), sa.column("amount_paid"),
+                        sa.column("balance"))
+    payments = sa.table("payments", sa.column("invoice_id"), sa.column("amount"))
+    paid = (sa.select(sa.func.coalesce(sa.func.sum(payments.c.amount), 0))
+            .where(payments.c.invoice_id == invoices.c.id).scalar_subquery())
+    op.execute(invoices.update().values(amount_paid=paid))
+    op.execute(invoices.update().values(balance=invoices.c.total - invoices.c.amount_paid))
+
+    with op.batch_alter_table("invoices") as batch:
+        batch.alter_column("balance", existing_type=sa.Numeric(12, 2), nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table("invoices") as batch:
+        batch.drop_column("balance")
+        batch.drop_column("amount_paid")
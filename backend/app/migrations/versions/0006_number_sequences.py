@@ -0,0 +1,27 @@
+"""number_sequences for server-allocated invoice/payment numbers
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2024-11-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "number_sequences",
+        sa.Column("kind", sa.String(20), primary_key=True),
+        sa.Column("company_id", sa.BigInteger, primary_key=True, autoincrement=False),
+        sa.Column("year", sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column("next_value", sa.BigInteger, nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("number_sequences")
@@ -0,0 +1,34 @@
+"""change_log behind GET /sync, backfilled with one change per existing row
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2024-11-22
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+BigIntPK = sa.BigInteger().with_variant(sa.Integer(), "sqlite")
+ENTITIES = ["companies", "clients", "projects", "invoices", "payments"]
+
+
+def upgrade():
+    change_log = op.create_table(
+        "change_log",
+        sa.Column("id", BigIntPK, primary_key=True, autoincrement=True),
+        sa.Column("entity", sa.String(20), nullable=False),
+        sa.Column("entity_id", sa.BigInteger, nullable=False),
+        sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+    )
+    for entity in ENTITIES:
+        table = sa.table(entity, sa.column("id"))
+        op.execute(change_log.insert().from_select(["entity", "entity_id"],
+                                                   sa.select(sa.literal(entity), table.c.id).order_by(table.c.id)))
+
+
+def downgrade():
+    op.drop_table("change_log")
@@ -0,0 +1,35 @@
+"""Seed the dashboard_totals row, so GET /dashboard/summary never has to write it (it may read a replica)
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2024-11-26
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+TOTALS_ID = 1
+
+
+def upgrade():
+    totals = sa.table("dashboard_totals", sa.column("id"), sa.column("invoice_count"),
+                      sa.column("total_amount"), sa.column("total_paid"))
+    invoices = sa.table("invoices", sa.column("total"))
+    payments = sa.table("payments", sa.column("amount"))
+    bind = op.get_bind()
+    if bind.execute(sa.select(totals.c.id).where(totals.c.id == TOTALS_ID)).first() is not None:
+        return
+    invoice_count, total_amount = bind.execute(
+        sa.select(sa.func.count(), sa.func.coalesce(sa.func.sum(invoices.c.total), 0))).one()
+    total_paid = bind.execute(sa.select(sa.func.coalesce(sa.func.sum(payments.c.amount), 0))).scalar_one()
+    op.execute(totals.insert().values(id=TOTALS_ID, invoice_count=invoice_count,
+                                      total_amount=total_amount, total_paid=total_paid))
+
+
+def downgrade():
+    # The row is data the app maintains from here on; leave it
+    pass
@@ -0,0 +1,28 @@
+"""Hash the passwords still stored in plaintext (login no longer accepts them)
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2024-11-27
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    from app.core.security import hash_password, is_hashed
+
+    users = sa.table("users", sa.column("id"), sa.column("password"))
+    bind = op.get_bind()
+    for user_id, password in bind.execute(sa.select(users.c.id, users.c.password)).all():
+        if not is_hashed(password):
+            bind.execute(users.update().where(users.c.id == user_id).values(password=hash_password(password)))
+
+
+def downgrade():
+    # Hashes can't be turned back into passwords
+    pass
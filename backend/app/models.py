@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Integer, String, Text, Date, DateTime, ForeignKey, Numeric
+from sqlalchemy import Column, BigInteger, Integer, String, Text, Date, DateTime, ForeignKey, Numeric, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime, date
@@ -6,43 +6,68 @@ from decimal import Decimal
 
 from .db import Base
 
+# BIGINT primary keys, but INTEGER on SQLite so ROWID autoincrement works for local runs/benchmarks
+BigIntPK = BigInteger().with_variant(Integer, "sqlite")
+
+# Relationships are lazy="raise": related rows are joined in explicitly (crud.related, or
+# selectinload/joinedload options), never fetched one row at a time on attribute access.
+
+
+def _initial_balance(context):
+    # New invoices owe their full total (also applied per row in bulk executemany inserts)
+    return context.get_current_parameters()["total"]
+
 
 # USERS
 class User(Base):
     __tablename__ = "users"
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     password: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.current_timestamp())
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.current_timestamp())
 
 
 # COMPANIES
 class Company(Base):
     __tablename__ = "companies"
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    __table_args__ = (
+        Index("ix_companies_created", "created_at", "id"),
+    )
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     address: Mapped[str | None] = mapped_column(Text)
     gst_percent: Mapped[int | None] = mapped_column(Integer)
     created_by: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("users.id"))
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.current_timestamp())
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.current_timestamp())
 
 
 # CLIENTS
 class Client(Base):
     __tablename__ = "clients"
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    __table_args__ = (
+        Index("ix_clients_created", "created_at", "id"),
+        Index("ix_clients_company_created", "company_id", "created_at", "id"),
+    )
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     address: Mapped[str | None] = mapped_column(Text)
     gst_percent: Mapped[int | None] = mapped_column(Integer)
     created_by: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("users.id"))
     company_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("companies.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.current_timestamp())
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.current_timestamp())
+
+    company: Mapped["Company"] = relationship(lazy="raise")
 
 
 # PROJECTS
 class Project(Base):
     __tablename__ = "projects"
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    __table_args__ = (
+        Index("ix_projects_created", "created_at", "id"),
+        Index("ix_projects_company_created", "company_id", "created_at", "id"),
+        Index("ix_projects_client_created", "client_id", "created_at", "id"),
+    )
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     address: Mapped[str | None] = mapped_column(Text)
     status: Mapped[str | None] = mapped_column(String(50))
@@ -50,13 +75,22 @@ class Project(Base):
     created_by: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("users.id"))
     company_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("companies.id"), nullable=False)
     client_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("clients.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.current_timestamp())
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.current_timestamp())
+
+    company: Mapped["Company"] = relationship(lazy="raise")
+    client: Mapped["Client"] = relationship(lazy="raise")
 
 
 # INVOICES
 class Invoice(Base):
     __tablename__ = "invoices"
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    __table_args__ = (
+        Index("ix_invoices_issue", "issue_date", "id"),
+        Index("ix_invoices_client_issue", "client_id", "issue_date", "id"),
+        Index("ix_invoices_project_issue", "project_id", "issue_date", "id"),
+        Index("ix_invoices_status_issue", "status", "issue_date", "id"),
+    )
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True)
     invoice_number: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
     client_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("clients.id"), nullable=False)
     project_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("projects.id"), nullable=False)
@@ -68,13 +102,26 @@ class Invoice(Base):
     tax: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
     total: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
     notes: Mapped[str | None] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.current_timestamp())
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.current_timestamp())
+    # Maintained by crud.reconcile as payments are linked (never summed per request)
+    amount_paid: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0, server_default="0")
+    balance: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=_initial_balance)
+
+    client: Mapped["Client"] = relationship(lazy="raise")
+    project: Mapped["Project"] = relationship(lazy="raise")
 
 
 # PAYMENTS
 class Payment(Base):
     __tablename__ = "payments"
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    __table_args__ = (
+        Index("ix_payments_date", "payment_date", "id"),
+        Index("ix_payments_company_date", "company_id", "payment_date", "id"),
+        Index("ix_payments_client_date", "client_id", "payment_date", "id"),
+        Index("ix_payments_project_date", "project_id", "payment_date", "id"),
+        Index("ix_payments_invoice", "invoice_id"),
+    )
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True)
     payment_number: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
     invoice_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("invoices.id"))
     project_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("projects.id"), nullable=False)
@@ -86,4 +133,61 @@ class Payment(Base):
     bank: Mapped[str | None] = mapped_column(String(100))
     transaction_no: Mapped[str | None] = mapped_column(String(100))
     notes: Mapped[str | None] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.current_timestamp())
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.current_timestamp())
+
+    invoice: Mapped["Invoice | None"] = relationship(lazy="raise")
+    project: Mapped["Project"] = relationship(lazy="raise")
+    client: Mapped["Client | None"] = relationship(lazy="raise")
+    company: Mapped["Company | None"] = relationship(lazy="raise")
+
+
+# DASHBOARD TOTALS (single row, maintained by create_invoice/create_payment)
+class DashboardTotals(Base):
+    __tablename__ = "dashboard_totals"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    invoice_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False, default=0)
+    total_paid: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.current_timestamp(),
+                                                 onupdate=func.current_timestamp())
+
+
+# NUMBER SEQUENCES (invoice/payment numbers per company and year, reserved in blocks by crud.numbering)
+class NumberSequence(Base):
+    __tablename__ = "number_sequences"
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    company_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    next_value: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+# CHANGE LOG (one row per created/updated row, written by the CRUD layer; ids are the /sync tokens)
+class ChangeLog(Base):
+    __tablename__ = "change_log"
+    id: Mapped[int] = mapped_column(BigIntPK, primary_key=True, autoincrement=True)
+    entity: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.current_timestamp())
+
+
+# AGING SNAPSHOT (open invoices only, refreshed incrementally by crud.reports.refresh_aging)
+class AgingLine(Base):
+    __tablename__ = "aging_lines"
+    __table_args__ = (
+        Index("ix_aging_lines_due", "due_date"),
+    )
+    invoice_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("invoices.id"), primary_key=True,
+                                            autoincrement=False)
+    client_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    project_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    due_date: Mapped[date] = mapped_column(Date, nullable=False)
+    total: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    paid: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+
+
+class AgingState(Base):
+    __tablename__ = "aging_state"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    invoice_watermark: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    payment_watermark: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
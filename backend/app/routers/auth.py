@@ -1,19 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from ..db import get_db
+from ..core.security import create_token, get_current_user, hash_password_async, needs_rehash, verify_password_async
+from ..db import AnySession, get_db, run_db
 from ..crud import users as crud_users
-from ..schemas import UserOut
+from ..schemas import AuthUser, UserOut
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
 @router.post("/login", response_model=dict)
-def login(payload: dict, db: Session = Depends(get_db)):
+async def login(payload: dict, db: AnySession = Depends(get_db)):
     email = payload.get("email");
     password = payload.get("password")
     if not email or not password:
         raise HTTPException(status_code=400, detail="Email and password required")
-    user = crud_users.get_user_by_email(db, email=email)
-    if not user or user.password != password:
+    user = await run_db(db, crud_users.get_user_by_email, email=email)
+    if not user or not await verify_password_async(password, user.password):
         raise HTTPException(status_code=400, detail="Invalid credentials")
-    return {"success": True, "user": UserOut.model_validate(user)}
+    if needs_rehash(user.password):
+        await run_db(db, crud_users.set_password_hash, user.id, await hash_password_async(password))
+    return {
+        "success": True,
+        "user": UserOut.model_validate(user),
+        "access_token": create_token(user.id, user.email),
+        "token_type": "bearer",
+    }
+
+
+@router.get("/me", response_model=AuthUser)
+async def me(claims: dict = Depends(get_current_user)):
+    return AuthUser(id=claims["sub"], email=claims["email"], expires_at=claims["exp"])
@@ -1,17 +1,38 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..db import get_db
-from ..schemas import ClientCreate, ClientOut
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from ..core import cache, fastjson
+from ..core.config import settings
+from ..db import AnySession, get_db, get_read_db, run_db
+from ..schemas import ClientCreate, ClientOut, Page
 from ..crud import clients as crud
 
 router = APIRouter(prefix="/clients", tags=["Clients"])
 
 
-@router.get("/", response_model=list[ClientOut])
-def list_clients(company_id: int | None = None, q: str | None = None, db: Session = Depends(get_db)):
-    return [ClientOut.model_validate(c) for c in crud.list_clients(db, company_id, q)]
+@router.get("/", response_model=Page[ClientOut])
+async def list_clients(request: Request,
+                       company_id: int | None = None, q: str | None = None, cursor: str | None = None,
+                       limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+                       db: AnySession = Depends(get_read_db)):
+    async def produce():
+        rows, next_cursor = await run_db(db, crud.list_clients, company_id, q, cursor, limit)
+        return fastjson.page(rows, next_cursor)
+
+    return await cache.cached(request, cache.CLIENTS, produce)
 
 
 @router.post("/", response_model=ClientOut)
-def create_client(payload: ClientCreate, db: Session = Depends(get_db)):
-    return ClientOut.model_validate(crud.create_client(db, payload))
+async def create_client(payload: ClientCreate, db: AnySession = Depends(get_db)):
+    obj = ClientOut.model_validate(await run_db(db, crud.create_client, payload))
+    await cache.invalidate(cache.CLIENTS)
+    return obj
+
+
+@router.get("/{client_id}", response_model=ClientOut)
+async def get_client(client_id: int, request: Request, db: AnySession = Depends(get_read_db)):
+    async def produce():
+        obj = await run_db(db, crud.get_client, client_id)
+        if obj is None:
+            raise HTTPException(status_code=404, detail="Client not found")
+        return ClientOut.model_validate(obj)
+
+    return await cache.cached(request, cache.CLIENTS, produce)
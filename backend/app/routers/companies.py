@@ -1,17 +1,38 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..db import get_db
-from ..schemas import CompanyCreate, CompanyOut
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from ..core import cache, fastjson
+from ..core.config import settings
+from ..db import AnySession, get_db, get_read_db, run_db
+from ..schemas import CompanyCreate, CompanyOut, Page
 from ..crud import companies as crud
 
 router = APIRouter(prefix="/companies", tags=["Companies"])
 
 
-@router.get("/", response_model=list[CompanyOut])
-def list_companies(q: str | None = None, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return [CompanyOut.model_validate(c) for c in crud.list_companies(db, q, skip, limit)]
+@router.get("/", response_model=Page[CompanyOut])
+async def list_companies(request: Request,
+                         q: str | None = None, cursor: str | None = None,
+                         limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+                         db: AnySession = Depends(get_read_db)):
+    async def produce():
+        rows, next_cursor = await run_db(db, crud.list_companies, q, cursor, limit)
+        return fastjson.page(rows, next_cursor)
+
+    return await cache.cached(request, cache.COMPANIES, produce)
 
 
 @router.post("/", response_model=CompanyOut)
-def create_company(payload: CompanyCreate, db: Session = Depends(get_db)):
-    return CompanyOut.model_validate(crud.create_company(db, payload))
+async def create_company(payload: CompanyCreate, db: AnySession = Depends(get_db)):
+    obj = CompanyOut.model_validate(await run_db(db, crud.create_company, payload))
+    await cache.invalidate(cache.COMPANIES)
+    return obj
+
+
+@router.get("/{company_id}", response_model=CompanyOut)
+async def get_company(company_id: int, request: Request, db: AnySession = Depends(get_read_db)):
+    async def produce():
+        obj = await run_db(db, crud.get_company, company_id)
+        if obj is None:
+            raise HTTPException(status_code=404, detail="Company not found")
+        return CompanyOut.model_validate(obj)
+
+    return await cache.cached(request, cache.COMPANIES, produce)
@@ -1,59 +1,46 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from ..db import get_db
-from .. import models
-from ..crud.invoices import totals_for_dashboard
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Request
+from ..core import cache, fastjson
+from ..core.config import settings
+from ..db import AnySession, get_read_db, run_db
+from ..crud import dashboard as crud
+from ..schemas import RollupRow
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
 @router.get("/summary")
-def summary(db: Session = Depends(get_db)):
-    total_amount, total_paid, outstanding = totals_for_dashboard(db)
-
-    recent_invoices = db.query(models.Invoice).order_by(desc(models.Invoice.issue_date)).limit(3).all()
-    recent_payments = db.query(models.Payment).order_by(desc(models.Payment.payment_date)).limit(3).all()
-
-    invoices = [{
-        "id": x.id,
-        "invoice_number": x.invoice_number,
-        "client_id": x.client_id,
-        "project_id": x.project_id,
-        "issue_date": x.issue_date.isoformat(),
-        "due_date": x.due_date.isoformat() if x.due_date else None,
-        "status": x.status,
-        "currency": x.currency,
-        "subtotal": float(x.subtotal),
-        "tax": float(x.tax),
-        "total": float(x.total),
-        "notes": x.notes,
-        "created_at": x.created_at.isoformat() if x.created_at else None,
-    } for x in recent_invoices]
-
-    payments = [{
-        "id": p.id,
-        "payment_number": p.payment_number,
-        "invoice_id": p.invoice_id,
-        "project_id": p.project_id,
-        "client_id": p.client_id,
-        "company_id": p.company_id,
-        "amount": float(p.amount),
-        "payment_date": p.payment_date.isoformat(),
-        "method": p.method,
-        "bank": p.bank,
-        "transaction_no": p.transaction_no,
-        "notes": p.notes,
-        "created_at": p.created_at.isoformat() if p.created_at else None,
-    } for p in recent_payments]
-
-    return {
+async def summary(request: Request, db: AnySession = Depends(get_read_db)):
+    return await cache.cached(request, cache.DASHBOARD, lambda: _summary(db))
+
+
+async def _summary(db: AnySession) -> bytes:
+    totals = await run_db(db, crud.get_totals)
+    recent_invoices, recent_payments = await run_db(db, crud.recent_activity)
+    return fastjson.dumps({
         "metrics": {
-            "total_invoices": db.query(models.Invoice).count(),
-            "total_amount": total_amount,
-            "total_paid": total_paid,
-            "outstanding": outstanding,
+            "total_invoices": totals.invoice_count,
+            "total_amount": totals.total_amount,
+            "total_paid": totals.total_paid,
+            "outstanding": totals.total_amount - totals.total_paid,
         },
-        "recent_invoices": invoices,
-        "recent_payments": payments,
-    }
+        "recent_invoices": fastjson.rows(recent_invoices),
+        "recent_payments": fastjson.rows(recent_payments),
+    })
+
+
+@router.get("/rollup", response_model=list[RollupRow])
+async def rollup(request: Request,
+                 group_by: Literal["company", "client", "project"] = "company",
+                 period: Literal["month", "all"] = "month",
+                 date_from: date | None = None, date_to: date | None = None,
+                 db: AnySession = Depends(get_read_db)):
+    async def produce():
+        aggregate = crud.rollup_vectorized if settings.ROLLUP_ENGINE == "numpy" else crud.rollup
+        rows = await run_db(db, aggregate, group_by, period == "month", date_from, date_to)
+        return [RollupRow(key=r.key, year=getattr(r, "year", None), month=getattr(r, "month", None),
+                          invoiced=r.invoiced, paid=r.paid) for r in rows]
+
+    return await cache.cached(request, cache.DASHBOARD, produce)
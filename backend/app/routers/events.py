@@ -0,0 +1,24 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from ..core import events
+
+router = APIRouter(tags=["Events"])
+
+
+@router.get("/events")
+async def event_stream(company_id: int | None = None,
+                       topics: str | None = Query(None, description="Comma-separated, default all: "
+                                                                     + ",".join(events.TOPICS))):
+    names = {t.strip() for t in (topics or ",".join(events.TOPICS)).split(",") if t.strip()}
+    unknown = names - set(events.TOPICS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown topics {', '.join(sorted(unknown))}; "
+                                                    f"choose from {', '.join(events.TOPICS)}")
+    try:
+        subscriber = events.broker.subscribe(names, company_id)
+    except events.TooManySubscribers as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    # X-Accel-Buffering: nginx would otherwise hold events back until its buffer fills
+    return StreamingResponse(events.stream(subscriber), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ..db import AnySession, get_db, run_db
+from ..startup import schema
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+def _ping(db: Session) -> None:
+    db.execute(text("SELECT 1"))
+
+
+# Liveness: the process answers. Never touches the database, so an outage doesn't get workers restarted
+@router.get("/live")
+async def live():
+    return {"status": "ok"}
+
+
+# Readiness: route traffic here only while the primary answers and the schema is at the migration head
+@router.get("/ready")
+async def ready(db: AnySession = Depends(get_db)):
+    if not (schema.ready or await run_in_threadpool(schema.check)):
+        return JSONResponse(status_code=503, content={"status": "unavailable", "detail": schema.detail})
+    try:
+        await run_db(db, _ping)
+    except DBAPIError as exc:
+        return JSONResponse(status_code=503, content={"status": "unavailable",
+                                                      "detail": f"database unavailable: {exc.orig}"})
+    return {"status": "ready", "schema": schema.detail}
@@ -1,18 +1,58 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..db import get_db
-from ..schemas import InvoiceCreate, InvoiceOut
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, Query, Request
+from ..core import cache, fastjson
+from ..core.config import settings
+from ..core.exports import export_response
+from ..core.uploads import stream_import
+from ..db import AnySession, get_db, get_read_db, run_db
+from ..schemas import InvoiceCreate, InvoiceListItem, InvoiceOut, Page, BulkResult
 from ..crud import invoices as crud
 
 router = APIRouter(prefix="/invoices", tags=["Invoices"])
 
 
-@router.get("/", response_model=list[InvoiceOut])
-def list_invoices(client_id: int | None = None, project_id: int | None = None, status: str | None = None,
-                  db: Session = Depends(get_db)):
-    return [InvoiceOut.model_validate(x) for x in crud.list_invoices(db, client_id, project_id, status)]
+@router.get("/", response_model=Page[InvoiceListItem])
+async def list_invoices(client_id: int | None = None, project_id: int | None = None, status: str | None = None,
+                        cursor: str | None = None,
+                        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+                        expand: str | None = Query(None, description="Comma-separated: client,project,company"),
+                        db: AnySession = Depends(get_read_db)):
+    rows, next_cursor = await run_db(db, crud.list_invoices, client_id, project_id, status, cursor, limit, expand)
+    return fastjson.response(fastjson.page(rows, next_cursor))
+
+
+@router.get("/export")
+async def export_invoices(request: Request, client_id: int | None = None, project_id: int | None = None,
+                          status: str | None = None, format: Literal["ndjson", "csv"] = "ndjson"):
+    return export_response(request, crud.export_invoices_query(client_id, project_id, status), format, "invoices")
 
 
 @router.post("/", response_model=InvoiceOut)
-def create_invoice(payload: InvoiceCreate, db: Session = Depends(get_db)):
-    return InvoiceOut.model_validate(crud.create_invoice(db, payload))
+async def create_invoice(payload: InvoiceCreate, db: AnySession = Depends(get_db)):
+    obj = InvoiceOut.model_validate(await run_db(db, crud.create_invoice, payload))
+    await cache.invalidate(cache.DASHBOARD, cache.REPORTS)
+    return obj
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_create_invoices(rows: list[dict[str, Any]],
+                               chunk_size: int = Query(settings.BULK_CHUNK_SIZE, ge=1, le=10_000),
+                               db: AnySession = Depends(get_db)):
+    try:
+        return await run_db(db, crud.bulk_create_invoices, list(enumerate(rows, start=1)), BulkResult(), chunk_size)
+    finally:
+        # Chunks commit independently, so some rows may be in even if the import failed part-way
+        await cache.invalidate(cache.DASHBOARD, cache.REPORTS)
+
+
+@router.post("/bulk/upload", response_model=BulkResult)
+async def upload_invoices(request: Request,
+                          chunk_size: int = Query(settings.BULK_CHUNK_SIZE, ge=1, le=10_000),
+                          db: AnySession = Depends(get_db)):
+    result = BulkResult()
+    handle = lambda chunk: run_db(db, crud.bulk_create_invoices, chunk, result, chunk_size)  # noqa: E731
+    try:
+        return await stream_import(request, handle, result, chunk_size)
+    finally:
+        await cache.invalidate(cache.DASHBOARD, cache.REPORTS)
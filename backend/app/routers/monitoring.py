@@ -0,0 +1,78 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..core import cache, events, idempotency, metrics
+from ..db import async_engine, engine, replicas
+
+router = APIRouter(prefix="/monitoring", tags=["Monitoring"])
+# Prometheus scrape target, served at the root as /metrics
+metrics_router = APIRouter(tags=["Monitoring"])
+
+
+def _pools() -> dict:
+    pools = {"sync": engine.pool}
+    if async_engine is not None:
+        pools["async"] = async_engine.sync_engine.pool
+    for replica in replicas.replicas:
+        pools[replica.name] = replica.engine.pool
+        if replica.async_engine is not None:
+            pools[f"{replica.name}-async"] = replica.async_engine.sync_engine.pool
+    return pools
+
+
+@router.get("/pool")
+async def pool_stats(reset: bool = False):
+    pools = _pools()
+    report = {name: pool.stats.snapshot(pool) for name, pool in pools.items()}
+    if reset:
+        for pool in pools.values():
+            pool.stats.reset()
+    return report
+
+
+@router.get("/replicas")
+async def replica_stats():
+    return replicas.snapshot()
+
+
+@router.get("/cache")
+async def cache_stats():
+    return cache.stats.snapshot()
+
+
+@router.get("/events")
+async def event_stats():
+    return events.broker.snapshot()
+
+
+@router.get("/idempotency")
+async def idempotency_stats():
+    return idempotency.stats.snapshot()
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    pools = {name: pool.stats.snapshot(pool) for name, pool in _pools().items()}
+    lines = [
+        *metrics.family("db_pool_checkouts_total", "counter", "Connections checked out",
+                        [({"pool": n}, p["checkouts"]) for n, p in pools.items()]),
+        *metrics.family("db_pool_timeouts_total", "counter", "Checkouts that timed out waiting for a connection",
+                        [({"pool": n}, p["timeouts"]) for n, p in pools.items()]),
+        *metrics.family("db_pool_checked_out", "gauge", "Connections currently checked out",
+                        [({"pool": n}, p.get("checked_out", 0)) for n, p in pools.items()]),
+        *metrics.family("db_pool_overflow", "gauge", "Overflow connections currently open",
+                        [({"pool": n}, p.get("overflow", 0)) for n, p in pools.items()]),
+    ]
+    snapshot = cache.stats.snapshot()
+    for field in ("hits", "misses", "not_modified", "invalidations"):
+        lines += metrics.family(f"cache_{field}_total", "counter", f"Response cache {field.replace('_', ' ')}",
+                                [({}, snapshot[field])])
+    snapshot = events.broker.snapshot()
+    lines += metrics.family("events_subscribers", "gauge", "Open /events streams", [({}, snapshot["subscribers"])])
+    lines += metrics.family("events_delivered_total", "counter", "Change events queued to subscribers",
+                            [({}, snapshot["delivered"])])
+    snapshot = idempotency.stats.snapshot()
+    for field in ("stored", "replays", "conflicts", "mismatches"):
+        lines += metrics.family(f"idempotency_{field}_total", "counter", f"Idempotency-Key responses {field}",
+                                [({}, snapshot[field])])
+    return metrics.registry.render() + "\n".join(lines) + "\n"
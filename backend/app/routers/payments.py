@@ -1,18 +1,67 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..db import get_db
-from ..schemas import PaymentCreate, PaymentOut
-from ..crud import payments as crud
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, Query, Request
+from ..core import cache, fastjson
+from ..core.config import settings
+from ..core.exports import export_response
+from ..core.uploads import stream_import
+from ..db import AnySession, get_db, get_read_db, run_db
+from ..schemas import PaymentCreate, PaymentListItem, PaymentOut, Page, BulkResult, ReconcileResult
+from ..crud import payments as crud, reconcile
 
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
 
-@router.get("/", response_model=list[PaymentOut])
-def list_payments(company_id: int | None = None, client_id: int | None = None, project_id: int | None = None,
-                  db: Session = Depends(get_db)):
-    return [PaymentOut.model_validate(x) for x in crud.list_payments(db, company_id, client_id, project_id)]
+@router.get("/", response_model=Page[PaymentListItem])
+async def list_payments(company_id: int | None = None, client_id: int | None = None, project_id: int | None = None,
+                        cursor: str | None = None,
+                        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+                        expand: str | None = Query(None, description="Comma-separated: client,project,company"),
+                        db: AnySession = Depends(get_read_db)):
+    rows, next_cursor = await run_db(db, crud.list_payments, company_id, client_id, project_id, cursor, limit,
+                                     expand)
+    return fastjson.response(fastjson.page(rows, next_cursor))
+
+
+@router.get("/export")
+async def export_payments(request: Request, company_id: int | None = None, client_id: int | None = None,
+                          project_id: int | None = None, format: Literal["ndjson", "csv"] = "ndjson"):
+    return export_response(request, crud.export_payments_query(company_id, client_id, project_id), format, "payments")
 
 
 @router.post("/", response_model=PaymentOut)
-def create_payment(payload: PaymentCreate, db: Session = Depends(get_db)):
-    return PaymentOut.model_validate(crud.create_payment(db, payload))
+async def create_payment(payload: PaymentCreate, db: AnySession = Depends(get_db)):
+    obj = PaymentOut.model_validate(await run_db(db, crud.create_payment, payload))
+    await cache.invalidate(cache.DASHBOARD, cache.REPORTS)
+    return obj
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_create_payments(rows: list[dict[str, Any]],
+                               chunk_size: int = Query(settings.BULK_CHUNK_SIZE, ge=1, le=10_000),
+                               db: AnySession = Depends(get_db)):
+    try:
+        return await run_db(db, crud.bulk_create_payments, list(enumerate(rows, start=1)), BulkResult(), chunk_size)
+    finally:
+        # Chunks commit independently, so some rows may be in even if the import failed part-way
+        await cache.invalidate(cache.DASHBOARD, cache.REPORTS)
+
+
+@router.post("/bulk/upload", response_model=BulkResult)
+async def upload_payments(request: Request,
+                          chunk_size: int = Query(settings.BULK_CHUNK_SIZE, ge=1, le=10_000),
+                          db: AnySession = Depends(get_db)):
+    result = BulkResult()
+    handle = lambda chunk: run_db(db, crud.bulk_create_payments, chunk, result, chunk_size)  # noqa: E731
+    try:
+        return await stream_import(request, handle, result, chunk_size)
+    finally:
+        await cache.invalidate(cache.DASHBOARD, cache.REPORTS)
+
+
+@router.post("/reconcile", response_model=ReconcileResult)
+async def reconcile_payments(db: AnySession = Depends(get_db)):
+    """Auto-link unlinked payments to open invoices (same project, amount equal to the balance)."""
+    result = await run_db(db, reconcile.auto_match)
+    await cache.invalidate(cache.DASHBOARD, cache.REPORTS)
+    return result
@@ -1,18 +1,40 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..db import get_db
-from ..schemas import ProjectCreate, ProjectOut
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from ..core import cache, fastjson
+from ..core.config import settings
+from ..db import AnySession, get_db, get_read_db, run_db
+from ..schemas import ProjectCreate, ProjectListItem, ProjectOut, Page
 from ..crud import projects as crud
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 
-@router.get("/", response_model=list[ProjectOut])
-def list_projects(company_id: int | None = None, client_id: int | None = None, q: str | None = None,
-                  db: Session = Depends(get_db)):
-    return [ProjectOut.model_validate(x) for x in crud.list_projects(db, company_id, client_id, q)]
+@router.get("/", response_model=Page[ProjectListItem])
+async def list_projects(request: Request,
+                        company_id: int | None = None, client_id: int | None = None, q: str | None = None,
+                        cursor: str | None = None,
+                        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+                        expand: str | None = Query(None, description="Comma-separated: client,company"),
+                        db: AnySession = Depends(get_read_db)):
+    async def produce():
+        rows, next_cursor = await run_db(db, crud.list_projects, company_id, client_id, q, cursor, limit, expand)
+        return fastjson.page(rows, next_cursor)
+
+    return await cache.cached(request, cache.PROJECTS, produce)
 
 
 @router.post("/", response_model=ProjectOut)
-def create_project(payload: ProjectCreate, db: Session = Depends(get_db)):
-    return ProjectOut.model_validate(crud.create_project(db, payload))
+async def create_project(payload: ProjectCreate, db: AnySession = Depends(get_db)):
+    obj = ProjectOut.model_validate(await run_db(db, crud.create_project, payload))
+    await cache.invalidate(cache.PROJECTS)
+    return obj
+
+
+@router.get("/{project_id}", response_model=ProjectOut)
+async def get_project(project_id: int, request: Request, db: AnySession = Depends(get_read_db)):
+    async def produce():
+        obj = await run_db(db, crud.get_project, project_id)
+        if obj is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return ProjectOut.model_validate(obj)
+
+    return await cache.cached(request, cache.PROJECTS, produce)
@@ -0,0 +1,32 @@
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Request
+from ..core import cache
+from ..db import AnySession, get_db, get_read_db, run_db
+from ..crud import reports as crud
+from ..schemas import AgingReport, AgingRow
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+
+@router.get("/aging", response_model=AgingReport)
+async def aging(request: Request, as_of: date | None = None,
+                group_by: Literal["client", "project"] | None = None,
+                source: Literal["snapshot", "live"] = "snapshot",
+                db: AnySession = Depends(get_db), read_db: AnySession = Depends(get_read_db)):
+    as_of = as_of or date.today()
+
+    async def produce():
+        # The snapshot is refreshed (written) as it is read, so only the live report can use a replica
+        if source == "live":
+            rows, refreshed_at = await run_db(read_db, crud.aging_live, as_of, group_by), None
+        else:
+            rows, refreshed_at = await run_db(db, crud.aging, as_of, group_by)
+        rows = sorted(rows, key=lambda r: (r.key is None, r.key or 0, crud.BUCKETS.index(r.bucket)))
+        return AgingReport(as_of=as_of, refreshed_at=refreshed_at, rows=[
+            AgingRow(key=r.key, bucket=r.bucket, invoices=r.invoices, outstanding=r.outstanding)
+            for r in rows])
+
+    # as_of defaults to today, so the date is part of the key even when the query string omits it
+    return await cache.cached(request, cache.REPORTS, produce, vary=as_of.isoformat())
@@ -0,0 +1,19 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from ..db import AnySession, get_read_db, run_db
+from ..crud import search as crud
+from ..schemas import SearchHit
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+Kind = Literal["company", "client", "project"]
+
+
+@router.get("/", response_model=list[SearchHit])
+async def search(q: str = Query(..., min_length=1, max_length=255),
+                 types: list[Kind] = Query(["company", "client", "project"]),
+                 limit: int = Query(20, ge=1, le=100),
+                 db: AnySession = Depends(get_read_db)):
+    hits = await run_db(db, crud.search, q, list(dict.fromkeys(types)), limit)
+    return [SearchHit(type=kind, id=row_id, name=name, score=score) for kind, row_id, name, score in hits]
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, Query
+
+from ..core import fastjson
+from ..core.config import settings
+from ..crud import changes as crud
+from ..db import AnySession, get_db, run_db
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+# On the primary: a replica's clock and lag would blur which changes have settled
+@router.get("/")
+async def sync(since: int = Query(0, ge=0, description="Token from the previous response; 0 for everything"),
+               limit: int = Query(settings.SYNC_PAGE_SIZE, ge=1, le=settings.SYNC_PAGE_MAX),
+               db: AnySession = Depends(get_db)):
+    result, token, more = await run_db(db, crud.since, since, limit)
+    return fastjson.response(fastjson.dumps({"token": token, "more": more,
+                                             **{entity: fastjson.rows(rows) for entity, rows in result.items()}}))
@@ -1,6 +1,32 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Generic, Optional, TypeVar
+
+from .core.money import Money
+
+T = TypeVar("T")
+
+
+# ---------- PAGINATION ----------
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+# ---------- BULK IMPORT ----------
+class BulkRowError(BaseModel):
+    row: int
+    detail: Any
+
+
+class ReconcileResult(BaseModel):
+    scanned: int
+    matched: int
+
+
+class BulkResult(BaseModel):
+    created_ids: list[int] = []
+    errors: list[BulkRowError] = []
 
 
 # ---------- USERS ----------
@@ -16,6 +42,12 @@ class UserCreate(BaseModel):
     password: str
 
 
+class AuthUser(BaseModel):
+    id: int
+    email: str
+    expires_at: int
+
+
 # ---------- COMPANIES ----------
 class CompanyBase(BaseModel):
     name: str
@@ -76,37 +108,55 @@ class ProjectOut(ProjectBase):
 
 # ---------- INVOICES ----------
 class InvoiceBase(BaseModel):
-    invoice_number: str
+    # Omit to have the server allocate the next number (crud.numbering)
+    invoice_number: Optional[str] = None
     client_id: int
     project_id: int
     issue_date: date
     due_date: Optional[date] = None
     status: str
     currency: str
-    subtotal: float
-    tax: float
-    total: float
+    subtotal: Money
+    tax: Money
+    total: Money
     notes: Optional[str] = None
 
 
 class InvoiceCreate(InvoiceBase):
-    pass
+    # Omit tax (and total) to have the server apply the client's, else the company's, gst_percent
+    tax: Optional[Money] = None
+    total: Optional[Money] = None
+
+    @model_validator(mode="after")
+    def check_total(self):
+        if self.tax is None:
+            if self.total is not None:
+                raise ValueError("total is computed when tax is omitted; send both or neither")
+        elif self.total is None:
+            self.total = self.subtotal + self.tax
+        elif self.total != self.subtotal + self.tax:
+            raise ValueError(f"total {self.total} is not subtotal + tax ({self.subtotal + self.tax})")
+        return self
 
 
 class InvoiceOut(InvoiceBase):
     model_config = ConfigDict(from_attributes=True)
     id: int
+    invoice_number: str
     created_at: datetime
+    amount_paid: Money
+    balance: Money
 
 
 # ---------- PAYMENTS ----------
 class PaymentBase(BaseModel):
-    payment_number: str
+    # Omit to have the server allocate the next number (crud.numbering)
+    payment_number: Optional[str] = None
     invoice_id: Optional[int] = None
     project_id: int
     client_id: Optional[int] = None
     company_id: Optional[int] = None
-    amount: float
+    amount: Money
     payment_date: date
     method: Optional[str] = None
     bank: Optional[str] = None
@@ -121,4 +171,59 @@ class PaymentCreate(PaymentBase):
 class PaymentOut(PaymentBase):
     model_config = ConfigDict(from_attributes=True)
     id: int
+    payment_number: str
     created_at: datetime
+
+
+# ---------- LIST ITEMS (?expand=client,project,company) ----------
+class RefOut(BaseModel):
+    id: int
+    name: str
+
+
+class ProjectListItem(ProjectOut):
+    client: Optional[RefOut] = None
+    company: Optional[RefOut] = None
+
+
+class InvoiceListItem(InvoiceOut):
+    client: Optional[RefOut] = None
+    project: Optional[RefOut] = None
+    company: Optional[RefOut] = None
+
+
+class PaymentListItem(PaymentOut):
+    client: Optional[RefOut] = None
+    project: Optional[RefOut] = None
+    company: Optional[RefOut] = None
+
+
+# ---------- SEARCH ----------
+class SearchHit(BaseModel):
+    type: str
+    id: int
+    name: str
+    score: float
+
+
+# ---------- REPORTS ----------
+class AgingRow(BaseModel):
+    key: Optional[int] = None
+    bucket: str
+    invoices: int
+    outstanding: Money
+
+
+class AgingReport(BaseModel):
+    as_of: date
+    refreshed_at: Optional[datetime] = None
+    rows: list[AgingRow]
+
+
+# ---------- DASHBOARD ----------
+class RollupRow(BaseModel):
+    key: int
+    year: Optional[int] = None
+    month: Optional[int] = None
+    invoiced: Money
+    paid: Money
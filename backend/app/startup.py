@@ -0,0 +1,71 @@
+import logging
+import threading
+
+from sqlalchemy.exc import DBAPIError
+from starlette.concurrency import run_in_threadpool
+
+from . import migrate
+from .core.config import settings
+from .crud import search as search_index
+from .db import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class Schema:
+    """Whether this worker has seen the database at the migration head.
+
+    Checked in the background after startup and by GET /health/ready until it passes; after that no
+    request pays for it. A database that is down is retried; a schema that is behind waits for
+    `python -m app.cli migrate` (readiness re-checks it).
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.database_down = False
+        self.detail = "starting"
+        self._lock = threading.Lock()
+
+    def check(self, upgrade: bool = False, wait: bool = False) -> bool:
+        # Probes don't wait: one that arrives during a migration reports "not ready" instead of queueing
+        if self.ready or not self._lock.acquire(blocking=wait):
+            return self.ready
+        try:
+            if upgrade:
+                migrate.upgrade()
+            revision, head = migrate.current(), migrate.head()
+        except DBAPIError as exc:
+            self.database_down, self.detail = True, f"database unavailable: {exc.orig}"
+            return False
+        finally:
+            self._lock.release()
+        self.database_down = False
+        if revision != head:
+            self.detail = f"schema at {revision}, expected {head}; run `python -m app.cli migrate`"
+        else:
+            self.ready, self.detail = True, head
+        return self.ready
+
+
+schema = Schema()
+
+
+async def start(stop: threading.Event) -> None:
+    """Lifespan startup. With MIGRATE_ON_STARTUP the worker migrates before serving, unless the database
+    is down (then it serves anyway and retries). Otherwise it serves at once and checks in the background."""
+    if settings.MIGRATE_ON_STARTUP:
+        await run_in_threadpool(schema.check, True, True)
+    threading.Thread(target=_prepare, args=(stop,), name="startup", daemon=True).start()
+
+
+def _prepare(stop: threading.Event) -> None:
+    while not schema.check(settings.MIGRATE_ON_STARTUP, wait=True):
+        if not schema.database_down:
+            logger.error("startup: %s", schema.detail)
+            return
+        logger.warning("startup: %s; retrying in %ss", schema.detail, settings.STARTUP_RETRY_SECONDS)
+        if stop.wait(settings.STARTUP_RETRY_SECONDS):
+            return
+    if settings.SEARCH_WARM_ON_STARTUP:
+        with SessionLocal() as db:
+            search_index.warm(db)
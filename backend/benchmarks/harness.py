@@ -0,0 +1,193 @@
+"""Latency (p50/p95/p99) and throughput of every router, checked against a stored baseline.
+
+    python -m benchmarks.harness                                   # temporary SQLite file, 10k invoices
+    python -m benchmarks.harness --url mysql+pymysql://root:pw@localhost/invoicer_bench --invoices 100000
+    python -m benchmarks.harness --save-baseline                   # record this machine's numbers
+    python -m benchmarks.harness --only invoices dashboard         # scenarios whose name contains a word
+
+The database is dropped and seeded with benchmarks.seed (unless --no-seed), one uvicorn worker is
+started on it, and each scenario is fired --requests times at --concurrency. Results are compared with
+benchmarks/baseline.json under "<dialect>/<invoices>"; a scenario regresses when its p95 rises or its
+throughput falls by more than --tolerance, and the run then exits with status 1. The response cache is
+off unless --cache, so the numbers are the database paths.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+from benchmarks.load_test import BACKEND_DIR, percentile, wait_ready
+from benchmarks.seed import BENCH_PASSWORD, BENCH_USER, Dataset, reset, seed
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+# Absolute slack on top of --tolerance so sub-millisecond jitter is not reported as a regression
+MIN_P95_DELTA_MS = 2.0
+
+
+def scenarios(data: Dataset, rng: random.Random):
+    """(name, factory) pairs; a factory returns the (method, path, json body) of one request."""
+    run, numbers = f"{int(time.time())}-{os.getpid()}", itertools.count()
+    client = lambda: rng.randint(1, data.clients)  # noqa: E731
+    project = lambda: rng.randint(1, data.projects)  # noqa: E731
+
+    def invoice():
+        # Projects 1..clients belong to the client with the same id (benchmarks.seed)
+        c = client()
+        return "POST", "/invoices/", {"invoice_number": f"B-{run}-{next(numbers)}", "client_id": c, "project_id": c,
+                                      "issue_date": "2025-06-01", "due_date": "2025-07-01", "status": "sent",
+                                      "currency": "INR", "subtotal": 1000, "tax": 180, "total": 1180}
+
+    def payment():
+        return "POST", "/payments/", {"payment_number": f"B-{run}-{next(numbers)}", "project_id": project(),
+                                      "amount": 500, "payment_date": "2025-06-15", "method": "upi"}
+
+    return [
+        ("invoices list", lambda: ("GET", "/invoices/?limit=50", None)),
+        ("invoices by client", lambda: ("GET", f"/invoices/?client_id={client()}", None)),
+        ("invoices by status", lambda: ("GET", "/invoices/?status=overdue", None)),
+        ("invoices expanded", lambda: ("GET", "/invoices/?expand=client,project,company", None)),
+        ("payments by project", lambda: ("GET", f"/payments/?project_id={project()}", None)),
+        ("companies list", lambda: ("GET", "/companies/", None)),
+        ("clients by company", lambda: ("GET", f"/clients/?company_id={rng.randint(1, data.companies)}", None)),
+        ("projects by client", lambda: ("GET", f"/projects/?client_id={client()}", None)),
+        ("search", lambda: ("GET", f"/search/?q={rng.choice(['nova', 'tech', 'quan', 'bex', 'zenith'])}", None)),
+        ("dashboard summary", lambda: ("GET", "/dashboard/summary", None)),
+        ("dashboard rollup", lambda: ("GET", "/dashboard/rollup?group_by=client&period=all", None)),
+        ("aging report", lambda: ("GET", "/reports/aging?as_of=2025-06-30", None)),
+        ("create invoice", invoice),
+        ("create payment", payment),
+        ("login", lambda: ("POST", "/auth/login", {"email": BENCH_USER, "password": BENCH_PASSWORD})),
+    ]
+
+
+async def fire(base_url: str, factory, total: int, concurrency: int):
+    latencies, errors = [], 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        remaining = iter(range(total))
+
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                method, path, body = factory()
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, path, json=body)
+                    errors += response.status_code >= 400
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return {"p50": round(statistics.median(latencies), 2), "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2), "rps": round(len(latencies) / elapsed, 1),
+            "errors": errors}
+
+
+def regressions(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    found = []
+    for name, now in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if now["p95"] > before["p95"] * (1 + tolerance) and now["p95"] - before["p95"] > MIN_P95_DELTA_MS:
+            found.append(f"{name}: p95 {before['p95']} -> {now['p95']} ms")
+        if now["rps"] < before["rps"] * (1 - tolerance):
+            found.append(f"{name}: throughput {before['rps']} -> {now['rps']} req/s")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="throwaway database URL (default: temporary SQLite file)")
+    parser.add_argument("--invoices", type=int, default=10_000)
+    parser.add_argument("--no-seed", action="store_true", help="reuse a database seeded with --invoices before")
+    parser.add_argument("--requests", type=int, default=500, help="per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--async", dest="db_async", action="store_true", help="run with DB_ASYNC=true")
+    parser.add_argument("--async-driver", default="mysql+aiomysql")
+    parser.add_argument("--cache", action="store_true", help="keep the response cache on")
+    parser.add_argument("--port", type=int, default=8720)
+    parser.add_argument("--only", nargs="+", help="run scenarios whose name contains one of these words")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output", help="also write this run's results as JSON")
+    args = parser.parse_args()
+
+    url = args.url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "harness.db")
+    dialect = make_url(url).get_backend_name()
+    if dialect == "sqlite" and args.async_driver == "mysql+aiomysql":
+        args.async_driver = "sqlite+aiosqlite"
+    engine = create_engine(url)
+    if args.no_seed:
+        data = Dataset(max(5, args.invoices // 2000), max(20, args.invoices // 100), max(50, args.invoices // 20),
+                       args.invoices, 0)
+    else:
+        reset(engine)
+        started = time.perf_counter()
+        data = seed(engine, args.invoices, random.Random(42))
+        print(f"seeded {data.invoices} invoices, {data.payments} payments in {time.perf_counter() - started:.1f}s")
+    engine.dispose()
+
+    env = dict(os.environ, DATABASE_URL=url, DB_ASYNC="true" if args.db_async else "false",
+               DB_ASYNC_DRIVERNAME=args.async_driver, CACHE_BACKEND="memory" if args.cache else "none",
+               # Under benchmark concurrency lock waits make many statements "slow"; keep the log readable
+               METRICS_SLOW_QUERY_MS=os.environ.get("METRICS_SLOW_QUERY_MS", "5000"))
+    proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port),
+                             "--log-level", "warning", "--no-access-log"], cwd=BACKEND_DIR, env=env)
+    results = {}
+    try:
+        base_url = f"http://127.0.0.1:{args.port}"
+        wait_ready(base_url, proc)
+        rng = random.Random(7)
+        print(f"{'scenario':<22}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'errors':>8}", flush=True)
+        for name, factory in scenarios(data, rng):
+            if args.only and not any(word in name for word in args.only):
+                continue
+            asyncio.run(fire(base_url, factory, min(50, args.requests), args.concurrency))  # warm-up
+            r = results[name] = asyncio.run(fire(base_url, factory, args.requests, args.concurrency))
+            print(f"{name:<22}{r['p50']:>9.1f}{r['p95']:>9.1f}{r['p99']:>9.1f}{r['rps']:>9.0f}{r['errors']:>8}",
+                  flush=True)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    key = f"{dialect}{'-async' if args.db_async else ''}/{args.invoices}"
+    baselines = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    if args.output:
+        Path(args.output).write_text(json.dumps({key: results}, indent=2) + "\n")
+    if args.save_baseline:
+        baselines[key] = {**baselines.get(key, {}), **results}
+        BASELINE.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"baseline {key} saved to {BASELINE}")
+        return
+    if key not in baselines:
+        print(f"no baseline for {key}; record one with --save-baseline")
+        return
+    found = regressions(results, baselines[key], args.tolerance)
+    failed = [name for name, r in results.items() if r["errors"]]
+    for line in found:
+        print("REGRESSION " + line)
+    for name in failed:
+        print(f"ERRORS {name}: {results[name]['errors']} failed requests")
+    if found or failed:
+        sys.exit(1)
+    print(f"no regressions against baseline {key} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Query plans and latencies of the list queries without/with the composite indexes of migration 0003.
+
+    python -m benchmarks.index_benchmark                       # seeded SQLite file
+    python -m benchmarks.index_benchmark --url mysql+pymysql://root:pw@localhost/invoicer_bench
+
+The target database is dropped and re-seeded, so never point --url at real data.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.crud import clients, companies, invoices, payments, projects
+from app.db import Base
+from benchmarks.seed import reset, seed
+
+# The composite list indexes (migration 0003): dropped for the "before" run, then built again
+LIST_TABLES = ("companies", "clients", "projects", "invoices", "payments")
+
+
+def list_indexes():
+    return [ix for name in LIST_TABLES for ix in Base.metadata.tables[name].indexes]
+
+
+def cases(data):
+    n_companies, n_clients, n_projects = data.companies, data.clients, data.projects
+    return [
+        ("invoices first page", lambda db: invoices.list_invoices(db)),
+        ("invoices by client", lambda db: invoices.list_invoices(db, client_id=n_clients // 2)),
+        ("invoices by project", lambda db: invoices.list_invoices(db, project_id=n_projects // 2)),
+        ("invoices by status", lambda db: invoices.list_invoices(db, status="overdue")),
+        ("payments first page", lambda db: payments.list_payments(db)),
+        ("payments by company", lambda db: payments.list_payments(db, company_id=n_companies // 2)),
+        ("payments by project", lambda db: payments.list_payments(db, project_id=n_projects // 2)),
+        ("clients by company", lambda db: clients.list_clients(db, company_id=n_companies // 2)),
+        ("projects by client", lambda db: projects.list_projects(db, client_id=n_clients // 2)),
+        ("companies first page", lambda db: companies.list_companies(db)),
+    ]
+
+
+def explain(conn, statement, parameters):
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+    if conn.dialect.name == "sqlite":
+        return [r[-1] for r in rows]
+    return [f"{r.table}: type={r.type} key={r.key} rows={r.rows} extra={r.Extra}" for r in rows]
+
+
+def measure(engine, all_cases, repeats: int):
+    captured = {}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured["sql"] = (statement, parameters)
+
+    results = {}
+    with Session(engine) as db:
+        for name, run in all_cases:
+            run(db)  # warm-up + capture the statement
+            timings = []
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                run(db)
+                timings.append((time.perf_counter() - t0) * 1000)
+            plan = explain(db.connection(), *captured["sql"])
+            results[name] = (statistics.median(timings), plan)
+    event.remove(engine, "before_cursor_execute", capture)
+    return results
+
+
+def analyze(engine):
+    with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            conn.exec_driver_sql("ANALYZE")
+        else:
+            for table in ("companies", "clients", "projects", "invoices", "payments"):
+                conn.exec_driver_sql(f"ANALYZE TABLE {table}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="database URL (default: temporary SQLite file)")
+    parser.add_argument("--invoices", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(url)
+    reset(engine)
+    t0 = time.perf_counter()
+    data = seed(engine, args.invoices, random.Random(args.seed))
+    print(f"seeded {args.invoices} invoices/{data.payments} payments in {time.perf_counter() - t0:.1f}s "
+          f"on {engine.url.drivername}")
+    with engine.begin() as conn:
+        for ix in list_indexes():
+            ix.drop(conn)
+    analyze(engine)
+    all_cases = cases(data)
+    before = measure(engine, all_cases, args.repeats)
+
+    t0 = time.perf_counter()
+    with engine.begin() as conn:
+        for ix in list_indexes():
+            ix.create(conn)
+    print(f"building the 0003 indexes took {time.perf_counter() - t0:.1f}s")
+    analyze(engine)
+    after = measure(engine, all_cases, args.repeats)
+
+    print(f"\n{'query':<24}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name, _ in all_cases:
+        b, a = before[name][0], after[name][0]
+        print(f"{name:<24}{b:>12.2f}{a:>12.2f}{b / a:>9.1f}x")
+    for name, _ in all_cases:
+        print(f"\n== {name}")
+        print("  before: " + " | ".join(before[name][1]))
+        print("  after:  " + " | ".join(after[name][1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare the sync (threadpool) and async (AsyncSession) database paths under high concurrency.
+
+Starts one uvicorn worker per mode against the same database and fires concurrent GETs at it:
+
+    python -m benchmarks.load_test --url sqlite:///./bench.db --async-driver sqlite+aiosqlite --seed-invoices 20000
+    python -m benchmarks.load_test --url mysql+pymysql://root:pw@localhost/invoicer_bench --concurrency 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_PATHS = ["/invoices/?limit=50", "/payments/?limit=50", "/dashboard/summary", "/companies/"]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def fire(base_url: str, paths: list[str], total: int, concurrency: int):
+    latencies, errors = [], 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        queue = iter(range(total))
+
+        async def worker():
+            nonlocal errors
+            for i in queue:
+                t0 = time.perf_counter()
+                try:
+                    response = await client.get(paths[i % len(paths)])
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - t0) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+def wait_ready(base_url: str, proc: subprocess.Popen, timeout: float = 30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            if httpx.get(base_url + "/", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("uvicorn did not become ready")
+
+
+def run_mode(args, db_async: bool):
+    env = dict(os.environ, DATABASE_URL=args.url, DB_ASYNC="true" if db_async else "false",
+               DB_ASYNC_DRIVERNAME=args.async_driver)
+    port = args.port + (1 if db_async else 0)
+    proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+                             "--log-level", "warning", "--no-access-log"], cwd=BACKEND_DIR, env=env)
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        wait_ready(base_url, proc)
+        asyncio.run(fire(base_url, args.paths, min(200, args.requests), args.concurrency))  # warm-up
+        return asyncio.run(fire(base_url, args.paths, args.requests, args.concurrency))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", required=True, help="sync SQLAlchemy URL of a migrated database")
+    parser.add_argument("--async-driver", default="mysql+aiomysql")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--port", type=int, default=8700)
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS)
+    parser.add_argument("--seed-invoices", type=int, default=0, help="drop, migrate and seed the database first")
+    args = parser.parse_args()
+
+    if args.seed_invoices:
+        from benchmarks.seed import reset, seed
+        engine = create_engine(args.url)
+        reset(engine)
+        seed(engine, args.seed_invoices, random.Random(42))
+        engine.dispose()
+
+    print(f"{'mode':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}", flush=True)
+    for db_async in (False, True):
+        latencies, errors, elapsed = run_mode(args, db_async)
+        print(f"{'async' if db_async else 'sync':<8}{len(latencies) / elapsed:>10.0f}"
+              f"{statistics.median(latencies):>10.1f}{percentile(latencies, 95):>10.1f}"
+              f"{percentile(latencies, 99):>10.1f}{errors:>8}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Concurrency check of server-side invoice numbers (crud.numbering): no duplicates, no gaps inside a block.
+
+    python -m benchmarks.numbering_stress                          # temporary SQLite file
+    python -m benchmarks.numbering_stress --url mysql+pymysql://root:pw@localhost/invoicer_bench --workers 8
+
+--workers processes (each with its own block cache, like uvicorn workers) run --threads threads that
+create --per-thread invoices without a number, spread over two companies and two years. Afterwards
+every sequence must hold exactly the created numbers: each reserved block is used from its start
+without holes, and only a worker's last block per sequence may have an unused tail. Exits 1 otherwise.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import settings
+from app.crud import invoices
+from app.schemas import InvoiceCreate
+from benchmarks.seed import reset, seed
+
+PREFIX = "STRESS"
+
+
+def _engine(url: str):
+    # SQLite serialises writers; wait for the lock instead of failing with "database is locked"
+    connect_args = {"timeout": 60} if make_url(url).get_backend_name() == "sqlite" else {}
+    return create_engine(url, pool_size=32, max_overflow=0, connect_args=connect_args)
+
+
+def worker(url: str, threads: int, per_thread: int, block_size: int, clients: list[int]) -> int:
+    settings.NUMBER_BLOCK_SIZE = block_size
+    settings.INVOICE_NUMBER_PREFIX = PREFIX
+    # Writers queue on the database lock here by design; don't log each wait as a slow query
+    settings.METRICS_SLOW_QUERY_MS = 60_000
+    engine = _engine(url)
+    rng = random.Random(os.getpid())
+    jobs = [(rng.choice(clients), rng.choice([2024, 2025])) for _ in range(threads * per_thread)]
+
+    def create(job):
+        client_id, year = job
+        # Projects 1..clients belong to the client with the same id (benchmarks.seed)
+        payload = InvoiceCreate(client_id=client_id, project_id=client_id, issue_date=date(year, 3, 1),
+                                status="sent", currency="INR", subtotal=100, tax=18, total=118)
+        with Session(engine) as db:
+            invoices.create_invoice(db, payload)
+
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(create, jobs))
+    engine.dispose()
+    return len(jobs)
+
+
+def check(numbers: list[str], block_size: int, workers: int) -> list[str]:
+    problems = []
+    duplicates = len(numbers) - len(set(numbers))
+    if duplicates:
+        problems.append(f"{duplicates} duplicate numbers")
+    sequences = defaultdict(set)
+    for number in set(numbers):
+        _, company, year, n = number.rsplit("-", 3)
+        sequences[(company, year)].add(int(n))
+    for (company, year), values in sorted(sequences.items()):
+        # Single creates reserve whole blocks: 1..B, B+1..2B, ...
+        blocks = defaultdict(list)
+        for n in values:
+            blocks[(n - 1) // block_size].append(n)
+        partial = 0
+        for index, used in blocks.items():
+            start = index * block_size + 1
+            if sorted(used) != list(range(start, start + len(used))):
+                problems.append(f"company {company} year {year}: hole inside block {start}..{start + block_size - 1}")
+            partial += len(used) < block_size
+        if partial > workers:
+            problems.append(f"company {company} year {year}: {partial} partly used blocks for {workers} workers")
+        print(f"company {company} year {year}: {len(values)} numbers in {len(blocks)} blocks, "
+              f"{partial} with an unused tail")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="throwaway database URL (default: temporary SQLite file)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--per-thread", type=int, default=50)
+    parser.add_argument("--block-size", type=int, default=20)
+    args = parser.parse_args()
+
+    url = args.url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "numbering.db")
+    engine = _engine(url)
+    reset(engine)
+    data = seed(engine, 1000, random.Random(42))
+    clients = random.Random(1).sample(range(1, data.clients + 1), 2)
+
+    started = time.perf_counter()
+    with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+        created = sum(pool.starmap(worker, [(url, args.threads, args.per_thread, args.block_size, clients)]
+                                   * args.workers))
+    elapsed = time.perf_counter() - started
+    with engine.connect() as conn:
+        numbers = list(conn.scalars(select(models.Invoice.invoice_number)
+                                    .where(models.Invoice.invoice_number.like(f"{PREFIX}-%"))))
+    engine.dispose()
+    print(f"{created} invoices from {args.workers} workers x {args.threads} threads in {elapsed:.1f}s "
+          f"({created / elapsed:.0f}/s), block size {args.block_size}")
+
+    problems = check(numbers, args.block_size, args.workers)
+    if len(numbers) != created:
+        problems.append(f"{created} creates but {len(numbers)} numbered invoices")
+    for line in problems:
+        print("FAIL " + line)
+    if problems:
+        raise SystemExit(1)
+    print("no duplicates, no gaps inside blocks")
+
+
+if __name__ == "__main__":
+    main()
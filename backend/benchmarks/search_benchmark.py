@@ -0,0 +1,107 @@
+"""Latency of name search: leading-wildcard ILIKE scans vs the in-process trigram index (/search).
+
+    python -m benchmarks.search_benchmark                      # 1M clients + 1M projects, SQLite file
+    python -m benchmarks.search_benchmark --rows 100000 --url mysql+pymysql://root:pw@localhost/invoicer_bench
+
+The target database is dropped and re-seeded, so never point --url at real data.
+"""
+import argparse
+import os
+import random
+import resource
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.crud import search
+from benchmarks.seed import fake_name, reset
+
+def seed(engine, rows: int, rng: random.Random):
+    n_companies = max(10, rows // 100)
+    with engine.begin() as conn:
+        conn.execute(insert(models.Company), [{"name": fake_name(rng)} for _ in range(n_companies)])
+        for offset in range(0, rows, 50_000):
+            batch = range(offset, min(offset + 50_000, rows))
+            conn.execute(insert(models.Client), [
+                {"name": fake_name(rng), "company_id": rng.randint(1, n_companies)} for _ in batch])
+            conn.execute(insert(models.Project), [
+                {"name": fake_name(rng), "company_id": rng.randint(1, n_companies), "client_id": i + 1} for i in batch])
+
+
+def queries(db: Session, rng: random.Random) -> list[tuple[str, str]]:
+    name = db.execute(select(models.Client.name).where(models.Client.id == 1)).scalar_one()
+    word = name.split()[0].lower()
+    typo = word[:2] + word[3:] if len(word) > 4 else word + "x"
+    return [("1-char prefix", word[:1]), ("3-char prefix", word[:3]), ("word", word), ("mid-word", word[1:]),
+            ("typo", typo), ("two words", " ".join(name.split()[:2]).lower()), ("no match", "qqqzzz")]
+
+
+def measure(fn, repeat: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1 if len(timings) > 1 else 0]
+
+
+def ilike(db: Session, model, q: str, limit: int = 20):
+    # The query list_clients/list_projects ran before the index existed
+    return db.query(model).filter(model.name.ilike(f"%{q}%")).order_by(model.created_at.desc()).limit(limit).all()
+
+
+def check_substrings(db: Session, rng: random.Random, samples: int = 20) -> None:
+    """Every row ILIKE finds must rank first in /search and be exactly what the list `q` filter uses."""
+    names = db.execute(select(models.Client.name).order_by(models.Client.id).limit(1000)).scalars().all()
+    for name in rng.sample(names, min(samples, len(names))):
+        start = rng.randrange(len(name) - 3)
+        q = name[start:start + rng.randint(2, 5)].strip() or name[:3]  # search() strips the query
+        expected = set(db.execute(select(models.Client.id).where(models.Client.name.ilike(f"%{q}%"))).scalars())
+        found = {row_id for row_id, _, _ in search.INDEXES["client"].search(q, len(expected))}
+        assert found == expected, f"q={q!r}: {len(expected - found)} ILIKE matches missing from the index"
+        assert set(search.INDEXES["client"].containing(q, len(expected))) == expected, f"q={q!r}: list filter"
+    print(f"\nsubstring check: {samples} random fragments, the index returned every ILIKE match first")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="throwaway database URL (default: temporary SQLite file)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="clients and projects to seed (each)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    url = args.url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "search_bench.db")
+    engine = create_engine(url)
+    reset(engine)
+    rng = random.Random(7)
+    started = time.perf_counter()
+    seed(engine, args.rows, rng)
+    print(f"seeded {args.rows} clients + {args.rows} projects in {time.perf_counter() - started:.1f}s")
+
+    with Session(engine) as db:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        for kind in ("company", "client", "project"):
+            search.INDEXES[kind].catch_up(db)
+        grown = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss) / 1024
+        print(f"index build {time.perf_counter() - started:.1f}s, ~{grown:.0f} MiB max RSS growth\n")
+
+        print(f"{'query':<16}{'q':<24}{'ILIKE p50':>11}{'index p50':>11}{'index p95':>11}  top hit")
+        for label, q in queries(db, rng):
+            scan, _ = measure(lambda: [ilike(db, m, q) for m in (models.Company, models.Client, models.Project)],
+                              max(3, args.repeat // 5))
+            p50, p95 = measure(lambda: search.search(db, q, ["company", "client", "project"], 20), args.repeat)
+            hits = search.search(db, q, ["company", "client", "project"], 20)
+            top = f"{hits[0][0]} {hits[0][2]!r}" if hits else "-"
+            print(f"{label:<16}{q:<24}{scan:>9.1f}ms{p50:>9.1f}ms{p95:>9.1f}ms  {top}")
+        check_substrings(db, rng)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
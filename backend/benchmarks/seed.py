@@ -0,0 +1,196 @@
+"""Synthetic data for benchmarks: companies, clients, projects, invoices and payments at any scale.
+
+    python -m benchmarks.seed --url sqlite:///./bench.db --invoices 100000
+    python -m benchmarks.seed --url mysql+pymysql://root:pw@localhost/invoicer_bench --invoices 1000000
+
+The target database is dropped, migrated and filled, so never point --url at real data. The same
+--seed always produces the same rows. Distributions:
+
+- clients and projects follow a Zipf-like curve: a few clients own most projects and invoices
+- issue dates span --years before --until, denser towards the end (a growing business)
+- subtotals are log-normal around 25k with the usual GST slabs; 95% INR
+- 4% drafts and 2% cancelled; past-due invoices are mostly paid (in 1-3 installments), some partially,
+  some not at all, so statuses, balances and the aging report look like a live ledger
+- 5% of payments arrive without an invoice link (what POST /payments/reconcile picks up)
+
+A `bench@example.com` / `bench-password` user is created for the login benchmark.
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import NamedTuple
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core import money
+from app.core.security import hash_password
+from app.crud import changes, dashboard, reports
+from app.db import Base
+from app.migrate import upgrade
+
+SYLLABLES = ["ac", "me", "glo", "bex", "ini", "tech", "um", "brel", "la", "so", "lar", "nova", "ter", "ra",
+             "vis", "ta", "quan", "tum", "ze", "nith", "or", "bit", "kin", "dle", "pax", "ly", "mo", "dus"]
+SUFFIXES = ["Industries", "Labs", "Health", "Systems", "Traders", "Foods", "Logistics", "Studio", "Partners"]
+GST_SLABS, GST_WEIGHTS = [0, 5, 12, 18, 28], [5, 10, 20, 60, 5]
+METHODS = ["bank_transfer", "upi", "cheque", "cash", "card"]
+BANKS = ["HDFC", "ICICI", "SBI", "Axis", "Kotak"]
+UNTIL = date(2025, 6, 30)
+BENCH_USER, BENCH_PASSWORD = "bench@example.com", "bench-password"
+CHUNK = 10_000
+CENT = Decimal("0.01")
+
+
+class Dataset(NamedTuple):
+    companies: int
+    clients: int
+    projects: int
+    invoices: int
+    payments: int
+
+
+def fake_name(rng: random.Random) -> str:
+    word = lambda: "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()  # noqa: E731
+    return f"{word()} {word()} {rng.choice(SUFFIXES)}"
+
+
+def zipf_weights(n: int, rng: random.Random, s: float = 0.9) -> list[float]:
+    """Cumulative weights for rng.choices: a shuffled 1/rank^s curve over n items."""
+    weights = [1 / (rank + 1) ** s for rank in range(n)]
+    rng.shuffle(weights)
+    total, cumulative = 0.0, []
+    for w in weights:
+        total += w
+        cumulative.append(total)
+    return cumulative
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(value).quantize(CENT)
+
+
+def _payments_for(rng: random.Random, total: Decimal, issue: date, due: date, until: date) -> list[Decimal]:
+    """Installment amounts received for one invoice by `until` (empty when unpaid)."""
+    if due > until:
+        fully, partially = 0.40, 0.10
+    else:
+        fully, partially = 0.80, 0.08
+    roll = rng.random()
+    if roll < fully:
+        parts = rng.choices([1, 2, 3], weights=[75, 20, 5])[0]
+        first = [_money(float(total) * rng.uniform(0.2, 0.6) / (parts - 1)) for _ in range(parts - 1)]
+        return first + [total - sum(first, Decimal(0))]
+    if roll < fully + partially:
+        return [_money(float(total) * rng.uniform(0.3, 0.7))]
+    return []
+
+
+def seed(engine, n_invoices: int, rng: random.Random, years: int = 3, until: date = UNTIL) -> Dataset:
+    """Fill an empty, migrated database (ids are assumed to start at 1)."""
+    n_companies = max(5, n_invoices // 2000)
+    n_clients = max(20, n_invoices // 100)
+    n_projects = max(50, n_invoices // 20)
+    span = years * 365
+    start = until - timedelta(days=span)
+    n_payments = 0
+    with engine.begin() as conn:
+        conn.execute(insert(models.Company), [
+            {"name": fake_name(rng), "gst_percent": rng.choice([18, None])} for _ in range(n_companies)])
+        client_company = [rng.randint(1, n_companies) for _ in range(n_clients)]
+        conn.execute(insert(models.Client), [
+            {"name": fake_name(rng), "company_id": company_id} for company_id in client_company])
+        # Every client has a project; the rest go mostly to the big clients
+        project_client = list(range(1, n_clients + 1))
+        project_client += rng.choices(range(1, n_clients + 1), cum_weights=zipf_weights(n_clients, rng),
+                                      k=n_projects - n_clients)
+        conn.execute(insert(models.Project), [
+            {"name": fake_name(rng), "client_id": client_id, "company_id": client_company[client_id - 1],
+             "status": rng.choice(["active", "active", "active", "completed", "on_hold"])}
+            for client_id in project_client])
+        project_weights = zipf_weights(n_projects, rng)
+
+        for offset in range(0, n_invoices, CHUNK):
+            count = min(CHUNK, n_invoices - offset)
+            invoice_rows, payment_rows = [], []
+            for i, project_id in enumerate(rng.choices(range(1, n_projects + 1), cum_weights=project_weights,
+                                                       k=count), start=offset + 1):
+                client_id = project_client[project_id - 1]
+                company_id = client_company[client_id - 1]
+                issue = start + timedelta(days=int(span * rng.random() ** 0.5))
+                due = issue + timedelta(days=rng.choices([15, 30, 45, 60], weights=[15, 50, 20, 15])[0])
+                subtotal = _money(min(rng.lognormvariate(10.1, 1.0), 50_000_000))
+                tax = money.gst(subtotal, rng.choices(GST_SLABS, weights=GST_WEIGHTS)[0])
+                total = subtotal + tax
+                kind = rng.random()
+                amounts = [] if kind < 0.06 else _payments_for(rng, total, issue, due, until)
+                paid = Decimal(0)
+                for amount in amounts:
+                    n_payments += 1
+                    linked = rng.random() >= 0.05
+                    paid += amount if linked else 0
+                    method = rng.choice(METHODS)
+                    payment_rows.append({
+                        "payment_number": f"PAY-{n_payments:08d}", "invoice_id": i if linked else None,
+                        "project_id": project_id, "client_id": client_id if linked or rng.random() < 0.5 else None,
+                        "company_id": company_id, "amount": amount,
+                        "payment_date": min(until, issue + timedelta(days=rng.randint(0, (due - issue).days + 45))),
+                        "method": method, "bank": rng.choice(BANKS) if method == "bank_transfer" else None,
+                        "transaction_no": f"TXN{n_payments:09d}" if method != "cash" else None,
+                    })
+                if kind < 0.04:
+                    status = "draft"
+                elif kind < 0.06:
+                    status = "cancelled"
+                elif paid >= total:
+                    status = "paid"
+                else:
+                    status = "overdue" if due < until else "sent"
+                invoice_rows.append({
+                    "invoice_number": f"INV-{i:08d}", "client_id": client_id, "project_id": project_id,
+                    "issue_date": issue, "due_date": due, "status": status,
+                    "currency": "INR" if rng.random() < 0.95 else "USD",
+                    "subtotal": subtotal, "tax": tax, "total": total, "amount_paid": paid, "balance": total - paid,
+                })
+            conn.execute(insert(models.Invoice), invoice_rows)
+            if payment_rows:
+                conn.execute(insert(models.Payment), payment_rows)
+        conn.execute(insert(models.User), [{"email": BENCH_USER, "password": hash_password(BENCH_PASSWORD)}])
+    with Session(engine) as db:
+        changes.backfill(db)
+        dashboard.rebuild_totals(db)
+        db.commit()
+        reports.rebuild_aging(db)
+    return Dataset(n_companies, n_clients, n_projects, n_invoices, n_payments)
+
+
+def reset(engine, revision: str = "head") -> None:
+    """Drop every table and migrate the empty database to `revision`."""
+    Base.metadata.drop_all(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE IF EXISTS alembic_version")
+    upgrade(engine, revision)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", required=True, help="throwaway database URL")
+    parser.add_argument("--invoices", type=int, default=100_000, help="e.g. 10000, 100000, 1000000")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--until", type=date.fromisoformat, default=UNTIL, help="latest issue/payment date")
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    reset(engine)
+    started = time.perf_counter()
+    data = seed(engine, args.invoices, random.Random(args.seed), args.years, args.until)
+    print(f"seeded {data.companies} companies, {data.clients} clients, {data.projects} projects, "
+          f"{data.invoices} invoices, {data.payments} payments in {time.perf_counter() - started:.1f}s")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Per-endpoint cost of the list responses: ORM + Pydantic (old path) vs column rows + orjson (core.fastjson).
+
+    python -m benchmarks.serialization_benchmark                 # seeded SQLite file, pages of 50 and 500
+    python -m benchmarks.serialization_benchmark --invoices 50000 --limits 100 1000
+
+The old path is reproduced here as the routers ran it: load entities, `XOut.model_validate` each one,
+build `Page[XOut]`, then FastAPI's response_model validation and JSON encoding on top. The `?expand` rows
+compare one joined page query against the per-row client/project/company lookups it replaces.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, desc
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.core import fastjson
+from app.crud import clients, companies, dashboard, invoices, payments, projects
+from app.crud.pagination import paginate
+from benchmarks.seed import reset, seed
+
+ENDPOINTS = [
+    ("GET /invoices/", models.Invoice, schemas.InvoiceOut, models.Invoice.issue_date, invoices.list_invoices),
+    ("GET /payments/", models.Payment, schemas.PaymentOut, models.Payment.payment_date, payments.list_payments),
+    ("GET /companies/", models.Company, schemas.CompanyOut, models.Company.created_at, companies.list_companies),
+    ("GET /clients/", models.Client, schemas.ClientOut, models.Client.created_at, clients.list_clients),
+    ("GET /projects/", models.Project, schemas.ProjectOut, models.Project.created_at, projects.list_projects),
+]
+
+
+def fastapi_render(adapter: TypeAdapter, content) -> bytes:
+    # What FastAPI 0.111 does with a returned model when the route declares response_model
+    value = adapter.validate_python(content, from_attributes=True)
+    return json.dumps(jsonable_encoder(adapter.dump_python(value, mode="json")), ensure_ascii=False,
+                      allow_nan=False, separators=(",", ":")).encode()
+
+
+def old_list(db: Session, model, out, sort_col, limit: int) -> bytes:
+    rows, next_cursor = paginate(db.query(model), sort_col, model.id, None, limit)
+    page = schemas.Page[out](items=[out.model_validate(x) for x in rows], next_cursor=next_cursor)
+    return fastapi_render(TypeAdapter(schemas.Page[out]), page)
+
+
+def new_list(db: Session, list_fn, limit: int) -> bytes:
+    rows, next_cursor = list_fn(db, limit=limit)
+    return fastjson.page(rows, next_cursor)
+
+
+def per_row_lookups(db: Session, limit: int) -> bytes:
+    # What the UI did without ?expand: the page, then client/project (and the project's company) per row
+    rows, next_cursor = invoices.list_invoices(db, limit=limit)
+    items = fastjson.rows(rows)
+    for item in items:
+        client = db.get(models.Client, item["client_id"])
+        project = db.get(models.Project, item["project_id"])
+        company = db.get(models.Company, project.company_id)
+        item.update({name: {"id": obj.id, "name": obj.name}
+                     for name, obj in (("client", client), ("project", project), ("company", company))})
+    return fastjson.dumps({"items": items, "next_cursor": next_cursor})
+
+
+def expanded_list(db: Session, limit: int) -> bytes:
+    rows, next_cursor = invoices.list_invoices(db, limit=limit, expand="client,project,company")
+    return fastjson.page(rows, next_cursor)
+
+
+def old_summary(db: Session) -> bytes:
+    totals = dashboard.get_totals(db)
+    recent_invoices = db.query(models.Invoice).order_by(desc(models.Invoice.issue_date)).limit(3).all()
+    recent_payments = db.query(models.Payment).order_by(desc(models.Payment.payment_date)).limit(3).all()
+    invoice_fields = ["id", "invoice_number", "client_id", "project_id", "status", "currency", "notes"]
+    payment_fields = ["id", "payment_number", "invoice_id", "project_id", "client_id", "company_id", "method",
+                      "bank", "transaction_no", "notes"]
+    body = {
+        "metrics": {"total_invoices": totals.invoice_count, "total_amount": float(totals.total_amount),
+                    "total_paid": float(totals.total_paid),
+                    "outstanding": float(totals.total_amount - totals.total_paid)},
+        "recent_invoices": [{**{f: getattr(x, f) for f in invoice_fields},
+                             "issue_date": x.issue_date.isoformat(),
+                             "due_date": x.due_date.isoformat() if x.due_date else None,
+                             "subtotal": float(x.subtotal), "tax": float(x.tax), "total": float(x.total),
+                             "amount_paid": float(x.amount_paid), "balance": float(x.balance),
+                             "created_at": x.created_at.isoformat() if x.created_at else None}
+                            for x in recent_invoices],
+        "recent_payments": [{**{f: getattr(p, f) for f in payment_fields}, "amount": float(p.amount),
+                             "payment_date": p.payment_date.isoformat(),
+                             "created_at": p.created_at.isoformat() if p.created_at else None}
+                            for p in recent_payments],
+    }
+    return json.dumps(jsonable_encoder(body), separators=(",", ":")).encode()
+
+
+def new_summary(db: Session) -> bytes:
+    totals = dashboard.get_totals(db)
+    recent_invoices, recent_payments = dashboard.recent_activity(db)
+    return fastjson.dumps({
+        "metrics": {"total_invoices": totals.invoice_count, "total_amount": totals.total_amount,
+                    "total_paid": totals.total_paid, "outstanding": totals.total_amount - totals.total_paid},
+        "recent_invoices": fastjson.rows(recent_invoices),
+        "recent_payments": fastjson.rows(recent_payments),
+    })
+
+
+def median_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="throwaway database URL (default: temporary SQLite file)")
+    parser.add_argument("--invoices", type=int, default=20_000)
+    parser.add_argument("--limits", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    url = args.url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "serialization_bench.db")
+    engine = create_engine(url)
+    reset(engine)
+    seed(engine, args.invoices, random.Random(42))
+
+    def fresh(fn, *fn_args):
+        # A new session per call, like a request: no identity-map reuse between iterations
+        with Session(engine) as db:
+            return fn(db, *fn_args)
+
+    print(f"{'endpoint':<22}{'limit':>6}{'old ms':>10}{'new ms':>10}{'speedup':>9}")
+    for label, model, out, sort_col, list_fn in ENDPOINTS:
+        for limit in args.limits:
+            # Both paths must produce the same JSON values
+            old_body, new_body = fresh(old_list, model, out, sort_col, limit), fresh(new_list, list_fn, limit)
+            assert json.loads(old_body) == json.loads(new_body)
+            old = median_ms(lambda: fresh(old_list, model, out, sort_col, limit), args.repeat)
+            new = median_ms(lambda: fresh(new_list, list_fn, limit), args.repeat)
+            print(f"{label:<22}{limit:>6}{old:>10.2f}{new:>10.2f}{old / new:>8.1f}x")
+    for limit in args.limits:
+        assert json.loads(fresh(per_row_lookups, limit)) == json.loads(fresh(expanded_list, limit))
+        old = median_ms(lambda: fresh(per_row_lookups, limit), args.repeat)
+        new = median_ms(lambda: fresh(expanded_list, limit), args.repeat)
+        print(f"{'GET /invoices/?expand':<22}{limit:>6}{old:>10.2f}{new:>10.2f}{old / new:>8.1f}x")
+    assert json.loads(fresh(old_summary)) == json.loads(fresh(new_summary))
+    old = median_ms(lambda: fresh(old_summary), args.repeat)
+    new = median_ms(lambda: fresh(new_summary), args.repeat)
+    print(f"{'GET /dashboard/summary':<22}{3:>6}{old:>10.2f}{new:>10.2f}{old / new:>8.1f}x")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Import time and cold start of the API, and how startup behaves while the database is down.
+
+    python -m benchmarks.startup_benchmark                        # temporary SQLite file, 1 and 4 workers
+    python -m benchmarks.startup_benchmark --workers 1 2 8 --runs 10
+    python -m benchmarks.startup_benchmark --url mysql+pymysql://root:pw@localhost/invoicer_bench
+
+1. `import app.main` in a fresh interpreter, alone and followed by migrate.upgrade() on a database already
+   at head (what every worker paid at import time before startup moved into the lifespan).
+2. Cold start of `python -m app.cli serve --workers N` and of a dev `uvicorn app.main:app` (migrating in
+   its lifespan): time until /health/live and /health/ready answer 200, and until SIGTERM has exited.
+3. Database down: serve against a SQLite file whose directory doesn't exist yet. The workers must come
+   up live with /health/ready at 503, then turn ready once the database appears, without a restart.
+"""
+import argparse
+import os
+import shutil
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+from sqlalchemy import create_engine
+
+from app.migrate import upgrade
+from benchmarks.load_test import BACKEND_DIR
+
+IMPORT_ONLY = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+IMPORT_AND_MIGRATE = ("import time; t = time.perf_counter(); import app.main; from app import migrate; "
+                      "migrate.upgrade(); print(time.perf_counter() - t)")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def import_ms(code: str, env: dict, runs: int) -> float:
+    times = [float(subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, check=True,
+                                  capture_output=True, text=True).stdout) * 1000 for _ in range(runs)]
+    return statistics.median(times)
+
+
+def poll(base_url: str, path: str, proc: subprocess.Popen, started: float, timeout: float = 60) -> float:
+    deadline = started + timeout
+    while time.perf_counter() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited during startup ({proc.returncode})")
+        try:
+            if httpx.get(base_url + path, timeout=1).status_code == 200:
+                return (time.perf_counter() - started) * 1000
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.01)
+    raise RuntimeError(f"{path} did not answer 200 within {timeout}s")
+
+
+def start(command: list[str], env: dict) -> tuple[subprocess.Popen, float]:
+    started = time.perf_counter()
+    return subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL), started
+
+
+def stop(proc: subprocess.Popen) -> float:
+    started = time.perf_counter()
+    proc.send_signal(signal.SIGTERM)
+    proc.wait(60)
+    return (time.perf_counter() - started) * 1000
+
+
+def cold_start(name: str, command: list[str], env: dict, runs: int) -> None:
+    live, ready, shutdown = [], [], []
+    for _ in range(runs):
+        port = free_port()
+        proc, started = start([*command, "--port", str(port)], env)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            live.append(poll(base_url, "/health/live", proc, started))
+            ready.append(poll(base_url, "/health/ready", proc, started))
+        finally:
+            shutdown.append(stop(proc))
+    print(f"{name:<30}{statistics.median(live):>10.0f}{statistics.median(ready):>10.0f}"
+          f"{statistics.median(shutdown):>12.0f}")
+
+
+def database_down(env: dict, migrated_db: str) -> None:
+    missing = tempfile.mkdtemp()
+    shutil.rmtree(missing)
+    url = "sqlite:///" + os.path.join(missing, "invoicer.db")
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    proc, started = start([sys.executable, "-m", "app.cli", "serve", "--workers", "2", "--port", str(port),
+                           "--log-level", "warning"], dict(env, DATABASE_URL=url, STARTUP_RETRY_SECONDS="0.5"))
+    try:
+        live = poll(base_url, "/health/live", proc, started)
+        time.sleep(1)  # past the first background check, so /health/ready reports why
+        response = httpx.get(base_url + "/health/ready")
+        print(f"\ndatabase down: live after {live:.0f} ms, ready {response.status_code} "
+              f"({response.json()['detail'][:60]})")
+        os.makedirs(missing)
+        shutil.copy(migrated_db, os.path.join(missing, "invoicer.db"))
+        recovered = time.perf_counter()
+        print(f"database back: ready after {poll(base_url, '/health/ready', proc, recovered):.0f} ms, no restart")
+    finally:
+        stop(proc)
+        shutil.rmtree(missing, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="database URL (default: temporary SQLite file, migrated first)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    url = args.url or "sqlite:///" + os.path.join(workdir, "invoicer.db")
+    engine = create_engine(url)
+    upgrade(engine)
+    engine.dispose()
+    # Shared backends would need Redis; startup doesn't depend on them, so several workers may skip them here
+    env = dict(os.environ, DATABASE_URL=url, SEARCH_WARM_ON_STARTUP="false", CACHE_BACKEND="none",
+               IDEMPOTENCY_BACKEND="none")
+
+    print(f"{'import (median of ' + str(args.runs) + ')':<30}{'ms':>10}")
+    print(f"{'import app.main':<30}{import_ms(IMPORT_ONLY, env, args.runs):>10.0f}")
+    print(f"{'  + migrate.upgrade() at head':<30}{import_ms(IMPORT_AND_MIGRATE, env, args.runs):>10.0f}")
+
+    print(f"\n{'cold start':<30}{'live ms':>10}{'ready ms':>10}{'sigterm ms':>12}")
+    cold_start("uvicorn (dev, migrates)", [sys.executable, "-m", "uvicorn", "app.main:app", "--log-level", "warning"],
+               env, args.runs)
+    for workers in args.workers:
+        cold_start(f"serve --workers {workers}", [sys.executable, "-m", "app.cli", "serve", "--workers", str(workers),
+                                                  "--log-level", "warning"], env, args.runs)
+    if not args.url:
+        database_down(env, url[len("sqlite:///"):])
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
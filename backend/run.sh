@@ -1,4 +1,7 @@
 #!/usr/bin/env bash
 export PYTHONUNBUFFERED=1
+if [ "$1" = "prod" ]; then
+  shift
+  exec python -m app.cli serve "$@"
+fi
 uvicorn app.main:app --reload
-
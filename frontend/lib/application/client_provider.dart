@@ -12,14 +12,32 @@ class ClientState {
   final List<Client> clients;
   final bool loading;
   final String? error;
+  // Cursor of the page after [clients]; null once the last page is loaded.
+  final String? nextCursor;
+  final bool loadingMore;
 
-  ClientState({this.clients = const [], this.loading = false, this.error});
+  ClientState({
+    this.clients = const [],
+    this.loading = false,
+    this.error,
+    this.nextCursor,
+    this.loadingMore = false,
+  });
 
-  ClientState copyWith({List<Client>? clients, bool? loading, String? error}) {
+  bool get hasMore => nextCursor != null;
+
+  ClientState copyWith({
+    List<Client>? clients,
+    bool? loading,
+    String? error,
+    bool? loadingMore,
+  }) {
     return ClientState(
       clients: clients ?? this.clients,
       loading: loading ?? this.loading,
       error: error,
+      nextCursor: this.nextCursor,
+      loadingMore: loadingMore ?? this.loadingMore,
     );
   }
 }
@@ -27,26 +45,46 @@ class ClientState {
 class ClientController extends StateNotifier<ClientState> {
   final ClientRepository _clientRepository;
 
+  String? _search;
+
   ClientController(this._clientRepository) : super(ClientState());
 
+  /// Loads the first page; [loadMoreClients] appends the next ones. [all]
+  /// walks pages up to [pickerLimit] instead, for dropdowns and lookups.
   Future<void> loadClients({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    bool all = false,
   }) async {
     state = state.copyWith(loading: true, error: null);
     try {
-      final clients = await _clientRepository.getClients(
+      final page = await _clientRepository.getClients(
         search: search,
-        skip: skip,
-        limit: limit,
+        all: all,
       );
-      state = state.copyWith(clients: clients, loading: false);
+      _search = search;
+      state = ClientState(clients: page.items, nextCursor: page.nextCursor);
     } catch (e) {
       state = state.copyWith(loading: false, error: e.toString());
     }
   }
 
+  Future<void> loadMoreClients() async {
+    if (!state.hasMore || state.loadingMore) return;
+    state = state.copyWith(loadingMore: true, error: null);
+    try {
+      final page = await _clientRepository.getClients(
+        search: _search,
+        cursor: state.nextCursor,
+      );
+      state = ClientState(
+        clients: [...state.clients, ...page.items],
+        nextCursor: page.nextCursor,
+      );
+    } catch (e) {
+      state = state.copyWith(loadingMore: false, error: e.toString());
+    }
+  }
+
   Future<Client?> loadClientById(int clientId) async {
     state = state.copyWith(loading: true, error: null);
     try {
@@ -12,18 +12,32 @@ class CompanyState {
   final List<Company> companies;
   final bool loading;
   final String? error;
+  // Cursor of the page after [companies]; null once the last page is loaded.
+  final String? nextCursor;
+  final bool loadingMore;
 
-  CompanyState({this.companies = const [], this.loading = false, this.error});
+  CompanyState({
+    this.companies = const [],
+    this.loading = false,
+    this.error,
+    this.nextCursor,
+    this.loadingMore = false,
+  });
+
+  bool get hasMore => nextCursor != null;
 
   CompanyState copyWith({
     List<Company>? companies,
     bool? loading,
     String? error,
+    bool? loadingMore,
   }) {
     return CompanyState(
       companies: companies ?? this.companies,
       loading: loading ?? this.loading,
       error: error,
+      nextCursor: this.nextCursor,
+      loadingMore: loadingMore ?? this.loadingMore,
     );
   }
 }
@@ -31,26 +45,46 @@ class CompanyState {
 class CompanyController extends StateNotifier<CompanyState> {
   final CompanyRepository _companyRepository;
 
+  String? _search;
+
   CompanyController(this._companyRepository) : super(CompanyState());
 
+  /// Loads the first page; [loadMoreCompanies] appends the next ones. [all]
+  /// walks pages up to [pickerLimit] instead, for dropdowns and lookups.
   Future<void> loadCompanies({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    bool all = false,
   }) async {
     state = state.copyWith(loading: true, error: null);
     try {
-      final companies = await _companyRepository.getCompanies(
+      final page = await _companyRepository.getCompanies(
         search: search,
-        skip: skip,
-        limit: limit,
+        all: all,
       );
-      state = state.copyWith(companies: companies, loading: false);
+      _search = search;
+      state = CompanyState(companies: page.items, nextCursor: page.nextCursor);
     } catch (e) {
       state = CompanyState(loading: false, error: e.toString());
     }
   }
 
+  Future<void> loadMoreCompanies() async {
+    if (!state.hasMore || state.loadingMore) return;
+    state = state.copyWith(loadingMore: true, error: null);
+    try {
+      final page = await _companyRepository.getCompanies(
+        search: _search,
+        cursor: state.nextCursor,
+      );
+      state = CompanyState(
+        companies: [...state.companies, ...page.items],
+        nextCursor: page.nextCursor,
+      );
+    } catch (e) {
+      state = state.copyWith(loadingMore: false, error: e.toString());
+    }
+  }
+
   Future<Company?> loadCompanyById(int companyId) async {
     state = state.copyWith(loading: true, error: null);
     try {
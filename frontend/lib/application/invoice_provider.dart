@@ -12,14 +12,32 @@ class InvoiceState {
   final List<Invoice> invoices;
   final bool loading;
   final String? error;
+  // Cursor of the page after [invoices]; null once the last page is loaded.
+  final String? nextCursor;
+  final bool loadingMore;
 
-  InvoiceState({this.invoices = const [], this.loading = false, this.error});
+  InvoiceState({
+    this.invoices = const [],
+    this.loading = false,
+    this.error,
+    this.nextCursor,
+    this.loadingMore = false,
+  });
 
-  InvoiceState copyWith({List<Invoice>? invoices, bool? loading, String? error}) {
+  bool get hasMore => nextCursor != null;
+
+  InvoiceState copyWith({
+    List<Invoice>? invoices,
+    bool? loading,
+    String? error,
+    bool? loadingMore,
+  }) {
     return InvoiceState(
       invoices: invoices ?? this.invoices,
       loading: loading ?? this.loading,
       error: error,
+      nextCursor: this.nextCursor,
+      loadingMore: loadingMore ?? this.loadingMore,
     );
   }
 }
@@ -27,33 +45,56 @@ class InvoiceState {
 class InvoiceController extends StateNotifier<InvoiceState> {
   final InvoiceRepository _invoiceRepository;
 
+  int? _clientId;
+  String? _status;
+
   InvoiceController(this._invoiceRepository) : super(InvoiceState());
 
+  /// Loads the first page; [loadMoreInvoices] appends the next ones. [all]
+  /// walks pages up to [pickerLimit] instead, for dropdowns and lookups.
   Future<void> loadInvoices({
     int? clientId,
     String? status,
-    int skip = 0,
-    int limit = 20,
+    bool all = false,
   }) async {
     state = state.copyWith(loading: true, error: null);
     try {
-      final invoices = await _invoiceRepository.getInvoices(
+      final page = await _invoiceRepository.getInvoices(
         clientId: clientId,
         status: status,
-        skip: skip,
-        limit: limit,
+        all: all,
       );
-      state = state.copyWith(invoices: invoices, loading: false);
+      _clientId = clientId;
+      _status = status;
+      state = InvoiceState(invoices: page.items, nextCursor: page.nextCursor);
     } catch (e) {
       state = state.copyWith(loading: false, error: e.toString());
     }
   }
 
+  Future<void> loadMoreInvoices() async {
+    if (!state.hasMore || state.loadingMore) return;
+    state = state.copyWith(loadingMore: true, error: null);
+    try {
+      final page = await _invoiceRepository.getInvoices(
+        clientId: _clientId,
+        status: _status,
+        cursor: state.nextCursor,
+      );
+      state = InvoiceState(
+        invoices: [...state.invoices, ...page.items],
+        nextCursor: page.nextCursor,
+      );
+    } catch (e) {
+      state = state.copyWith(loadingMore: false, error: e.toString());
+    }
+  }
+
   Future<void> loadInvoicesByProject(int projectId) async {
     state = state.copyWith(loading: true, error: null);
     try {
       final invoices = await _invoiceRepository.getInvoicesByProject(projectId);
-      state = state.copyWith(invoices: invoices, loading: false);
+      state = InvoiceState(invoices: invoices);
     } catch (e) {
       state = state.copyWith(loading: false, error: e.toString());
     }
@@ -12,14 +12,32 @@ class PaymentState {
   final List<Payment> payments;
   final bool loading;
   final String? error;
+  // Cursor of the page after [payments]; null once the last page is loaded.
+  final String? nextCursor;
+  final bool loadingMore;
 
-  PaymentState({this.payments = const [], this.loading = false, this.error});
+  PaymentState({
+    this.payments = const [],
+    this.loading = false,
+    this.error,
+    this.nextCursor,
+    this.loadingMore = false,
+  });
 
-  PaymentState copyWith({List<Payment>? payments, bool? loading, String? error}) {
+  bool get hasMore => nextCursor != null;
+
+  PaymentState copyWith({
+    List<Payment>? payments,
+    bool? loading,
+    String? error,
+    bool? loadingMore,
+  }) {
     return PaymentState(
       payments: payments ?? this.payments,
       loading: loading ?? this.loading,
       error: error,
+      nextCursor: this.nextCursor,
+      loadingMore: loadingMore ?? this.loadingMore,
     );
   }
 }
@@ -27,31 +45,51 @@ class PaymentState {
 class PaymentController extends StateNotifier<PaymentState> {
   final PaymentRepository _paymentRepository;
 
+  int? _invoiceId;
+
   PaymentController(this._paymentRepository) : super(PaymentState());
 
+  /// Loads the first page; [loadMorePayments] appends the next ones. [all]
+  /// walks pages up to [pickerLimit] instead, for dropdowns and lookups.
   Future<void> loadPayments({
     int? invoiceId,
-    int skip = 0,
-    int limit = 20,
+    bool all = false,
   }) async {
     state = state.copyWith(loading: true, error: null);
     try {
-      final payments = await _paymentRepository.getPayments(
+      final page = await _paymentRepository.getPayments(
         invoiceId: invoiceId,
-        skip: skip,
-        limit: limit,
+        all: all,
       );
-      state = state.copyWith(payments: payments, loading: false);
+      _invoiceId = invoiceId;
+      state = PaymentState(payments: page.items, nextCursor: page.nextCursor);
     } catch (e) {
       state = state.copyWith(loading: false, error: e.toString());
     }
   }
 
+  Future<void> loadMorePayments() async {
+    if (!state.hasMore || state.loadingMore) return;
+    state = state.copyWith(loadingMore: true, error: null);
+    try {
+      final page = await _paymentRepository.getPayments(
+        invoiceId: _invoiceId,
+        cursor: state.nextCursor,
+      );
+      state = PaymentState(
+        payments: [...state.payments, ...page.items],
+        nextCursor: page.nextCursor,
+      );
+    } catch (e) {
+      state = state.copyWith(loadingMore: false, error: e.toString());
+    }
+  }
+
   Future<void> loadPaymentsByInvoice(int invoiceId) async {
     state = state.copyWith(loading: true, error: null);
     try {
       final payments = await _paymentRepository.getPaymentsByInvoice(invoiceId);
-      state = state.copyWith(payments: payments, loading: false);
+      state = PaymentState(payments: payments);
     } catch (e) {
       state = state.copyWith(loading: false, error: e.toString());
     }
@@ -12,14 +12,32 @@ class ProjectState {
   final List<Project> projects;
   final bool loading;
   final String? error;
+  // Cursor of the page after [projects]; null once the last page is loaded.
+  final String? nextCursor;
+  final bool loadingMore;
 
-  ProjectState({this.projects = const [], this.loading = false, this.error});
+  ProjectState({
+    this.projects = const [],
+    this.loading = false,
+    this.error,
+    this.nextCursor,
+    this.loadingMore = false,
+  });
 
-  ProjectState copyWith({List<Project>? projects, bool? loading, String? error}) {
+  bool get hasMore => nextCursor != null;
+
+  ProjectState copyWith({
+    List<Project>? projects,
+    bool? loading,
+    String? error,
+    bool? loadingMore,
+  }) {
     return ProjectState(
       projects: projects ?? this.projects,
       loading: loading ?? this.loading,
       error: error,
+      nextCursor: this.nextCursor,
+      loadingMore: loadingMore ?? this.loadingMore,
     );
   }
 }
@@ -27,26 +45,46 @@ class ProjectState {
 class ProjectController extends StateNotifier<ProjectState> {
   final ProjectRepository _projectRepository;
 
+  String? _search;
+
   ProjectController(this._projectRepository) : super(ProjectState());
 
+  /// Loads the first page; [loadMoreProjects] appends the next ones. [all]
+  /// walks pages up to [pickerLimit] instead, for dropdowns and lookups.
   Future<void> loadProjects({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    bool all = false,
   }) async {
     state = state.copyWith(loading: true, error: null);
     try {
-      final projects = await _projectRepository.getProjects(
+      final page = await _projectRepository.getProjects(
         search: search,
-        skip: skip,
-        limit: limit,
+        all: all,
       );
-      state = state.copyWith(projects: projects, loading: false);
+      _search = search;
+      state = ProjectState(projects: page.items, nextCursor: page.nextCursor);
     } catch (e) {
       state = state.copyWith(loading: false, error: e.toString());
     }
   }
 
+  Future<void> loadMoreProjects() async {
+    if (!state.hasMore || state.loadingMore) return;
+    state = state.copyWith(loadingMore: true, error: null);
+    try {
+      final page = await _projectRepository.getProjects(
+        search: _search,
+        cursor: state.nextCursor,
+      );
+      state = ProjectState(
+        projects: [...state.projects, ...page.items],
+        nextCursor: page.nextCursor,
+      );
+    } catch (e) {
+      state = state.copyWith(loadingMore: false, error: e.toString());
+    }
+  }
+
   Future<Project?> loadProjectById(int projectId) async {
     state = state.copyWith(loading: true, error: null);
     try {
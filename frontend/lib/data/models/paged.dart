@@ -0,0 +1,13 @@
+/// One page of a list endpoint: its rows and the cursor of the next page
+/// (null on the last one).
+class Paged<T> {
+  final List<T> items;
+  final String? nextCursor;
+
+  Paged(this.items, this.nextCursor);
+
+  bool get hasMore => nextCursor != null;
+
+  Paged<R> map<R>(R Function(T item) convert) =>
+      Paged(items.map(convert).toList(), nextCursor);
+}
@@ -1,6 +1,7 @@
 import '../dtos/client_create.dart';
 import '../dtos/client_update.dart';
 import '../models/client.dart';
+import '../models/paged.dart';
 import '../services/client_service.dart';
 
 class ClientRepository {
@@ -8,12 +9,12 @@ class ClientRepository {
 
   ClientRepository(this._clientService);
 
-  Future<List<Client>> getClients({
+  Future<Paged<Client>> getClients({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) {
-    return _clientService.getClients(search: search, skip: skip, limit: limit);
+    return _clientService.getClients(search: search, cursor: cursor, all: all);
   }
 
   Future<Client> getClientById(int clientId) {
@@ -1,6 +1,7 @@
 import '../dtos/company_create.dart';
 import '../dtos/company_update.dart';
 import '../models/company.dart';
+import '../models/paged.dart';
 import '../services/company_service.dart';
 
 class CompanyRepository {
@@ -8,15 +9,15 @@ class CompanyRepository {
 
   CompanyRepository(this._companyService);
 
-  Future<List<Company>> getCompanies({
+  Future<Paged<Company>> getCompanies({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) {
     return _companyService.getCompanies(
       search: search,
-      skip: skip,
-      limit: limit,
+      cursor: cursor,
+      all: all,
     );
   }
 
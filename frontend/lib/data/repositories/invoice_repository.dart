@@ -1,6 +1,7 @@
 import '../dtos/invoice_create.dart';
 import '../dtos/invoice_update.dart';
 import '../models/invoice.dart';
+import '../models/paged.dart';
 import '../services/invoice_service.dart';
 
 class InvoiceRepository {
@@ -8,17 +9,17 @@ class InvoiceRepository {
 
   InvoiceRepository(this._service);
 
-  Future<List<Invoice>> getInvoices({
+  Future<Paged<Invoice>> getInvoices({
     int? clientId,
     String? status,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) async {
     return await _service.getInvoices(
       clientId: clientId,
       status: status,
-      skip: skip,
-      limit: limit,
+      cursor: cursor,
+      all: all,
     );
   }
 
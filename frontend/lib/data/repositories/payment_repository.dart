@@ -1,6 +1,7 @@
 import '../dtos/payment_create.dart';
 import '../dtos/payment_update.dart';
 import '../models/payment.dart';
+import '../models/paged.dart';
 import '../services/payment_service.dart';
 
 class PaymentRepository {
@@ -8,15 +9,15 @@ class PaymentRepository {
 
   PaymentRepository(this._paymentService);
 
-  Future<List<Payment>> getPayments({
+  Future<Paged<Payment>> getPayments({
     int? invoiceId,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) async {
     return await _paymentService.getPayments(
       invoiceId: invoiceId,
-      skip: skip,
-      limit: limit,
+      cursor: cursor,
+      all: all,
     );
   }
 
@@ -1,6 +1,7 @@
 import '../dtos/project_create.dart';
 import '../dtos/project_update.dart';
 import '../models/project.dart';
+import '../models/paged.dart';
 import '../services/project_service.dart';
 
 class ProjectRepository {
@@ -8,12 +9,12 @@ class ProjectRepository {
 
   ProjectRepository(this._projectService);
 
-  Future<List<Project>> getProjects({
+  Future<Paged<Project>> getProjects({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) {
-    return _projectService.getProjects(search: search, skip: skip, limit: limit);
+    return _projectService.getProjects(search: search, cursor: cursor, all: all);
   }
 
   Future<Project> getProjectById(int projectId) {
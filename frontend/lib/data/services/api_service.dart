@@ -1,7 +1,21 @@
+import 'dart:math';
+
 import 'package:dio/dio.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import 'package:invoice/core/config.dart';
 
+import '../models/paged.dart';
+
+/// Sent by the API after a write; echoing it back pins our reads to the
+/// primary database until then, so lists show what we just created.
+const readPrimaryHeader = 'x-read-primary-until';
+
+/// Largest page the API serves (PAGE_SIZE_MAX).
+const maxPageSize = 500;
+
+/// Most rows a dropdown or lookup loads; longer lists need search.
+const pickerLimit = 1000;
+
 class ApiService {
   final Dio dio;
 
@@ -17,16 +31,69 @@ class ApiService {
       ),
     );
 
+    String? readPrimaryUntil;
     dio.interceptors.add(
       InterceptorsWrapper(
-        onRequest: (options, handler) => handler.next(options),
-        onResponse: (response, handler) => handler.next(response),
+        onRequest: (options, handler) {
+          if (readPrimaryUntil != null) {
+            options.headers[readPrimaryHeader] = readPrimaryUntil;
+          }
+          handler.next(options);
+        },
+        onResponse: (response, handler) {
+          readPrimaryUntil =
+              response.headers.value(readPrimaryHeader) ?? readPrimaryUntil;
+          handler.next(response);
+        },
         onError: (error, handler) => handler.next(error),
       ),
     );
 
     return ApiService._internal(dio);
   }
+
+  /// GETs one page of a list endpoint; pass the previous page's
+  /// `nextCursor` to get the one after it.
+  Future<Paged<dynamic>> getPage(
+    String path, {
+    Map<String, dynamic> queryParameters = const {},
+    String? cursor,
+    int? limit,
+  }) async {
+    final Response response = await dio.get(
+      path,
+      queryParameters: {
+        ...queryParameters,
+        if (limit != null) "limit": limit,
+        if (cursor != null) "cursor": cursor,
+      },
+    );
+    final page = response.data as Map<String, dynamic>;
+    return Paged(page['items'] as List<dynamic>, page['next_cursor'] as String?);
+  }
+
+  /// Follows `next_cursor` until the last page or [maxItems] rows, for
+  /// pickers and lookups that need more than one page. Lists load page by
+  /// page instead. The returned cursor is where it stopped.
+  Future<Paged<dynamic>> getAllPages(
+    String path, {
+    Map<String, dynamic> queryParameters = const {},
+    int maxItems = pickerLimit,
+  }) async {
+    final items = <dynamic>[];
+    String? cursor;
+    do {
+      final page = await getPage(
+        path,
+        queryParameters: queryParameters,
+        cursor: cursor,
+        limit: min(maxPageSize, maxItems - items.length),
+      );
+      items.addAll(page.items);
+      cursor = page.nextCursor;
+    } while (cursor != null && items.length < maxItems);
+    return Paged(items, cursor);
+  }
 }
 
 final apiServiceProvider = Provider<ApiService>((ref) => ApiService());
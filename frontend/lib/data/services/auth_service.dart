@@ -21,6 +21,11 @@ class AuthService {
         throw Exception("Invalid response");
       }
 
+      final token = data['access_token'];
+      if (token != null) {
+        _apiService.dio.options.headers['Authorization'] = 'Bearer $token';
+      }
+
       return User.fromJson(data['user'] as Map<String, dynamic>);
     } on DioError catch (e) {
       final msg =
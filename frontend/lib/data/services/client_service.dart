@@ -3,6 +3,7 @@ import 'package:dio/dio.dart';
 import '../dtos/client_create.dart';
 import '../dtos/client_update.dart';
 import '../models/client.dart';
+import '../models/paged.dart';
 import 'api_service.dart';
 
 class ClientService {
@@ -10,25 +11,25 @@ class ClientService {
 
   ClientService(this._apiService);
 
-  Future<List<Client>> getClients({
+  /// One page of clients; [all] walks pages up to [pickerLimit]
+  /// instead, for dropdowns and lookups.
+  Future<Paged<Client>> getClients({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) async {
     try {
-      final Response response = await _apiService.dio.get(
-        "/clients/",
-        queryParameters: {
-          if (search != null) "q": search,
-          "skip": skip,
-          "limit": limit,
-        },
-      );
-
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
-          .map((json) => Client.fromJson(json as Map<String, dynamic>))
-          .toList();
+      final query = {
+        if (search != null) "q": search,
+      };
+      final page = all
+          ? await _apiService.getAllPages("/clients/", queryParameters: query)
+          : await _apiService.getPage(
+              "/clients/",
+              queryParameters: query,
+              cursor: cursor,
+            );
+      return page.map((json) => Client.fromJson(json as Map<String, dynamic>));
     } on DioError catch (e) {
       final msg =
           e.response?.data is Map<String, dynamic>
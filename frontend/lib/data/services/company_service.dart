@@ -3,6 +3,7 @@ import 'package:dio/dio.dart';
 import '../dtos/company_create.dart';
 import '../dtos/company_update.dart';
 import '../models/company.dart';
+import '../models/paged.dart';
 import 'api_service.dart';
 
 class CompanyService {
@@ -10,25 +11,25 @@ class CompanyService {
 
   CompanyService(this._apiService);
 
-  Future<List<Company>> getCompanies({
+  /// One page of companies; [all] walks pages up to [pickerLimit]
+  /// instead, for dropdowns and lookups.
+  Future<Paged<Company>> getCompanies({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) async {
     try {
-      final Response response = await _apiService.dio.get(
-        "/companies/",
-        queryParameters: {
-          if (search != null) "q": search,
-          "skip": skip,
-          "limit": limit,
-        },
-      );
-
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
-          .map((json) => Company.fromJson(json as Map<String, dynamic>))
-          .toList();
+      final query = {
+        if (search != null) "q": search,
+      };
+      final page = all
+          ? await _apiService.getAllPages("/companies/", queryParameters: query)
+          : await _apiService.getPage(
+              "/companies/",
+              queryParameters: query,
+              cursor: cursor,
+            );
+      return page.map((json) => Company.fromJson(json as Map<String, dynamic>));
     } on DioError catch (e) {
       final msg =
           e.response?.data is Map<String, dynamic>
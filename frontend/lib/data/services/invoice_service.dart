@@ -3,6 +3,7 @@ import 'package:dio/dio.dart';
 import '../dtos/invoice_create.dart';
 import '../dtos/invoice_update.dart';
 import '../models/invoice.dart';
+import '../models/paged.dart';
 import 'api_service.dart';
 
 class InvoiceService {
@@ -10,27 +11,27 @@ class InvoiceService {
 
   InvoiceService(this._apiService);
 
-  Future<List<Invoice>> getInvoices({
+  /// One page of invoices; [all] walks pages up to [pickerLimit]
+  /// instead, for dropdowns and lookups.
+  Future<Paged<Invoice>> getInvoices({
     int? clientId,
     String? status,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) async {
     try {
-      final Response response = await _apiService.dio.get(
-        "/invoices/",
-        queryParameters: {
-          if (clientId != null) "client_id": clientId,
-          if (status != null) "status": status,
-          "skip": skip,
-          "limit": limit,
-        },
-      );
-
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
-          .map((json) => Invoice.fromJson(json as Map<String, dynamic>))
-          .toList();
+      final query = {
+        if (clientId != null) "client_id": clientId,
+        if (status != null) "status": status,
+      };
+      final page = all
+          ? await _apiService.getAllPages("/invoices/", queryParameters: query)
+          : await _apiService.getPage(
+              "/invoices/",
+              queryParameters: query,
+              cursor: cursor,
+            );
+      return page.map((json) => Invoice.fromJson(json as Map<String, dynamic>));
     } on DioError catch (e) {
       final msg =
           e.response?.data is Map<String, dynamic>
@@ -43,15 +44,13 @@ class InvoiceService {
 
   Future<List<Invoice>> getInvoicesByProject(int projectId) async {
     try {
-      final Response response = await _apiService.dio.get(
+      final page = await _apiService.getAllPages(
         "/invoices/",
         queryParameters: {
           "project_id": projectId,
         },
       );
-
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
+      return page.items
           .map((json) => Invoice.fromJson(json as Map<String, dynamic>))
           .toList();
     } on DioError catch (e) {
@@ -3,6 +3,7 @@ import 'package:dio/dio.dart';
 import '../dtos/payment_create.dart';
 import '../dtos/payment_update.dart';
 import '../models/payment.dart';
+import '../models/paged.dart';
 import 'api_service.dart';
 
 class PaymentService {
@@ -10,25 +11,25 @@ class PaymentService {
 
   PaymentService(this._apiService);
 
-  Future<List<Payment>> getPayments({
+  /// One page of payments; [all] walks pages up to [pickerLimit]
+  /// instead, for dropdowns and lookups.
+  Future<Paged<Payment>> getPayments({
     int? invoiceId,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) async {
     try {
-      final Response response = await _apiService.dio.get(
-        "/payments/",
-        queryParameters: {
-          if (invoiceId != null) "invoice_id": invoiceId,
-          "skip": skip,
-          "limit": limit,
-        },
-      );
-
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
-          .map((json) => Payment.fromJson(json as Map<String, dynamic>))
-          .toList();
+      final query = {
+        if (invoiceId != null) "invoice_id": invoiceId,
+      };
+      final page = all
+          ? await _apiService.getAllPages("/payments/", queryParameters: query)
+          : await _apiService.getPage(
+              "/payments/",
+              queryParameters: query,
+              cursor: cursor,
+            );
+      return page.map((json) => Payment.fromJson(json as Map<String, dynamic>));
     } on DioError catch (e) {
       final msg =
           e.response?.data is Map<String, dynamic>
@@ -41,15 +42,13 @@ class PaymentService {
 
   Future<List<Payment>> getPaymentsByInvoice(int invoiceId) async {
     try {
-      final Response response = await _apiService.dio.get(
+      final page = await _apiService.getAllPages(
         "/payments/",
         queryParameters: {
           "invoice_id": invoiceId,
         },
       );
-
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
+      return page.items
           .map((json) => Payment.fromJson(json as Map<String, dynamic>))
           .toList();
     } on DioError catch (e) {
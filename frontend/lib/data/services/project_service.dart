@@ -3,6 +3,7 @@ import 'package:dio/dio.dart';
 import '../dtos/project_create.dart';
 import '../dtos/project_update.dart';
 import '../models/project.dart';
+import '../models/paged.dart';
 import 'api_service.dart';
 
 class ProjectService {
@@ -10,25 +11,25 @@ class ProjectService {
 
   ProjectService(this._apiService);
 
-  Future<List<Project>> getProjects({
+  /// One page of projects; [all] walks pages up to [pickerLimit]
+  /// instead, for dropdowns and lookups.
+  Future<Paged<Project>> getProjects({
     String? search,
-    int skip = 0,
-    int limit = 20,
+    String? cursor,
+    bool all = false,
   }) async {
     try {
-      final Response response = await _apiService.dio.get(
-        "/projects/",
-        queryParameters: {
-          if (search != null) "q": search,
-          "skip": skip,
-          "limit": limit,
-        },
-      );
-
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
-          .map((json) => Project.fromJson(json as Map<String, dynamic>))
-          .toList();
+      final query = {
+        if (search != null) "q": search,
+      };
+      final page = all
+          ? await _apiService.getAllPages("/projects/", queryParameters: query)
+          : await _apiService.getPage(
+              "/projects/",
+              queryParameters: query,
+              cursor: cursor,
+            );
+      return page.map((json) => Project.fromJson(json as Map<String, dynamic>));
     } on DioError catch (e) {
       final msg =
           e.response?.data is Map<String, dynamic>
@@ -54,15 +55,13 @@ class ProjectService {
 
   Future<List<Project>> getProjectsByClientId(int clientId) async {
     try {
-      final Response response = await _apiService.dio.get(
+      final page = await _apiService.getAllPages(
         "/projects/",
         queryParameters: {
           "client_id": clientId,
         },
       );
-
-      final List<dynamic> data = response.data as List<dynamic>;
-      return data
+      return page.items
           .map((json) => Project.fromJson(json as Map<String, dynamic>))
           .toList();
     } on DioError catch (e) {
@@ -31,9 +31,12 @@ class _ClientDetailsScreenState extends ConsumerState<ClientDetailsScreen> {
   void initState() {
     super.initState();
     WidgetsBinding.instance.addPostFrameCallback((_) {
-      ref.read(companyProvider.notifier).loadCompanies();
-      ref.read(projectProvider.notifier).loadProjects();
-      ref.read(invoiceProvider.notifier).loadInvoices();
+      ref.read(companyProvider.notifier).loadCompanies(all: true);
+      ref.read(projectProvider.notifier).loadProjects(all: true);
+      ref.read(invoiceProvider.notifier).loadInvoices(
+        clientId: widget.client.id,
+        all: true,
+      );
     });
   }
 
@@ -25,7 +25,7 @@ class _ClientsScreenState extends ConsumerState<ClientsScreen> {
     WidgetsBinding.instance.addPostFrameCallback((_) {
       if (!_loadedOnce) {
         ref.read(clientProvider.notifier).loadClients();
-        ref.read(companyProvider.notifier).loadCompanies();
+        ref.read(companyProvider.notifier).loadCompanies(all: true);
         _loadedOnce = true;
       }
     });
@@ -97,8 +97,11 @@ class _ClientsScreenState extends ConsumerState<ClientsScreen> {
       onRefresh: () => ref.read(clientProvider.notifier).loadClients(),
       child: ListView.builder(
         padding: const EdgeInsets.all(16),
-        itemCount: state.clients.length,
+        itemCount: state.clients.length + (state.hasMore ? 1 : 0),
         itemBuilder: (context, index) {
+          if (index == state.clients.length) {
+            return _buildLoadMore(state);
+          }
           final client = state.clients[index];
           return _buildClientCard(client);
         },
@@ -106,6 +109,21 @@ class _ClientsScreenState extends ConsumerState<ClientsScreen> {
     );
   }
 
+  Widget _buildLoadMore(ClientState state) {
+    return Center(
+      child: state.loadingMore
+          ? const Padding(
+              padding: EdgeInsets.all(8),
+              child: CircularProgressIndicator(),
+            )
+          : TextButton.icon(
+              onPressed: () => ref.read(clientProvider.notifier).loadMoreClients(),
+              icon: const Icon(Icons.expand_more),
+              label: const Text("Load more"),
+            ),
+    );
+  }
+
   Widget _buildClientCard(Client client) {
     return Card(
       margin: const EdgeInsets.only(bottom: 12),
@@ -93,8 +93,11 @@ class _CompaniesScreenState extends ConsumerState<CompaniesScreen> {
       onRefresh: () => ref.read(companyProvider.notifier).loadCompanies(),
       child: ListView.builder(
         padding: const EdgeInsets.all(16),
-        itemCount: state.companies.length,
+        itemCount: state.companies.length + (state.hasMore ? 1 : 0),
         itemBuilder: (context, index) {
+          if (index == state.companies.length) {
+            return _buildLoadMore(state);
+          }
           final company = state.companies[index];
           return _buildCompanyCard(company);
         },
@@ -102,6 +105,21 @@ class _CompaniesScreenState extends ConsumerState<CompaniesScreen> {
     );
   }
 
+  Widget _buildLoadMore(CompanyState state) {
+    return Center(
+      child: state.loadingMore
+          ? const Padding(
+              padding: EdgeInsets.all(8),
+              child: CircularProgressIndicator(),
+            )
+          : TextButton.icon(
+              onPressed: () => ref.read(companyProvider.notifier).loadMoreCompanies(),
+              icon: const Icon(Icons.expand_more),
+              label: const Text("Load more"),
+            ),
+    );
+  }
+
   Widget _buildCompanyCard(Company company) {
     return Card(
       margin: const EdgeInsets.only(bottom: 12),
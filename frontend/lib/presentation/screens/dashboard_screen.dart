@@ -45,9 +45,9 @@ class _DashboardScreenState extends ConsumerState<DashboardScreen> {
     WidgetsBinding.instance.addPostFrameCallback((_) {
       if (!_loadedOnce) {
         ref.read(dashboardProvider.notifier).load();
-        ref.read(companyProvider.notifier).loadCompanies();
-        ref.read(clientProvider.notifier).loadClients();
-        ref.read(projectProvider.notifier).loadProjects();
+        ref.read(companyProvider.notifier).loadCompanies(all: true);
+        ref.read(clientProvider.notifier).loadClients(all: true);
+        ref.read(projectProvider.notifier).loadProjects(all: true);
         _loadedOnce = true;
       }
     });
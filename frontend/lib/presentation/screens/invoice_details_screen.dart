@@ -30,9 +30,9 @@ class _InvoiceDetailsScreenState extends ConsumerState<InvoiceDetailsScreen> {
   void initState() {
     super.initState();
     WidgetsBinding.instance.addPostFrameCallback((_) {
-      ref.read(projectProvider.notifier).loadProjects();
-      ref.read(companyProvider.notifier).loadCompanies();
-      ref.read(clientProvider.notifier).loadClients();
+      ref.read(projectProvider.notifier).loadProjects(all: true);
+      ref.read(companyProvider.notifier).loadCompanies(all: true);
+      ref.read(clientProvider.notifier).loadClients(all: true);
     });
   }
 
@@ -45,9 +45,9 @@ class _InvoicesScreenState extends ConsumerState<InvoicesScreen> {
     WidgetsBinding.instance.addPostFrameCallback((_) {
       if (!_loadedOnce) {
         ref.read(invoiceProvider.notifier).loadInvoices();
-        ref.read(companyProvider.notifier).loadCompanies();
-        ref.read(clientProvider.notifier).loadClients();
-        ref.read(projectProvider.notifier).loadProjects();
+        ref.read(companyProvider.notifier).loadCompanies(all: true);
+        ref.read(clientProvider.notifier).loadClients(all: true);
+        ref.read(projectProvider.notifier).loadProjects(all: true);
         _loadedOnce = true;
       }
     });
@@ -202,7 +202,7 @@ class _InvoicesScreenState extends ConsumerState<InvoicesScreen> {
                 : _buildInvoicesList(paginatedInvoices),
           ),
           // Pagination
-          if (filteredInvoices.length > _itemsPerPage)
+          if (filteredInvoices.length > _itemsPerPage || state.hasMore)
             _buildPagination(filteredInvoices.length),
         ],
       ),
@@ -583,6 +583,9 @@ class _InvoicesScreenState extends ConsumerState<InvoicesScreen> {
     final totalPages = (totalItems / _itemsPerPage).ceil();
     final startItem = (_currentPage - 1) * _itemsPerPage + 1;
     final endItem = (_currentPage * _itemsPerPage).clamp(0, totalItems);
+    // More rows on the server: the next arrow fetches them.
+    final hasMore = ref.watch(invoiceProvider).hasMore;
+    final canGoNext = _currentPage < totalPages || hasMore;
 
     return Container(
       padding: const EdgeInsets.all(16),
@@ -596,7 +599,7 @@ class _InvoicesScreenState extends ConsumerState<InvoicesScreen> {
         mainAxisAlignment: MainAxisAlignment.spaceBetween,
         children: [
           Text(
-            "Showing $startItem to $endItem of $totalItems results",
+            "Showing $startItem to $endItem of $totalItems${hasMore ? "+" : ""} results",
             style: TextStyle(color: Colors.grey[600], fontSize: 14),
           ),
           Row(
@@ -661,11 +664,11 @@ class _InvoicesScreenState extends ConsumerState<InvoicesScreen> {
               ],
               const SizedBox(width: 8),
               IconButton(
-                onPressed: _currentPage < totalPages ? _nextPage : null,
+                onPressed: canGoNext ? _nextPage : null,
                 icon: const Icon(Icons.chevron_right),
                 style: IconButton.styleFrom(
-                  backgroundColor: _currentPage < totalPages ? Colors.white : Colors.grey[100],
-                  foregroundColor: _currentPage < totalPages ? Colors.blue : Colors.grey[400],
+                  backgroundColor: canGoNext ? Colors.white : Colors.grey[100],
+                  foregroundColor: canGoNext ? Colors.blue : Colors.grey[400],
                 ),
               ),
             ],
@@ -683,11 +686,20 @@ class _InvoicesScreenState extends ConsumerState<InvoicesScreen> {
     }
   }
 
-  void _nextPage() {
-    final invoiceState = ref.read(invoiceProvider);
-    final filteredInvoices = _getFilteredInvoices(invoiceState.invoices);
+  Future<void> _nextPage() async {
+    final controller = ref.read(invoiceProvider.notifier);
+    var filteredInvoices = _getFilteredInvoices(ref.read(invoiceProvider).invoices);
+    // Past the loaded rows: fetch API pages until the next page fills or
+    // the server runs out.
+    while (mounted &&
+        _currentPage * _itemsPerPage >= filteredInvoices.length &&
+        ref.read(invoiceProvider).hasMore &&
+        ref.read(invoiceProvider).error == null) {
+      await controller.loadMoreInvoices();
+      filteredInvoices = _getFilteredInvoices(ref.read(invoiceProvider).invoices);
+    }
     final totalPages = (filteredInvoices.length / _itemsPerPage).ceil();
-    if (_currentPage < totalPages) {
+    if (mounted && _currentPage < totalPages) {
       setState(() {
         _currentPage++;
       });
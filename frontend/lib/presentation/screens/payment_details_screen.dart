@@ -30,9 +30,9 @@ class _PaymentDetailsScreenState extends ConsumerState<PaymentDetailsScreen> {
   void initState() {
     super.initState();
     WidgetsBinding.instance.addPostFrameCallback((_) {
-      ref.read(invoiceProvider.notifier).loadInvoices();
-      ref.read(projectProvider.notifier).loadProjects();
-      ref.read(clientProvider.notifier).loadClients();
+      ref.read(invoiceProvider.notifier).loadInvoices(all: true);
+      ref.read(projectProvider.notifier).loadProjects(all: true);
+      ref.read(clientProvider.notifier).loadClients(all: true);
     });
   }
 
@@ -49,9 +49,9 @@ class _PaymentsScreenState extends ConsumerState<PaymentsScreen> {
     WidgetsBinding.instance.addPostFrameCallback((_) {
       if (!_loadedOnce) {
         ref.read(paymentProvider.notifier).loadPayments();
-        ref.read(invoiceProvider.notifier).loadInvoices();
-        ref.read(projectProvider.notifier).loadProjects();
-        ref.read(clientProvider.notifier).loadClients();
+        ref.read(invoiceProvider.notifier).loadInvoices(all: true);
+        ref.read(projectProvider.notifier).loadProjects(all: true);
+        ref.read(clientProvider.notifier).loadClients(all: true);
         _loadedOnce = true;
       }
     });
@@ -214,7 +214,7 @@ class _PaymentsScreenState extends ConsumerState<PaymentsScreen> {
                 : _buildPaymentsList(paginatedPayments),
           ),
           // Pagination
-          if (filteredPayments.length > _itemsPerPage)
+          if (filteredPayments.length > _itemsPerPage || state.hasMore)
             _buildPagination(filteredPayments.length),
         ],
       ),
@@ -652,6 +652,9 @@ class _PaymentsScreenState extends ConsumerState<PaymentsScreen> {
     final totalPages = (totalItems / _itemsPerPage).ceil();
     final startItem = (_currentPage - 1) * _itemsPerPage + 1;
     final endItem = (_currentPage * _itemsPerPage).clamp(0, totalItems);
+    // More rows on the server: the next arrow fetches them.
+    final hasMore = ref.watch(paymentProvider).hasMore;
+    final canGoNext = _currentPage < totalPages || hasMore;
 
     return Container(
       padding: const EdgeInsets.all(16),
@@ -665,7 +668,7 @@ class _PaymentsScreenState extends ConsumerState<PaymentsScreen> {
         mainAxisAlignment: MainAxisAlignment.spaceBetween,
         children: [
           Text(
-            "Showing $startItem to $endItem of $totalItems results",
+            "Showing $startItem to $endItem of $totalItems${hasMore ? "+" : ""} results",
             style: TextStyle(color: Colors.grey[600], fontSize: 14),
           ),
           Row(
@@ -685,11 +688,11 @@ class _PaymentsScreenState extends ConsumerState<PaymentsScreen> {
               ),
               const SizedBox(width: 8),
               IconButton(
-                onPressed: _currentPage < totalPages ? _nextPage : null,
+                onPressed: canGoNext ? _nextPage : null,
                 icon: const Icon(Icons.chevron_right),
                 style: IconButton.styleFrom(
-                  backgroundColor: _currentPage < totalPages ? Colors.white : Colors.grey[100],
-                  foregroundColor: _currentPage < totalPages ? Colors.blue : Colors.grey[400],
+                  backgroundColor: canGoNext ? Colors.white : Colors.grey[100],
+                  foregroundColor: canGoNext ? Colors.blue : Colors.grey[400],
                 ),
               ),
             ],
@@ -707,11 +710,20 @@ class _PaymentsScreenState extends ConsumerState<PaymentsScreen> {
     }
   }
 
-  void _nextPage() {
-    final paymentState = ref.read(paymentProvider);
-    final filteredPayments = _getFilteredPayments(paymentState.payments);
+  Future<void> _nextPage() async {
+    final controller = ref.read(paymentProvider.notifier);
+    var filteredPayments = _getFilteredPayments(ref.read(paymentProvider).payments);
+    // Past the loaded rows: fetch API pages until the next page fills or
+    // the server runs out.
+    while (mounted &&
+        _currentPage * _itemsPerPage >= filteredPayments.length &&
+        ref.read(paymentProvider).hasMore &&
+        ref.read(paymentProvider).error == null) {
+      await controller.loadMorePayments();
+      filteredPayments = _getFilteredPayments(ref.read(paymentProvider).payments);
+    }
     final totalPages = (filteredPayments.length / _itemsPerPage).ceil();
-    if (_currentPage < totalPages) {
+    if (mounted && _currentPage < totalPages) {
       setState(() {
         _currentPage++;
       });
@@ -945,10 +957,10 @@ class _PaymentFormDialogState extends ConsumerState<PaymentFormDialog> {
   void initState() {
     super.initState();
     WidgetsBinding.instance.addPostFrameCallback((_) {
-      ref.read(companyProvider.notifier).loadCompanies();
-      ref.read(clientProvider.notifier).loadClients();
-      ref.read(projectProvider.notifier).loadProjects();
-      ref.read(invoiceProvider.notifier).loadInvoices();
+      ref.read(companyProvider.notifier).loadCompanies(all: true);
+      ref.read(clientProvider.notifier).loadClients(all: true);
+      ref.read(projectProvider.notifier).loadProjects(all: true);
+      ref.read(invoiceProvider.notifier).loadInvoices(all: true);
     });
     
     if (widget.payment != null) {
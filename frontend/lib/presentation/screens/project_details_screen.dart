@@ -30,8 +30,8 @@ class _ProjectDetailsScreenState extends ConsumerState<ProjectDetailsScreen> {
   void initState() {
     super.initState();
     WidgetsBinding.instance.addPostFrameCallback((_) {
-      ref.read(companyProvider.notifier).loadCompanies();
-      ref.read(clientProvider.notifier).loadClients();
+      ref.read(companyProvider.notifier).loadCompanies(all: true);
+      ref.read(clientProvider.notifier).loadClients(all: true);
       ref.read(invoiceProvider.notifier).loadInvoicesByProject(widget.project.id);
     });
   }
@@ -30,8 +30,8 @@ class _ProjectsScreenState extends ConsumerState<ProjectsScreen> {
     WidgetsBinding.instance.addPostFrameCallback((_) {
       if (!_loadedOnce) {
         ref.read(projectProvider.notifier).loadProjects();
-        ref.read(companyProvider.notifier).loadCompanies();
-        ref.read(clientProvider.notifier).loadClients();
+        ref.read(companyProvider.notifier).loadCompanies(all: true);
+        ref.read(clientProvider.notifier).loadClients(all: true);
         _loadedOnce = true;
       }
     });
@@ -153,7 +153,7 @@ class _ProjectsScreenState extends ConsumerState<ProjectsScreen> {
                 : _buildProjectsList(paginatedProjects),
           ),
           // Pagination
-          if (filteredProjects.length > _itemsPerPage)
+          if (filteredProjects.length > _itemsPerPage || state.hasMore)
             _buildPagination(filteredProjects.length),
         ],
       ),
@@ -386,6 +386,9 @@ class _ProjectsScreenState extends ConsumerState<ProjectsScreen> {
     final totalPages = (totalItems / _itemsPerPage).ceil();
     final startItem = (_currentPage - 1) * _itemsPerPage + 1;
     final endItem = (_currentPage * _itemsPerPage).clamp(0, totalItems);
+    // More rows on the server: the next arrow fetches them.
+    final hasMore = ref.watch(projectProvider).hasMore;
+    final canGoNext = _currentPage < totalPages || hasMore;
 
     return Container(
       padding: const EdgeInsets.all(16),
@@ -399,7 +402,7 @@ class _ProjectsScreenState extends ConsumerState<ProjectsScreen> {
         mainAxisAlignment: MainAxisAlignment.spaceBetween,
         children: [
           Text(
-            "Showing $startItem to $endItem of $totalItems results",
+            "Showing $startItem to $endItem of $totalItems${hasMore ? "+" : ""} results",
             style: TextStyle(color: Colors.grey[600], fontSize: 14),
           ),
           Row(
@@ -464,11 +467,11 @@ class _ProjectsScreenState extends ConsumerState<ProjectsScreen> {
               ],
               const SizedBox(width: 8),
               IconButton(
-                onPressed: _currentPage < totalPages ? _nextPage : null,
+                onPressed: canGoNext ? _nextPage : null,
                 icon: const Icon(Icons.chevron_right),
                 style: IconButton.styleFrom(
-                  backgroundColor: _currentPage < totalPages ? Colors.white : Colors.grey[100],
-                  foregroundColor: _currentPage < totalPages ? Colors.blue : Colors.grey[400],
+                  backgroundColor: canGoNext ? Colors.white : Colors.grey[100],
+                  foregroundColor: canGoNext ? Colors.blue : Colors.grey[400],
                 ),
               ),
             ],
@@ -486,9 +489,20 @@ class _ProjectsScreenState extends ConsumerState<ProjectsScreen> {
     }
   }
 
-  void _nextPage() {
-    final totalPages = (_getFilteredProjects(ref.read(projectProvider).projects).length / _itemsPerPage).ceil();
-    if (_currentPage < totalPages) {
+  Future<void> _nextPage() async {
+    final controller = ref.read(projectProvider.notifier);
+    var filteredProjects = _getFilteredProjects(ref.read(projectProvider).projects);
+    // Past the loaded rows: fetch API pages until the next page fills or
+    // the server runs out.
+    while (mounted &&
+        _currentPage * _itemsPerPage >= filteredProjects.length &&
+        ref.read(projectProvider).hasMore &&
+        ref.read(projectProvider).error == null) {
+      await controller.loadMoreProjects();
+      filteredProjects = _getFilteredProjects(ref.read(projectProvider).projects);
+    }
+    final totalPages = (filteredProjects.length / _itemsPerPage).ceil();
+    if (mounted && _currentPage < totalPages) {
       setState(() {
         _currentPage++;
       });